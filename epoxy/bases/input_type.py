@@ -1,22 +1,34 @@
 class InputTypeBase(object):
+    # Subclasses get a `__dict__` unless they have slots too, see `_slots`.
+    __slots__ = ()
     T = None
     _field_attr_map = None
+    # Converts the values of the fields whose type is (a list of) input types into their classes, by field attr name.
+    _field_converters = None
+    # Whether instances store their fields in `__slots__` rather than a `__dict__`.
+    _slots = False
 
     def __init__(self, arg_value=None):
         if arg_value is None:
             return
 
         if self._field_attr_map is None:
-            raise RuntimeError("You cannot construct type {} until it is used in a created Schema.".format(
-                self.T
-            ))
+            # The types of a registry whose schema came out of a cache build their field maps when first constructed.
+            if self._registry._rehydrated_schema is None:
+                raise RuntimeError("You cannot construct type {} until it is used in a created Schema.".format(
+                    self.T
+                ))
 
+            self.T.get_fields()
+
+        converters = self._field_converters
         for attr_name, (field_name, field) in self._field_attr_map.items():
-            if field_name in arg_value:
-                setattr(self, attr_name, arg_value[field_name])
+            value = arg_value[field_name] if field_name in arg_value else field.default_value
+            convert = converters.get(attr_name)
+            if convert is not None and value is not None:
+                value = convert(value)
 
-            else:
-                setattr(self, attr_name, field.default_value)
+            setattr(self, attr_name, value)
 
     def __repr__(self):
         if self._field_attr_map is None:
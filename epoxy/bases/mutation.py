@@ -1,3 +1,10 @@
 class MutationBase(object):
     def __init__(self):
         pass
+
+    def execute_many(self, obj, inputs, info):
+        """
+        Executes the mutation for each of `inputs`, for the bulk variant of mutations declared with `bulk = True`, and
+        returns their outputs in the same order. Override it to execute them all at once.
+        """
+        return [self.execute(obj, input, info) for input in inputs]
@@ -1,6 +1,15 @@
 class ObjectTypeBase(object):
+    # Subclasses get a `__dict__` unless they have slots too, see `_slots`.
+    __slots__ = ()
     T = None
     _field_attr_map = None
+    # How fields without a resolver read their value off of the source object. Either `None` (getattr, calling the
+    # value if it's callable), 'attribute' (getattr only), 'key' (source.get(...), for dict-like sources) or
+    # 'method' (always call the attribute).
+    _field_source = None
+    # Whether instances store their fields in `__slots__` rather than a `__dict__`, which makes them smaller and faster
+    # to create, but unable to hold any other attribute. The interfaces of the type must be defined before it.
+    _slots = False
 
     def __init__(self, **kwargs):
         field_map_init = kwargs.pop('__field_map_init', False)
@@ -8,9 +17,13 @@ class ObjectTypeBase(object):
             return
 
         if self._field_attr_map is None:
-            raise RuntimeError("You cannot construct type {} until it is used in a created Schema.".format(
-                self.T
-            ))
+            # The types of a registry whose schema came out of a cache build their field maps when first constructed.
+            if self._registry._rehydrated_schema is None:
+                raise RuntimeError("You cannot construct type {} until it is used in a created Schema.".format(
+                    self.T
+                ))
+
+            self.T.get_fields()
 
         # Todo: Maybe some type checking? Probably not tho.
         for field_name in self._field_attr_map.keys():
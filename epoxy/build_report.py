@@ -0,0 +1,55 @@
+"""
+Command line entry point that dumps the build report of a registry, see `epoxy.profiler`.
+"""
+from __future__ import print_function
+
+import argparse
+import importlib
+import json
+import os
+import sys
+from .profiler import PROFILE_ENV_VAR
+
+
+def load_registry(path):
+    module_name, _, attr = path.partition(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, attr or 'R')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m epoxy.build_report',
+        description='Reports where a TypeRegistry spends its time while building a schema.'
+    )
+    parser.add_argument('registry', help='The registry to profile, as "module.path:attribute" (defaults to "R").')
+    parser.add_argument('--query', help='Name of the query type to build a schema from.')
+    parser.add_argument('--mutation', help='Name of the mutation type to build a schema from.')
+    parser.add_argument('--subscription', help='Name of the subscription type to build a schema from.')
+    parser.add_argument('--limit', type=int, default=None, help='Only show the N most expensive entries.')
+    parser.add_argument('--json', action='store_true', help='Dump the report as JSON.')
+    args = parser.parse_args(argv)
+
+    # The registry has to be created with profiling enabled, so this needs to happen before its module is imported.
+    os.environ[PROFILE_ENV_VAR] = '1'
+    registry = load_registry(args.registry)
+    if registry.profiler is None:
+        parser.error('{} was created before profiling could be enabled.'.format(args.registry))
+
+    if args.query:
+        registry.Schema(args.query, args.mutation, args.subscription)
+
+    if args.json:
+        json.dump({
+            'records': registry.profiler.report(),
+            'phases': registry.profiler.totals_by_phase(),
+            'types': registry.profiler.totals_by_type(),
+        }, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+    else:
+        print(registry.profiler.format_report(args.limit))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+The asyncio counterpart of `NodeLoader`, for data sources whose fetches are coroutines (Python 3.5 and up only).
+
+Loads made during the same turn of the event loop are fetched together once it is over, so nothing beyond graphql-core's
+`AsyncioExecutionMiddleware` is needed for batching, and the batches of different types are fetched concurrently:
+
+    executor = Executor([AsyncioExecutionMiddleware()])
+    result = loop.run_until_complete(executor.execute(schema, query))
+"""
+import asyncio
+from .loader import NodeLoader
+
+_get_running_loop = getattr(asyncio, 'get_running_loop', None)
+
+
+def current_loop():
+    """
+    Returns the running event loop. graphql-core starts executing a query before its loop runs, so when none is running
+    yet, this is the loop its own futures are bound to.
+    """
+    if _get_running_loop is not None:
+        try:
+            return _get_running_loop()
+
+        except RuntimeError:
+            pass
+
+    return asyncio.get_event_loop()
+
+
+class AsyncNodeLoader(NodeLoader):
+    """
+    Like `NodeLoader`, but `batch_load_fn` is a coroutine function, and `load` and `load_many` return futures.
+    """
+
+    def __init__(self, batch_load_fn, max_batch_size=None, loop=None):
+        super(AsyncNodeLoader, self).__init__(batch_load_fn, max_batch_size)
+        self._loop = loop or current_loop()
+        self._pending = []
+
+    def load(self, key):
+        future = self._results.get(key)
+        if future is None:
+            future = self._results[key] = self._loop.create_future()
+            if not self._pending:
+                self._loop.call_soon(self.dispatch)
+
+            # The future is kept along with its key, as the key may be cleared before its batch is dispatched.
+            self._pending.append((key, future))
+
+        return future
+
+    def load_many(self, keys):
+        futures = [self.load(key) for key in keys]
+        if not futures:
+            future = self._loop.create_future()
+            future.set_result([])
+            return future
+
+        return asyncio.gather(*futures)
+
+    def prime(self, key, value):
+        if key not in self._results:
+            future = self._results[key] = self._loop.create_future()
+            future.set_result(value)
+
+    def dispatch(self):
+        entries = self._pending
+        self._pending = []
+
+        for batch in self._batches(entries):
+            self._loop.create_task(self._fetch(batch))
+
+    async def _fetch(self, entries):
+        keys = [key for key, future in entries]
+        try:
+            values = list(await self.batch_load_fn(keys))
+            if len(values) != len(keys):
+                raise ValueError('The batch load function returned {} values for {} keys.'.format(
+                    len(values), len(keys)
+                ))
+
+        except Exception as e:
+            for key, future in entries:
+                # Failed keys are forgotten, so that loading them again tries again, as with `NodeLoader`.
+                if self._results.get(key) is future:
+                    del self._results[key]
+
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for (key, future), value in zip(entries, values):
+            if not future.done():
+                future.set_result(value)
@@ -0,0 +1,272 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from .sorted_collection import SortedCollection
+
+
+class BlockedSortedCollection(SortedCollection):
+    """
+    A `SortedCollection` that keeps its keys and items in blocks of up to `2 * load` entries, along with the largest key
+    of each block. Inserting and removing only shifts entries within one block, and bisecting looks at the block maxes
+    and then one block, so neither slows down as the collection grows the way flat lists do.
+
+    Positional access (indexing, slicing, `bisect_*` results) goes through the start offset of each block, which is
+    rebuilt the first time it is needed after the collection changes.
+
+    `copy` is cheap: the copy shares its blocks with the original, and either of them copies a block the first time it
+    changes it.
+    """
+
+    def __init__(self, key=None, load=1000, key_type=None, cursor_factory=None):
+        assert load > 1, 'load must be greater than 1.'
+        super(BlockedSortedCollection, self).__init__(key=key, key_type=key_type, cursor_factory=cursor_factory)
+        self._load = load
+        self.clear()
+
+    def clear(self):
+        self._key_blocks = []
+        self._item_blocks = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+        # The ids of the key blocks this collection may change in place, or None if it owns all of them.
+        self._owned = None
+
+    def copy(self):
+        copied = self.__class__(key=self._given_key, load=self._load, key_type=self._key_type,
+                                cursor_factory=self._cursor_factory)
+        copied._key_typecode = self._key_typecode
+        copied._key_blocks = self._key_blocks[:]
+        copied._item_blocks = self._item_blocks[:]
+        copied._maxes = self._maxes[:]
+        copied._len = self._len
+        self._owned = set()
+        copied._owned = set()
+        return copied
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            begin, end, step = i.indices(self._len)
+            if step == 1:
+                return self.slice(begin, end)
+
+            return list(self)[i]
+
+        b, j = self._locate(i)
+        return self._item_blocks[b][j]
+
+    def __iter__(self):
+        return chain.from_iterable(self._item_blocks)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(items) for items in reversed(self._item_blocks))
+
+    def __reduce__(self):
+        return self.__class__, (self._given_key, self._load, self._key_type, self._cursor_factory), None, iter(self)
+
+    def __contains__(self, item):
+        return self._find(item) is not None
+
+    def index(self, item):
+        """Find the position of an item.  Raise ValueError if not found.'"""
+        found = self._find(item)
+        if found is None:
+            raise ValueError('{!r} is not in the collection.'.format(item))
+
+        b, j = found
+        return self._offset(b) + j
+
+    def count(self, item):
+        """Return number of occurrences of item'"""
+        return 0 if self._find(item) is None else 1
+
+    def insert(self, item):
+        """Insert a new item.  If equal keys are found, add to the left'"""
+        k = self._key(item)
+        self._check_key(k)
+        maxes = self._maxes
+
+        if not maxes:
+            self._key_blocks.append(self._make_keys((k,)))
+            self._item_blocks.append([item])
+            maxes.append(k)
+
+        else:
+            b = bisect_left(maxes, k)
+            if b == len(maxes):
+                # Larger than anything in the collection, so it goes at the end of the last block.
+                b -= 1
+                keys = self._key_blocks[b]
+                j = len(keys)
+
+            else:
+                keys = self._key_blocks[b]
+                j = bisect_left(keys, k)
+                if keys[j] == k:
+                    raise ValueError(u'An item with the same key {} already exists in this collection.'.format(k))
+
+            keys = self._own(b)
+            keys.insert(j, k)
+            self._item_blocks[b].insert(j, item)
+            maxes[b] = keys[-1]
+
+            if len(keys) > 2 * self._load:
+                self._split(b)
+
+        self._len += 1
+        self._offsets = None
+
+    def remove(self, item):
+        """Remove first occurrence of item.  Raise ValueError if not found'"""
+        found = self._find(item)
+        if found is None:
+            raise ValueError('{!r} is not in the collection.'.format(item))
+
+        b, j = found
+        keys = self._own(b)
+        del keys[j]
+        del self._item_blocks[b][j]
+
+        if not keys:
+            del self._key_blocks[b]
+            del self._item_blocks[b]
+            del self._maxes[b]
+
+        else:
+            self._maxes[b] = keys[-1]
+            if len(keys) < self._load // 2 and len(self._key_blocks) > 1:
+                self._merge(b)
+
+        self._len -= 1
+        self._offsets = None
+
+    def bisect_left(self, k):
+        b = bisect_left(self._maxes, k)
+        if b == len(self._maxes):
+            return self._len
+
+        return self._offset(b) + bisect_left(self._key_blocks[b], k)
+
+    def bisect_right(self, k):
+        b = bisect_right(self._maxes, k)
+        if b == len(self._maxes):
+            return self._len
+
+        return self._offset(b) + bisect_right(self._key_blocks[b], k)
+
+    def key_at(self, i):
+        b, j = self._locate(i)
+        return self._key_blocks[b][j]
+
+    def slice(self, begin, end):
+        if begin >= end:
+            return []
+
+        b, j = self._locate(begin)
+        end_b, end_j = self._locate(end - 1)
+        if b == end_b:
+            return self._item_blocks[b][j:end_j + 1]
+
+        sliced = self._item_blocks[b][j:]
+        for items in self._item_blocks[b + 1:end_b]:
+            sliced.extend(items)
+
+        sliced.extend(self._item_blocks[end_b][:end_j + 1])
+        return sliced
+
+    def _find(self, item):
+        k = self._key(item)
+        b = bisect_left(self._maxes, k)
+        if b == len(self._maxes):
+            return None
+
+        keys = self._key_blocks[b]
+        j = bisect_left(keys, k)
+        if keys[j] != k or self._item_blocks[b][j] != item:
+            return None
+
+        return b, j
+
+    def _own(self, b):
+        """
+        Makes sure that block `b` isn't shared with a copy before it gets changed, and returns its keys.
+        """
+        keys = self._key_blocks[b]
+        owned = self._owned
+        if owned is None or id(keys) in owned:
+            return keys
+
+        keys = self._key_blocks[b] = keys[:]
+        self._item_blocks[b] = self._item_blocks[b][:]
+        owned.add(id(keys))
+        return keys
+
+    def _rebuild(self, keys, items):
+        load = self._load
+        self._key_blocks = [self._make_keys(keys[i:i + load]) for i in range(0, len(keys), load)]
+        self._item_blocks = [items[i:i + load] for i in range(0, len(items), load)]
+        self._maxes = [keys[-1] for keys in self._key_blocks]
+        self._len = len(items)
+        self._offsets = None
+        self._owned = None
+
+    def _convert_keys(self):
+        self._key_blocks = [self._make_keys(keys) for keys in self._key_blocks]
+
+    def _offset(self, b):
+        return self._get_offsets()[b]
+
+    def _get_offsets(self):
+        offsets = self._offsets
+        if offsets is None:
+            # Built on the side and then assigned, so that concurrent readers never see a partial list.
+            offsets = []
+            offset = 0
+            for keys in self._key_blocks:
+                offsets.append(offset)
+                offset += len(keys)
+
+            self._offsets = offsets
+
+        return offsets
+
+    def _locate(self, i):
+        if i < 0:
+            i += self._len
+
+        if not 0 <= i < self._len:
+            raise IndexError('Collection index out of range.')
+
+        offsets = self._get_offsets()
+        b = bisect_right(offsets, i) - 1
+        return b, i - offsets[b]
+
+    def _split(self, b):
+        load = self._load
+        keys, items = self._key_blocks[b], self._item_blocks[b]
+        self._key_blocks.insert(b + 1, keys[load:])
+        self._item_blocks.insert(b + 1, items[load:])
+        if self._owned is not None:
+            self._owned.add(id(self._key_blocks[b + 1]))
+
+        del keys[load:]
+        del items[load:]
+        self._maxes[b] = keys[-1]
+        self._maxes.insert(b + 1, self._key_blocks[b + 1][-1])
+
+    def _merge(self, b):
+        # Fold the block into its previous neighbour (or the next one, for the first block), splitting again if the
+        # result ends up too large.
+        if b == 0:
+            b = 1
+
+        self._own(b - 1)
+        self._key_blocks[b - 1].extend(self._key_blocks.pop(b))
+        self._item_blocks[b - 1].extend(self._item_blocks.pop(b))
+        del self._maxes[b - 1]
+        self._maxes[b - 1] = self._key_blocks[b - 1][-1]
+
+        if len(self._key_blocks[b - 1]) > 2 * self._load:
+            self._split(b - 1)
@@ -1,27 +1,264 @@
-from ..utils import base64, unbase64
+"""
+Cursors are a prefix and a value written out as text, base64 encoded. What the values are, and how they are written out
+and read back, is up to the `CursorType` of the factory: `IntCursorType` (the default), `StringCursorType`,
+`TupleCursorType` for composite keys, or `KeyCursorType` for keys of any sortable type.
+
+Anything that isn't a valid cursor reads back as `None`. Reading is on the path of every paged query, so it sticks to
+cheap checks: no regular expressions for the base64 and the digits of the common int cursors.
+"""
+from binascii import a2b_base64, a2b_hex, b2a_base64, b2a_hex
+from datetime import date, datetime
+import re
+import six
+from six import text_type
+from ....utils.lru_cache import LRUCache
+
+_length_re = re.compile(r'[0-9]+')
+_float_re = re.compile(r'^-?(?:inf|nan|[0-9]+(?:\.[0-9]+)?(?:e[-+][0-9]+)?)\Z')
+_hex_re = re.compile(r'^(?:[0-9a-f]{2})*\Z')
+_date_re = re.compile(r'^([0-9]{4})([0-9]{2})([0-9]{2})\Z')
+_datetime_re = re.compile(r'^([0-9]{4})([0-9]{2})([0-9]{2})([0-9]{2})([0-9]{2})([0-9]{2})([0-9]{6})\Z')
+
+
+def _join_length_prefixed(texts):
+    return u''.join(u'{}:{}'.format(len(text), text) for text in texts)
+
+
+def _split_length_prefixed(text):
+    """
+    Splits what `_join_length_prefixed` joined back up, or returns `None` if `text` isn't made of length prefixed parts.
+    """
+    texts = []
+    i = 0
+    while i < len(text):
+        length = _length_re.match(text, i)
+        if length is None or text[length.end():length.end() + 1] != u':':
+            return None
+
+        i = length.end() + 1
+        end = i + int(length.group())
+        if end > len(text):
+            return None
+
+        texts.append(text[i:end])
+        i = end
+
+    return texts
+
+
+class CursorType(object):
+    """
+    Writes the values of cursors out as text, and reads them back.
+    """
+
+    def dump(self, value):
+        raise NotImplementedError('dump must be implemented in the subclass')
+
+    def load(self, text):
+        """
+        Returns the value written out in `text`, or `None` if it isn't a valid one.
+        """
+        raise NotImplementedError('load must be implemented in the subclass')
+
+
+class IntCursorType(CursorType):
+    def __init__(self, max_length=20):
+        # Longer numbers are turned down, so that parsing a cursor stays cheap whatever the client sends.
+        self.max_length = max_length
+
+    dump = staticmethod(text_type)
+
+    def load(self, text):
+        if len(text) > self.max_length:
+            return None
+
+        # int() also takes whitespace, signs and underscores, so make sure there are only digits after an optional minus.
+        if not text.isdecimal() and not (text[:1] == u'-' and text[1:].isdecimal()):
+            return None
+
+        return int(text)
+
+
+class StringCursorType(CursorType):
+    def dump(self, value):
+        return value
+
+    def load(self, text):
+        return text
+
+
+class TupleCursorType(CursorType):
+    """
+    Cursors for tuples of values, each written out by the matching type in `types` and prefixed by its length.
+    """
+
+    def __init__(self, *types):
+        self.types = types
+
+    def dump(self, value):
+        assert len(value) == len(self.types), 'Expected a tuple of {} values.'.format(len(self.types))
+        return _join_length_prefixed([cursor_type.dump(item) for cursor_type, item in zip(self.types, value)])
+
+    def load(self, text):
+        texts = _split_length_prefixed(text)
+        if texts is None or len(texts) != len(self.types):
+            return None
+
+        values = tuple(cursor_type.load(text) for cursor_type, text in zip(self.types, texts))
+        return None if None in values else values
+
+
+class KeyCursorType(CursorType):
+    """
+    Cursors for keys of any of the sortable types keys usually are: ints (written out as digits, like `IntCursorType`
+    does), floats, strings, bytes, bools, dates, naive datetimes, and tuples of any of those. Every other type is written
+    out with a tag in front, so keys come back with the exact type and value they went in with.
+
+    Keys of any other type, like UUIDs, are written out as opaque text that reads back as `None`, so paging from their
+    cursors starts over, as it did before cursors held keys.
+    """
+
+    def __init__(self, max_int_length=100):
+        self._int_type = IntCursorType(max_int_length)
+        self._max_int_length = max_int_length
+
+    def dump(self, value):
+        value_type = type(value)
+        if value_type in six.integer_types:
+            return text_type(value)
+
+        if value_type is float:
+            return u'f' + repr(value)
+
+        if value_type is text_type:
+            return u's' + value
+
+        if value_type is bytes:
+            return u'y' + b2a_hex(value).decode('ascii')
+
+        if value_type is bool:
+            return u'b1' if value else u'b0'
+
+        if value_type is tuple:
+            return u't' + _join_length_prefixed([self.dump(item) for item in value])
+
+        if value_type is datetime and value.tzinfo is None:
+            return u'd{:04d}{:02d}{:02d}{:02d}{:02d}{:02d}{:06d}'.format(
+                value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond
+            )
+
+        if value_type is date:
+            return u'D{:04d}{:02d}{:02d}'.format(value.year, value.month, value.day)
+
+        return u'o' + text_type(value)
+
+    def load(self, text):
+        # Non negative ints, by far the most common keys, are read right away.
+        if text.isdecimal() and len(text) <= self._max_int_length:
+            return int(text)
+
+        tag, rest = text[:1], text[1:]
+        if tag == u'f':
+            return float(rest) if _float_re.match(rest) else None
+
+        if tag == u's':
+            return rest
+
+        if tag == u'y':
+            return a2b_hex(rest.encode('ascii')) if _hex_re.match(rest) else None
+
+        if tag == u'b':
+            return {u'0': False, u'1': True}.get(rest)
+
+        if tag == u't':
+            texts = _split_length_prefixed(rest)
+            if texts is None:
+                return None
+
+            values = tuple(self.load(text) for text in texts)
+            return None if None in values else values
+
+        if tag == u'd':
+            return self._load_date(datetime, _datetime_re.match(rest))
+
+        if tag == u'D':
+            return self._load_date(date, _date_re.match(rest))
+
+        if tag == u'o':
+            return None
+
+        return self._int_type.load(text)
+
+    @staticmethod
+    def _load_date(date_type, match):
+        if match is None:
+            return None
+
+        try:
+            return date_type(*(int(part) for part in match.groups()))
+
+        except ValueError:
+            # The digits are there, but they don't make a valid date, like a 13th month.
+            return None
+
+
+def _typed_key(value):
+    """
+    Pairs `value` with its type, and the items of tuples with theirs, so that equal offsets of different types (like
+    1, 1.0 and True), whose cursors differ, are cached apart.
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return value_type, tuple(_typed_key(item) for item in value)
+
+    return value_type, value
 
 
 class CursorFactory(object):
-    def __init__(self, prefix):
+    def __init__(self, prefix, cursor_type=None, cache_size=0):
+        """
+        Pass `cache_size` to remember up to that many of the cursors made and read most recently. Making and reading a
+        cursor costs about as much as a cache lookup that misses, so that only pays off for cursor types that are slow
+        to write out and read back, when the same pages are requested over and over.
+        """
         self.prefix = prefix
-        self.cursor_type = int
-        self.max_cursor_length = 10
+        self.cursor_type = cursor_type or IntCursorType()
+        self._prefix_bytes = prefix.encode('utf-8')
+        self._prefix_length = len(self._prefix_bytes)
+        self._dump = self.cursor_type.dump
+        self._load = self.cursor_type.load
+        self._encoded = LRUCache(cache_size) if cache_size else None
+        self._decoded = LRUCache(cache_size) if cache_size else None
 
     def from_offset(self, offset):
         """
         Creates the cursor string from an offset.
         """
-        return base64(self.prefix + str(offset))
+        cache = self._encoded
+        if cache is None:
+            return self._encode(offset)
+
+        key = _typed_key(offset)
+        cursor = cache.get(key)
+        if cursor is None:
+            cursor = self._encode(offset)
+            cache.set(key, cursor)
+
+        return cursor
 
     def to_offset(self, cursor):
         """
-        Rederives the offset from the cursor string.
+        Rederives the offset from the cursor string, or returns `None` if it isn't a valid cursor.
         """
-        try:
-            return self.cursor_type(unbase64(cursor)[len(self.prefix):len(self.prefix) + self.max_cursor_length])
-        except:
+        cache = self._decoded
+        if cache is None:
+            return self._decode(cursor)
+
+        if not isinstance(cursor, six.string_types):
             return None
 
+        return cache.get_or_create(cursor, self._decode)
+
     def get_offset(self, cursor, default_offset=0):
         """
         Given an optional cursor and a default offset, returns the offset
@@ -32,7 +269,33 @@ class CursorFactory(object):
             return default_offset
 
         offset = self.to_offset(cursor)
+        return default_offset if offset is None else offset
+
+    def _encode(self, offset):
+        # b2a_base64 ends what it returns with a newline.
+        return b2a_base64(self._prefix_bytes + self._dump(offset).encode('utf-8'))[:-1].decode('ascii')
+
+    def _decode(self, cursor):
         try:
-            return self.cursor_type(offset)
-        except:
-            return default_offset
+            # Base64 comes in groups of four characters.
+            if len(cursor) % 4:
+                return None
+
+            decoded = a2b_base64(cursor)
+
+        except (TypeError, ValueError):
+            # Cursors that aren't strings are TypeErrors, and binascii.Error is a ValueError, as is non ASCII text on
+            # Python 3. Like the base64 module, a2b_base64 skips characters outside of the base64 alphabet rather than
+            # turning them down.
+            return None
+
+        if not decoded.startswith(self._prefix_bytes):
+            return None
+
+        try:
+            text = decoded[self._prefix_length:].decode('utf-8')
+
+        except UnicodeDecodeError:
+            return None
+
+        return self._load(text)
@@ -0,0 +1,30 @@
+class LazyEdgeList(object):
+    """
+    The edges of a connection page, built out of its nodes with `make_edge` the first time they are iterated over or
+    indexed, so that queries that don't select `edges` never build them.
+    """
+    __slots__ = '_nodes', '_make_edge', '_edges'
+
+    def __init__(self, nodes, make_edge):
+        self._nodes = nodes
+        self._make_edge = make_edge
+        self._edges = None
+
+    def _get_edges(self):
+        edges = self._edges
+        if edges is None:
+            edges = self._edges = [self._make_edge(node) for node in self._nodes]
+
+        return edges
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._get_edges())
+
+    def __getitem__(self, i):
+        return self._get_edges()[i]
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._get_edges())
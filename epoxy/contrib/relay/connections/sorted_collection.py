@@ -1,25 +1,113 @@
+from array import array
 from bisect import bisect_left, bisect_right
-from .cursor import CursorFactory
+import six
+from ....utils.get_selected_fields import get_selected_fields
+from .cursor import CursorFactory, KeyCursorType
+from .edge_list import LazyEdgeList
 
-cursor = CursorFactory('sc:')
+# Integer keys make the same `sc:<key>` cursors they always have, and keys of other types get tagged ones.
+cursor = CursorFactory('sc:', KeyCursorType())
+
+try:
+    array('q')
+    int_typecode = 'q'
+except ValueError:
+    # Python 2 has no 'q', but its 'l' is 64 bits wide on the platforms we care about.
+    int_typecode = 'l'
+
+# Pass as `key_type` to pick the key storage from the first key that is inserted.
+AUTO_KEY_TYPE = 'auto'
+
+key_typecodes = {int: int_typecode, float: 'd'}
+if six.PY2:
+    key_typecodes[long] = int_typecode  # noqa
+
+int_key_range = -2 ** 63, 2 ** 63
+
+
+def key_fits_typecode(k, typecode):
+    if typecode == 'd':
+        return type(k) is float
+
+    return type(k) in six.integer_types and int_key_range[0] <= k < int_key_range[1]
+
+
+_number_types = six.integer_types + (float, bool)
+
+
+def keys_comparable(a, b):
+    """
+    Tells whether keys `a` and `b` can be compared with each other, so that a key read from a cursor isn't bisected
+    into a collection of keys of another type.
+    """
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return all(keys_comparable(x, y) for x, y in zip(a, b))
+
+    if isinstance(a, _number_types) and isinstance(b, _number_types):
+        return True
+
+    return type(a) is type(b)
 
 
 class SortedCollection(object):
-    def __init__(self, key=None):
+    def __init__(self, key=None, key_type=None, cursor_factory=None):
+        """
+        Keys are stored in a list by default. If every key is an `int` or a `float`, pass it as `key_type` to store
+        them unboxed in an `array`, or pass `AUTO_KEY_TYPE` to decide based on the first key, falling back to a list
+        if a key that doesn't fit the array shows up later.
+
+        Connection cursors hold the key of their item, so that paging seeks straight to it. The default cursors work
+        for keys of the types `KeyCursorType` knows about; pass a `CursorFactory` to use others.
+        """
+        if key_type not in (None, AUTO_KEY_TYPE) and key_type not in key_typecodes:
+            raise ValueError('Unsupported key type {!r}, expected int, float or {!r}.'.format(key_type, AUTO_KEY_TYPE))
+
         self._given_key = key
+        self._cursor_factory = cursor_factory
+        self._cursor = cursor_factory or cursor
         key = (lambda x: x) if key is None else key
-        self._keys = []
+        self._key_type = key_type
+        self._key_typecode = key_typecodes.get(key_type)
+        self._keys = self._make_keys()
         self._items = []
         self._key = key
 
     def clear(self):
-        self._keys = []
+        self._keys = self._make_keys()
         self._items = []
 
+    def _make_keys(self, keys=()):
+        if self._key_typecode is None:
+            return list(keys)
+
+        return array(self._key_typecode, keys)
+
+    def _convert_keys(self):
+        self._keys = self._make_keys(self._keys)
+
+    def _check_key(self, k):
+        """
+        In auto mode, switches the key storage to fit `k` before it is inserted.
+        """
+        if self._key_type != AUTO_KEY_TYPE:
+            return
+
+        typecode = self._key_typecode
+        if typecode is None:
+            if not len(self):
+                self._key_typecode = key_typecodes.get(type(k))
+                self._convert_keys()
+
+        elif not key_fits_typecode(k, typecode):
+            self._key_type = self._key_typecode = None
+            self._convert_keys()
+
     def copy(self):
-        cls = self.__class__(key=self._key)
-        cls._items = self._items[:]
-        cls._keys = self._keys[:]
+        copied = self.__class__(key=self._given_key, key_type=self._key_type, cursor_factory=self._cursor_factory)
+        copied._key_typecode = self._key_typecode
+        copied._items = self._items[:]
+        copied._keys = self._keys[:]
+        return copied
 
     def __len__(self):
         return len(self._items)
@@ -36,12 +124,16 @@ class SortedCollection(object):
     def __repr__(self):
         return '%s(%r, key=%s)' % (
             self.__class__.__name__,
-            self._items,
+            list(self),
             getattr(self._given_key, '__name__', repr(self._given_key))
         )
 
     def __reduce__(self):
-        return self.__class__, (self._items, self._given_key)
+        return self.__class__, (self._given_key, self._key_type, self._cursor_factory), None, iter(self)
+
+    def append(self, item):
+        # Used by pickle to restore the items that `__reduce__` hands it.
+        self.insert(item)
 
     def __contains__(self, item):
         k = self._key(item)
@@ -66,6 +158,7 @@ class SortedCollection(object):
     def insert(self, item):
         """Insert a new item.  If equal keys are found, add to the left'"""
         k = self._key(item)
+        self._check_key(k)
         i = bisect_left(self._keys, k)
         if i != len(self) and self._keys[i] == k:
             raise ValueError(u'An item with the same key {} already exists in this collection.'.format(k))
@@ -73,6 +166,44 @@ class SortedCollection(object):
         self._keys.insert(i, k)
         self._items.insert(i, item)
 
+    def update(self, items):
+        """
+        Inserts many items at once. They are sorted along with the existing ones in a single pass rather than
+        bisected in one by one, and nothing is inserted if any of their keys is already taken.
+        """
+        key = self._key
+        merged = list(self)
+        merged.extend(items)
+        # The existing items are a sorted run already, which the sort takes advantage of.
+        merged.sort(key=key)
+        keys = list(map(key, merged))
+
+        for i in range(1, len(keys)):
+            if keys[i - 1] == keys[i]:
+                raise ValueError(u'An item with the same key {} already exists in this collection.'.format(keys[i]))
+
+        self._rebuild(self._fit_keys(keys), merged)
+
+    def _rebuild(self, keys, items):
+        self._keys = self._make_keys(keys)
+        self._items = items
+
+    def _fit_keys(self, keys):
+        """
+        In auto mode, picks the key storage for a batch of keys that is about to replace the current ones.
+        """
+        if self._key_type == AUTO_KEY_TYPE and keys:
+            typecode = self._key_typecode
+            if typecode is None and not len(self):
+                typecode = key_typecodes.get(type(keys[0]))
+
+            if typecode is not None and not all(key_fits_typecode(k, typecode) for k in keys):
+                self._key_type = typecode = None
+
+            self._key_typecode = typecode
+
+        return keys
+
     def remove(self, item):
         """Remove first occurrence of item.  Raise ValueError if not found'"""
         i = self.index(item)
@@ -85,6 +216,12 @@ class SortedCollection(object):
     def bisect_right(self, k):
         return bisect_right(self._keys, k)
 
+    def key_at(self, i):
+        return self._keys[i]
+
+    def slice(self, begin, end):
+        return self._items[begin:end]
+
     @staticmethod
     def empty_connection(relay, type_name):
         Connection, Edge = relay.get_connection_and_edge_types(type_name)
@@ -96,50 +233,100 @@ class SortedCollection(object):
                 end_cursor=None,
                 has_previous_page=False,
                 has_next_page=False,
-            )
+            ),
+            total_count=0,
+            start_offset=0,
         )
 
     def get_edge(self, relay, type_name, node):
         Connection, Edge = relay.get_connection_and_edge_types(type_name)
-        return Edge(node=node, cursor=cursor.from_offset(self._key(node)))
-
-    def get_connection(self, relay, type_name, args):
-        Connection, Edge = relay.get_connection_and_edge_types(type_name)
-        before = args.get('before')
-        after = args.get('after')
-        first = args.get('first')
-        last = args.get('last')
+        return Edge(node=node, cursor=self._cursor.from_offset(self._key(node)))
 
+    def get_connection(self, relay, type_name, args, info=None):
         count = len(self)
         if not count:
             return self.empty_connection(relay, type_name)
 
-        begin_key = cursor.get_offset(after, None)
-        end_key = cursor.get_offset(before, None)
+        begin_key = self.cursor_key(args.get('after'))
+        end_key = self.cursor_key(args.get('before'))
+
+        # The items after `after` and before `before`, whether or not the items the cursors came from are still here.
+        lower_bound = 0 if begin_key is None else self.bisect_right(begin_key)
+        upper_bound = count if end_key is None else self.bisect_left(end_key)
+
+        return self.get_connection_between(relay, type_name, args, lower_bound, upper_bound, info=info)
+
+    def cursor_key(self, cursor):
+        """
+        Returns the key held by `cursor`, or `None` if there is no cursor, or it isn't a valid cursor for this
+        collection.
+        """
+        if cursor is None or not len(self):
+            return None
 
-        lower_bound = begin = self.bisect_left(begin_key) + 1 if begin_key else 0
-        upper_bound = end = self.bisect_right(end_key) - 1 if end_key else count
+        k = self._cursor.to_offset(cursor)
+        if k is None or not keys_comparable(k, self.key_at(0)):
+            return None
 
-        if upper_bound < count and self._keys[upper_bound] != end_key:
-            upper_bound = end = count
+        return k
+
+    def get_connection_between(self, relay, type_name, args, lower_bound, upper_bound, cursor_key=None,
+                               range_bounds=None, info=None):
+        """
+        Pages through the items between positions `lower_bound` and `upper_bound` according to the `first` and `last`
+        arguments. Edge cursors are made from `cursor_key(item)`, which defaults to the key of the collection.
+
+        `range_bounds` are the positions of the whole connection, before cursors and pagination are applied, and
+        default to the whole collection. `totalCount` and `startOffset` are worked out from them only if they are
+        selected, by the functions the connection holds in `_total_count` and `_start_offset`.
+
+        Edges are built when they are first iterated over. Given the `info` of the connection field, cursors are only
+        encoded if they are selected, and left as `None` otherwise.
+        """
+        Connection, Edge = relay.get_connection_and_edge_types(type_name)
+        first = args.get('first')
+        last = args.get('last')
+        cursor_key = cursor_key or self._key
+
+        begin = lower_bound
+        end = upper_bound
 
         if first is not None:
             end = min(begin + first, end)
         if last is not None:
             begin = max(end - last, begin)
 
-        sliced_data = self._items[begin:end]
+        sliced_data = self.slice(begin, end)
 
-        edges = [Edge(node=node, cursor=cursor.from_offset(self._key(node))) for node in sliced_data]
-        first_edge = edges[0] if edges else None
-        last_edge = edges[-1] if edges else None
+        if info is None:
+            wants_cursors = wants_start_cursor = wants_end_cursor = True
 
-        return Connection(
-            edges=edges,
+        else:
+            selected = get_selected_fields(info)
+            page_info_selected = get_selected_fields(info, selected.get('pageInfo', ()))
+            wants_cursors = 'cursor' in get_selected_fields(info, selected.get('edges', ()))
+            wants_start_cursor = 'startCursor' in page_info_selected
+            wants_end_cursor = 'endCursor' in page_info_selected
+
+        from_offset = self._cursor.from_offset
+
+        def make_cursor(node):
+            return from_offset(cursor_key(node))
+
+        def make_edge(node):
+            return Edge(node=node, cursor=make_cursor(node) if wants_cursors else None)
+
+        range_begin, range_end = range_bounds or (0, None)
+
+        connection = Connection(
+            edges=LazyEdgeList(sliced_data, make_edge),
             page_info=relay.PageInfo(
-                start_cursor=first_edge and first_edge.cursor,
-                end_cursor=last_edge and last_edge.cursor,
+                start_cursor=make_cursor(sliced_data[0]) if sliced_data and wants_start_cursor else None,
+                end_cursor=make_cursor(sliced_data[-1]) if sliced_data and wants_end_cursor else None,
                 has_previous_page=begin > lower_bound,
                 has_next_page=end < upper_bound
-            )
+            ),
         )
+        connection._total_count = lambda: (len(self) if range_end is None else range_end) - range_begin
+        connection._start_offset = lambda: max(begin, range_begin) - range_begin
+        return connection
@@ -0,0 +1,40 @@
+"""
+Data sources whose fetches are coroutines, for backends that would otherwise block the thread a query runs on (Python
+3.5 and up only). Queries using them must be executed with graphql-core's `AsyncioExecutionMiddleware`.
+"""
+import asyncio
+from ..async_loader import AsyncNodeLoader
+from .base import group_ids_by_type, nodes_in_key_order
+
+
+class AsyncBaseDataSource(object):
+    async def fetch_node(self, object_type, id, resolve_info):
+        raise NotImplementedError('Must implement fetch_node to resolve node by ID.')
+
+    async def fetch_nodes(self, object_type, ids, resolve_info):
+        """
+        Fetches the nodes of `object_type` with the given ids, in order, using `None` for the ones that don't exist.
+        By default, `fetch_node` is called for all of them concurrently. As with `BaseDataSource.fetch_nodes`, only
+        the request-scoped parts of `resolve_info` should be relied on.
+        """
+        return await asyncio.gather(*[self.fetch_node(object_type, id, resolve_info) for id in ids])
+
+    async def get_connection(self, relay, object_type, args, resolve_info):
+        raise NotImplementedError('Must implement get_connection so that RelayMixin can automatically create '
+                                  'connection resolvers')
+
+    def create_node_loader(self, resolve_info, max_batch_size=None):
+        async def batch_load(keys):
+            ids_by_type = group_ids_by_type(keys)
+            return nodes_in_key_order(keys, ids_by_type, await asyncio.gather(*[
+                self.fetch_nodes(object_type, object_ids, resolve_info)
+                for object_type, object_ids in ids_by_type.items()
+            ]))
+
+        return AsyncNodeLoader(batch_load, max_batch_size)
+
+    def make_connection_resolver(self, relay, object_type_thunk):
+        def resolver(obj, args, info):
+            return self.get_connection(relay, relay.R[object_type_thunk](), args, info)
+
+        return resolver
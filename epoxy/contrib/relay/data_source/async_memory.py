@@ -0,0 +1,43 @@
+import asyncio
+from .async_base import AsyncBaseDataSource
+from .memory import InMemoryDataSource
+
+
+class AsyncInMemoryDataSource(AsyncBaseDataSource):
+    """
+    An `AsyncBaseDataSource` over an `InMemoryDataSource`, mostly for tests. Every fetch first waits for `latency`
+    seconds, standing in for the round-trip to a real backend.
+    """
+
+    def __init__(self, data_source=None, latency=0):
+        self.data_source = InMemoryDataSource() if data_source is None else data_source
+        self.latency = latency
+
+    def add(self, obj):
+        self.data_source.add(obj)
+
+    def add_many(self, objs):
+        self.data_source.add_many(objs)
+
+    def replace_all(self, objs):
+        self.data_source.replace_all(objs)
+
+    def remove(self, obj):
+        self.data_source.remove(obj)
+
+    async def _round_trip(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def fetch_node(self, object_type, id, resolve_info):
+        await self._round_trip()
+        return self.data_source.fetch_node(object_type, id, resolve_info)
+
+    async def fetch_nodes(self, object_type, ids, resolve_info):
+        await self._round_trip()
+        return self.data_source.fetch_nodes(object_type, ids, resolve_info)
+
+    async def get_connection(self, relay, object_type, args, resolve_info):
+        await self._round_trip()
+        collection = self.data_source.snapshot_for(resolve_info).get_collection(object_type)
+        return collection.get_connection(relay, object_type.name, args, resolve_info)
@@ -1,7 +1,59 @@
+from collections import OrderedDict
+from ..loader import NodeLoader
+
+
+def group_ids_by_type(keys):
+    """
+    Groups `(object_type, id)` keys into a dict of the ids of each type, in the order the types first come up.
+    """
+    ids_by_type = OrderedDict()
+    for object_type, object_id in keys:
+        ids_by_type.setdefault(object_type, []).append(object_id)
+
+    return ids_by_type
+
+
+def nodes_in_key_order(keys, ids_by_type, fetched_by_type):
+    """
+    Puts the nodes fetched for each type of `ids_by_type` (in the same order) back in the order of `keys`.
+    """
+    nodes = {}
+    for (object_type, object_ids), fetched in zip(ids_by_type.items(), fetched_by_type):
+        nodes.update(zip(((object_type, object_id) for object_id in object_ids), fetched))
+
+    return [nodes[key] for key in keys]
+
+
 class BaseDataSource(object):
     def fetch_node(self, object_type, id, resolve_info):
         raise NotImplementedError('Must implement fetch_node to resolve node by ID.')
 
+    def fetch_nodes(self, object_type, ids, resolve_info):
+        """
+        Fetches the nodes of `object_type` with the given ids, in order, using `None` for the ones that don't exist.
+        Data sources that can fetch many nodes in one round-trip should override this.
+
+        The ids of a batch can come from many fields of the request, so `resolve_info` is the one of the first field
+        that loaded a node: only its request-scoped parts (`request_context`, `schema`, `root_value`, ...) should be
+        relied on, not the field-specific ones (`field_name`, `field_asts`, `parent_type`, ...).
+        """
+        return [self.fetch_node(object_type, id, resolve_info) for id in ids]
+
+    def create_node_loader(self, resolve_info, max_batch_size=None):
+        """
+        Creates the loader that batches the node fetches of the request `resolve_info` belongs to. Its keys are
+        `(object_type, id)` tuples, and each batch calls `fetch_nodes` once per type with `resolve_info`, whatever
+        field the ids were loaded for.
+        """
+        def batch_load(keys):
+            ids_by_type = group_ids_by_type(keys)
+            return nodes_in_key_order(keys, ids_by_type, [
+                self.fetch_nodes(object_type, object_ids, resolve_info)
+                for object_type, object_ids in ids_by_type.items()
+            ])
+
+        return NodeLoader(batch_load, max_batch_size)
+
     def make_connection_resolver(self, relay, object_type_thunk):
         raise NotImplementedError('Must implement make_connection_resolver so that RelayMixin can automatically '
                                   'create connection resolvers')
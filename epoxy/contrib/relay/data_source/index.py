@@ -0,0 +1,160 @@
+from six import text_type
+
+from ..connections.sorted_collection import cursor, keys_comparable
+
+
+class _Greatest(object):
+    """
+    Compares greater than anything else, so that `(k, greatest)` sorts after every `(k, id)` entry of an index.
+    """
+
+    def __lt__(self, other):
+        return False
+
+    def __le__(self, other):
+        return self is other
+
+    def __gt__(self, other):
+        return self is not other
+
+    def __ge__(self, other):
+        return True
+
+
+greatest = _Greatest()
+
+
+class InMemoryIndex(object):
+    """
+    Orders the objects of one type by `key(obj)` and then by id, so that the objects with a given key, or with keys in a
+    given range, sit next to each other and can be found by bisecting. Objects whose key is `None` are left out.
+
+    The keys of the objects in an index must not change while they are in it.
+    """
+
+    def __init__(self, key, unique, collection_class):
+        self.key = key
+        self.unique = unique
+        self._collection = collection_class(key=lambda obj: (key(obj), obj.id), key_type=None)
+
+    def copy(self):
+        copied = self.__class__.__new__(self.__class__)
+        copied.key = self.key
+        copied.unique = self.unique
+        copied._collection = self._collection.copy()
+        return copied
+
+    def __len__(self):
+        return len(self._collection)
+
+    def __iter__(self):
+        return iter(self._collection)
+
+    def check(self, objs):
+        """
+        Raises a `ValueError` if adding `objs` to a unique index would give two objects the same key.
+        """
+        if not self.unique:
+            return
+
+        keys = set()
+        for obj in objs:
+            k = self.key(obj)
+            if k is None:
+                continue
+
+            begin, end = self.bounds(k, k)
+            if k in keys or begin != end:
+                raise ValueError(u'An object with the unique key {} already exists.'.format(k))
+
+            keys.add(k)
+
+    def insert(self, obj):
+        if self.key(obj) is not None:
+            self._collection.insert(obj)
+
+    def update(self, objs):
+        key = self.key
+        self._collection.update([obj for obj in objs if key(obj) is not None])
+
+    def remove(self, obj):
+        if self.key(obj) is not None:
+            self._collection.remove(obj)
+
+    def bounds(self, low=None, high=None):
+        """
+        Returns the positions between which the objects whose keys lie between `low` and `high` (inclusive) are. A
+        bound of `None` leaves that end of the range open.
+        """
+        collection = self._collection
+        begin = 0 if low is None else collection.bisect_left((low,))
+        end = len(collection) if high is None else collection.bisect_right((high, greatest))
+        return begin, end
+
+    def find(self, k):
+        """
+        Returns the objects whose key is `k`, in id order.
+        """
+        return self._collection.slice(*self.bounds(k, k))
+
+    def position(self, obj):
+        """
+        Returns the position of `obj` in the index, or `None` if it isn't in it.
+        """
+        if obj is None:
+            return None
+
+        k = self.key(obj)
+        if k is None:
+            return None
+
+        entry = (k, obj.id)
+        collection = self._collection
+        i = collection.bisect_left(entry)
+        if i == len(collection) or collection.key_at(i) != entry:
+            return None
+
+        return i
+
+    def cursor_entry(self, value, objects_by_id):
+        """
+        Returns the `(key, id)` entry to page from given the value of a cursor: either the entry itself, or the id of
+        an object that is still in `objects_by_id`, as cursors of the unfiltered connection hold. Returns `None` for
+        anything else.
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, tuple):
+            collection = self._collection
+            if len(value) != 2 or not len(collection) or not keys_comparable(value, collection.key_at(0)):
+                return None
+
+            return value
+
+        obj = objects_by_id.get(text_type(value))
+        if obj is None:
+            return None
+
+        k = self.key(obj)
+        return None if k is None else (k, obj.id)
+
+    def get_connection(self, relay, type_name, args, bounds, objects_by_id, info=None):
+        """
+        Pages through the objects between the positions in `bounds`. Cursors hold the `(key, id)` entry of their object,
+        so paging carries on from where the cursor was even if its object has been removed since.
+        """
+        collection = self._collection
+        lower_bound, upper_bound = bounds
+        after = self.cursor_entry(cursor.get_offset(args.get('after'), None), objects_by_id)
+        before = self.cursor_entry(cursor.get_offset(args.get('before'), None), objects_by_id)
+
+        if after is not None:
+            lower_bound = max(lower_bound, collection.bisect_right(after))
+
+        if before is not None:
+            upper_bound = min(upper_bound, collection.bisect_left(before))
+
+        return collection.get_connection_between(
+            relay, type_name, args, lower_bound, max(lower_bound, upper_bound), range_bounds=bounds, info=info
+        )
@@ -1,33 +1,356 @@
-from collections import defaultdict
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from operator import attrgetter
+import six
 from six import text_type
 
+from ....utils.copy_on_write_dict import CopyOnWriteDict
+from ..connections.blocked_sorted_collection import BlockedSortedCollection
 from ..connections.sorted_collection import SortedCollection
 from .base import BaseDataSource
+from .index import InMemoryIndex
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+
+class InMemorySnapshot(object):
+    """
+    The objects held by an `InMemoryDataSource`, indexed by type and id, by type in id order, and by the secondary
+    indexes of their type.
+    """
+
+    def __init__(self, create_ids, create_collection, create_indexes):
+        self._create_ids = create_ids
+        self._create_collection = create_collection
+        self._create_indexes = create_indexes
+        # Plain dicts, so that reading a type that has no objects never adds it to a published snapshot.
+        self.objects_by_type_and_id = {}
+        self.objects_by_type = {}
+        self.indexes_by_type = {}
+        # The types whose indexes this snapshot may change in place, or None if it owns all of them.
+        self._owned_types = None
+
+    def copy(self):
+        copied = self.__class__(self._create_ids, self._create_collection, self._create_indexes)
+        copied.objects_by_type_and_id.update(self.objects_by_type_and_id)
+        copied.objects_by_type.update(self.objects_by_type)
+        copied.indexes_by_type.update(self.indexes_by_type)
+        copied._owned_types = set()
+        return copied
+
+    def get_ids(self, object_type):
+        ids = self.objects_by_type_and_id.get(object_type)
+        return {} if ids is None else ids
+
+    def get_collection(self, object_type):
+        collection = self.objects_by_type.get(object_type)
+        return self._create_collection() if collection is None else collection
+
+    def get_index(self, object_type, index_name):
+        indexes = self.indexes_by_type.get(object_type)
+        return None if indexes is None else indexes.get(index_name)
+
+    def writable(self, object_type):
+        """
+        Returns the id index, the collection and the secondary indexes (by name) of `object_type`, copying them first
+        if they are shared with the snapshot this one was copied from.
+        """
+        owned = self._owned_types
+        if owned is not None and object_type not in owned:
+            for index in (self.objects_by_type_and_id, self.objects_by_type):
+                if object_type in index:
+                    index[object_type] = index[object_type].copy()
+
+            indexes = self.indexes_by_type.get(object_type)
+            if indexes is not None:
+                self.indexes_by_type[object_type] = OrderedDict(
+                    (name, index.copy()) for name, index in indexes.items()
+                )
+
+            owned.add(object_type)
+
+        indexes = self.indexes_by_type.get(object_type)
+        if indexes is None:
+            indexes = self.indexes_by_type[object_type] = self._create_indexes(object_type)
+
+        ids = self.objects_by_type_and_id.get(object_type)
+        if ids is None:
+            ids = self.objects_by_type_and_id[object_type] = self._create_ids()
+
+        collection = self.objects_by_type.get(object_type)
+        if collection is None:
+            collection = self.objects_by_type[object_type] = self._create_collection()
+
+        return ids, collection, indexes
+
+
+class ObjectsByTypeView(Mapping):
+    """
+    A read-only view of the objects of a snapshot by type, through `get` (`get_ids` or `get_collection`), so that types
+    without objects look empty rather than missing, without being added to the snapshot.
+    """
+
+    def __init__(self, objects_by_type, get):
+        self._objects_by_type = objects_by_type
+        self._get = get
+
+    def __getitem__(self, object_type):
+        return self._get(object_type)
+
+    def __contains__(self, object_type):
+        return object_type in self._objects_by_type
+
+    def __iter__(self):
+        return iter(self._objects_by_type)
+
+    def __len__(self):
+        return len(self._objects_by_type)
 
 
 class InMemoryDataSource(BaseDataSource):
-    def __init__(self):
-        self.objects_by_type_and_id = defaultdict(dict)
-        self.objects_by_type = defaultdict(lambda: SortedCollection(key=attrgetter('id')))
+    def __init__(self, collection_class=None, snapshots=False):
+        """
+        With `snapshots=True`, every write (or `batch` of writes) builds a new snapshot of the data that shares all
+        it can with the previous one and is then published at once, so that requests can keep reading from the
+        snapshot they started with, without locking, while another thread writes. Only one thread writes at a time.
+        """
+        if collection_class is None:
+            # Blocked collections share their blocks when copied, which is what makes snapshots cheap.
+            collection_class = BlockedSortedCollection if snapshots else SortedCollection
+
+        self.collection_class = collection_class
+        self.snapshots = snapshots
+        # Index definitions, as (key, unique) by index name and then by type name.
+        self._index_definitions = {}
+        self._write_lock = threading.RLock()
+        self._pending = None
+        self._snapshot = self._create_snapshot()
+
+    def _create_collection(self):
+        return self.collection_class(key=attrgetter('id'))
+
+    def _create_snapshot(self):
+        return InMemorySnapshot(CopyOnWriteDict if self.snapshots else dict, self._create_collection,
+                                self._create_indexes)
+
+    def _create_indexes(self, object_type):
+        definitions = self._index_definitions.get(object_type.name, {})
+        return OrderedDict(
+            (index_name, InMemoryIndex(key, unique, self.collection_class))
+            for index_name, (key, unique) in definitions.items()
+        )
+
+    @property
+    def objects_by_type_and_id(self):
+        snapshot = self._snapshot
+        return ObjectsByTypeView(snapshot.objects_by_type_and_id, snapshot.get_ids)
+
+    @property
+    def objects_by_type(self):
+        snapshot = self._snapshot
+        return ObjectsByTypeView(snapshot.objects_by_type, snapshot.get_collection)
+
+    def snapshot(self):
+        return self._snapshot
+
+    def snapshot_for(self, info):
+        """
+        Returns the snapshot to read from for the request `info` belongs to, which stays the same for the whole
+        request.
+        """
+        request_context = info and info.request_context
+        if not self.snapshots or not isinstance(request_context, dict):
+            return self._snapshot
+
+        snapshot = request_context.get(self)
+        if snapshot is None:
+            snapshot = request_context[self] = self._snapshot
+
+        return snapshot
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups writes together, so that readers see either all of them or, if the block raises, none of them.
+        """
+        if not self.snapshots:
+            yield
+            return
+
+        with self._write_lock:
+            if self._pending is not None:
+                yield
+                return
+
+            self._pending = self._snapshot.copy()
+            try:
+                yield
+                self._snapshot = self._pending
+
+            finally:
+                self._pending = None
+
+    @contextmanager
+    def _writing(self):
+        with self.batch():
+            yield self._snapshot if self._pending is None else self._pending
+
+    def add_index(self, type_name, index_name, key, unique=False):
+        """
+        Declares a secondary index over the objects of the type named `type_name`, ordered by `key`, which is either
+        the name of an attribute or a function of the object, and then by id. Objects whose key is `None` are left out
+        of the index. With `unique=True`, adding an object whose key another object already has raises a `ValueError`.
+
+        The keys of stored objects must not change; remove an object and add it back to change its keys.
+        """
+        if isinstance(key, six.string_types):
+            key = attrgetter(key)
+
+        with self._write_lock:
+            assert self._pending is None, 'Indexes cannot be added within a batch.'
+            definitions = self._index_definitions.get(type_name, OrderedDict())
+            if index_name in definitions:
+                raise ValueError(u'An index named {} already exists on {}.'.format(index_name, type_name))
+
+            with self._writing() as snapshot:
+                for object_type, collection in list(snapshot.objects_by_type.items()):
+                    if object_type.name != type_name:
+                        continue
+
+                    index = InMemoryIndex(key, unique, self.collection_class)
+                    index.check(collection)
+                    index.update(collection)
+                    snapshot.writable(object_type)[2][index_name] = index
+
+            definitions[index_name] = key, unique
+            self._index_definitions[type_name] = definitions
 
     def add(self, obj):
-        self.objects_by_type_and_id[obj.T][text_type(obj.id)] = obj
-        self.objects_by_type[obj.T].insert(obj)
+        with self._writing() as snapshot:
+            ids, collection, indexes = snapshot.writable(obj.T)
+            for index in indexes.values():
+                index.check((obj,))
+
+            collection.insert(obj)
+            ids[text_type(obj.id)] = obj
+            for index in indexes.values():
+                index.insert(obj)
+
+    def add_many(self, objs):
+        """
+        Adds many objects at once, sorting the new objects of each type into its collection in one pass. Raises a
+        `ValueError` without adding anything if any of the objects has the same id as another object of its type.
+        """
+        with self._writing() as snapshot:
+            self._add_many(snapshot, objs)
+
+    def replace_all(self, objs):
+        """
+        Replaces every object in the data source with `objs`. The new collections are built on the side, so if that
+        fails the data source is left as it was.
+        """
+        snapshot = self._create_snapshot()
+        self._add_many(snapshot, objs)
+
+        with self.batch():
+            if self._pending is None:
+                self._snapshot = snapshot
+            else:
+                self._pending = snapshot
+
+    @staticmethod
+    def _add_many(snapshot, objs):
+        objs_by_type = OrderedDict()
+        for obj in objs:
+            objs_by_id = objs_by_type.get(obj.T)
+            if objs_by_id is None:
+                objs_by_id = objs_by_type[obj.T] = {}
+
+            id = text_type(obj.id)
+            if id in objs_by_id or id in snapshot.get_ids(obj.T):
+                raise ValueError(u'An object of type {} with id {} already exists.'.format(obj.T, id))
+
+            objs_by_id[id] = obj
+
+        # Every index is checked before anything changes, so that a conflict leaves the snapshot as it was.
+        for object_type, objs_by_id in objs_by_type.items():
+            for index in snapshot.writable(object_type)[2].values():
+                index.check(objs_by_id.values())
+
+        for object_type, objs_by_id in objs_by_type.items():
+            ids, collection, indexes = snapshot.writable(object_type)
+            collection.update(objs_by_id.values())
+            ids.update(objs_by_id)
+            for index in indexes.values():
+                index.update(objs_by_id.values())
 
     def remove(self, obj):
-        del self.objects_by_type_and_id[obj.T][text_type(obj.id)]
-        self.objects_by_type[obj.T].remove(obj)
+        with self._writing() as snapshot:
+            ids, collection, indexes = snapshot.writable(obj.T)
+            del ids[text_type(obj.id)]
+            collection.remove(obj)
+            for index in indexes.values():
+                index.remove(obj)
 
     def get_edge(self, relay, obj):
-        return self.objects_by_type[obj.T].get_edge(relay, obj.T.name, obj)
+        return self._snapshot.get_collection(obj.T).get_edge(relay, obj.T.name, obj)
 
     def fetch_node(self, object_type, id, resolve_info):
-        return self.objects_by_type_and_id[object_type].get(text_type(id))
+        return self.snapshot_for(resolve_info).get_ids(object_type).get(text_type(id))
+
+    def fetch_nodes(self, object_type, ids, resolve_info):
+        get = self.snapshot_for(resolve_info).get_ids(object_type).get
+        return [get(text_type(id)) for id in ids]
 
     def make_connection_resolver(self, relay, object_type_thunk):
         def resolver(obj, args, info):
             object_type = relay.R[object_type_thunk]()
-            return self.objects_by_type[object_type].get_connection(relay, object_type.name, args)
+            collection = self.snapshot_for(info).get_collection(object_type)
+            return collection.get_connection(relay, object_type.name, args, info)
+
+        return resolver
+
+    def _get_index(self, snapshot, object_type, index_name):
+        index = snapshot.get_index(object_type, index_name)
+        if index is not None:
+            return index
+
+        definition = self._index_definitions.get(object_type.name, {}).get(index_name)
+        if definition is None:
+            raise ValueError(u'There is no index named {} on {}.'.format(index_name, object_type.name))
+
+        # Nothing of this type has been added yet.
+        key, unique = definition
+        return InMemoryIndex(key, unique, self.collection_class)
+
+    def fetch_by_index(self, object_type, index_name, value, resolve_info=None):
+        """
+        Returns the objects of `object_type` whose `index_name` key is `value`, in id order.
+        """
+        return self._get_index(self.snapshot_for(resolve_info), object_type, index_name).find(value)
+
+    def make_index_connection_resolver(self, relay, object_type_thunk, index_name, equal=None, low=None, high=None):
+        """
+        Makes a connection resolver that pages through the objects in the index `index_name`, whose key is equal to
+        the argument named `equal`, or else lies between the arguments named `low` and `high` (inclusive). Leaving out
+        `low` or `high`, or their arguments, leaves that end of the range open.
+        """
+        def resolver(obj, args, info):
+            object_type = relay.R[object_type_thunk]()
+            snapshot = self.snapshot_for(info)
+            index = self._get_index(snapshot, object_type, index_name)
+
+            if equal is not None:
+                value = args.get(equal)
+                bounds = (0, 0) if value is None else index.bounds(value, value)
+
+            else:
+                bounds = index.bounds(low and args.get(low), high and args.get(high))
+
+            return index.get_connection(relay, object_type.name, args, bounds, snapshot.get_ids(object_type), info)
 
         return resolver
@@ -0,0 +1,116 @@
+"""
+Codecs that turn an object type name and an id into an opaque global ID, and back.
+
+`Base64IDCodec` produces the same IDs as the `base64('Type:id')` helpers always have. `CompactIDCodec` is a binary
+safe alternative that packs integer ids into as few bytes as possible, and doesn't care what characters ids contain.
+Either one memoizes the IDs it encodes in a bounded LRU cache, since the same objects tend to be resolved over and over.
+"""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import six
+from six import text_type
+from ...utils.lru_cache import LRUCache
+from .utils import base64, unbase64
+
+
+class BaseIDCodec(object):
+    def __init__(self, cache_size=4096):
+        self._encoded = LRUCache(cache_size) if cache_size else None
+
+    def encode(self, type_name, id):
+        cache = self._encoded
+        if cache is None:
+            return self._encode(type_name, id)
+
+        # Equal ids of different types (1, 1.0 and True) don't always encode the same way.
+        key = type_name, type(id), id
+        global_id = cache.get(key)
+        if global_id is None:
+            global_id = self._encode(type_name, id)
+            cache.set(key, global_id)
+
+        return global_id
+
+    def decode(self, global_id):
+        """
+        Returns a `(type_name, id)` tuple, where `id` is always a string.
+        """
+        try:
+            return self._decode(global_id)
+
+        except (TypeError, ValueError, IndexError, UnicodeError):
+            raise ValueError('Invalid global ID {!r}.'.format(global_id))
+
+    def _encode(self, type_name, id):
+        raise NotImplementedError('_encode must be implemented in the subclass')
+
+    def _decode(self, global_id):
+        raise NotImplementedError('_decode must be implemented in the subclass')
+
+
+class Base64IDCodec(BaseIDCodec):
+    def _encode(self, type_name, id):
+        return base64('%s:%s' % (type_name, id))
+
+    def _decode(self, global_id):
+        type_name, id = unbase64(global_id).split(':', 1)
+        return type_name, id
+
+
+# Tags that follow the type name, telling how the id was packed.
+_INT_ID = b'i'
+_TEXT_ID = b's'
+
+
+def _int_to_bytes(value):
+    packed = bytearray()
+    while value:
+        packed.append(value & 0xff)
+        value >>= 8
+
+    packed.reverse()
+    return bytes(packed)
+
+
+def _bytes_to_int(packed):
+    value = 0
+    for byte in bytearray(packed):
+        value = (value << 8) | byte
+
+    return value
+
+
+class CompactIDCodec(BaseIDCodec):
+    """
+    Encodes IDs as unpadded url-safe base64 of the type name's length, the type name, and the id. Non-negative integer
+    ids are packed as big-endian bytes, anything else as utf-8 text.
+    """
+
+    def _encode(self, type_name, id):
+        type_name = type_name.encode('utf-8')
+        if len(type_name) > 0xff:
+            raise ValueError('Type name {!r} is too long to be encoded.'.format(type_name))
+
+        if isinstance(id, six.integer_types) and not isinstance(id, bool) and id >= 0:
+            packed_id = _INT_ID + _int_to_bytes(id)
+        else:
+            packed_id = _TEXT_ID + text_type(id).encode('utf-8')
+
+        global_id = urlsafe_b64encode(six.int2byte(len(type_name)) + type_name + packed_id).rstrip(b'=')
+        return global_id.decode('ascii')
+
+    def _decode(self, global_id):
+        if isinstance(global_id, text_type):
+            global_id = global_id.encode('ascii')
+
+        data = urlsafe_b64decode(global_id + b'=' * (-len(global_id) % 4))
+        type_name_end = 1 + bytearray(data[:1])[0]
+        type_name = data[1:type_name_end].decode('utf-8')
+        tag, packed_id = data[type_name_end:type_name_end + 1], data[type_name_end + 1:]
+
+        if tag == _INT_ID:
+            return type_name, text_type(_bytes_to_int(packed_id))
+
+        if tag == _TEXT_ID:
+            return type_name, packed_id.decode('utf-8')
+
+        raise ValueError('Unknown id tag {!r}.'.format(tag))
@@ -0,0 +1,142 @@
+"""
+Per-request batching of node fetches, in the spirit of DataLoader.
+
+A `NodeLoader` collects the keys it is asked to load and fetches them with as few calls to its batch function as
+possible, never asking for the same key twice. Batching across fields needs the query to be executed with the
+`BatchingExecutionMiddleware`, which lets resolvers return a `Deferred` that is resolved once the whole level of the
+query has asked for what it needs:
+
+    executor = Executor([BatchingExecutionMiddleware()])
+    result = executor.execute(schema, query)
+
+Under the default (synchronous) executor, `load` fetches the key right away and `load_many` still fetches all of the
+given keys in batches.
+"""
+import threading
+from collections import OrderedDict
+from graphql.core.pyutils.defer import Deferred
+
+_local = threading.local()
+
+
+def current_batch_scope():
+    scopes = getattr(_local, 'scopes', None)
+    return scopes[-1] if scopes else None
+
+
+class BatchScope(object):
+    """
+    Tracks the loaders that have loads pending while a query is executed, so they can be dispatched together.
+    """
+
+    def __init__(self):
+        self._loaders = OrderedDict()
+
+    def __enter__(self):
+        scopes = getattr(_local, 'scopes', None)
+        if scopes is None:
+            scopes = _local.scopes = []
+
+        scopes.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _local.scopes.pop()
+
+    def schedule(self, loader):
+        self._loaders[id(loader)] = loader
+
+    def dispatch(self):
+        """
+        Dispatches every loader that has pending loads, returns whether there was any.
+        """
+        loaders = self._loaders
+        if not loaders:
+            return False
+
+        self._loaders = OrderedDict()
+        for loader in loaders.values():
+            loader.dispatch()
+
+        return True
+
+
+class BatchingExecutionMiddleware(object):
+    @staticmethod
+    def execution_result(executor):
+        with BatchScope() as scope:
+            result = executor()
+            # Resolving a batch may cause nested fields to load more, so keep going until nothing is left pending.
+            while scope.dispatch():
+                pass
+
+        assert result.called, 'Query execution did not complete after dispatching every pending load.'
+        return result.result
+
+
+class NodeLoader(object):
+    def __init__(self, batch_load_fn, max_batch_size=None):
+        assert max_batch_size is None or max_batch_size > 0, 'max_batch_size must be a positive integer.'
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self._results = {}
+        self._pending = OrderedDict()
+
+    def load(self, key):
+        if key in self._results:
+            return self._results[key]
+
+        scope = current_batch_scope()
+        if scope is None:
+            return self.load_many([key])[0]
+
+        deferred = Deferred()
+        self._pending.setdefault(key, []).append(deferred)
+        scope.schedule(self)
+        return deferred
+
+    def load_many(self, keys):
+        missing = [key for key in OrderedDict.fromkeys(keys) if key not in self._results]
+        for batch in self._batches(missing):
+            self._results.update(zip(batch, self._fetch(batch)))
+
+        return [self._results[key] for key in keys]
+
+    def prime(self, key, value):
+        self._results.setdefault(key, value)
+
+    def clear(self, key=None):
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+
+    def dispatch(self):
+        pending = self._pending
+        self._pending = OrderedDict()
+
+        # Another load may have fetched some of the keys in the meantime.
+        keys = [key for key in pending if key not in self._results]
+        for batch in self._batches(keys):
+            try:
+                self._results.update(zip(batch, self._fetch(batch)))
+
+            except Exception as e:
+                for key in batch:
+                    for deferred in pending.pop(key):
+                        deferred.errback(e)
+
+        for key, deferreds in pending.items():
+            for deferred in deferreds:
+                deferred.callback(self._results[key])
+
+    def _batches(self, keys):
+        size = self.max_batch_size or len(keys) or 1
+        return [keys[i:i + size] for i in range(0, len(keys), size)]
+
+    def _fetch(self, keys):
+        values = list(self.batch_load_fn(keys))
+        if len(values) != len(keys):
+            raise ValueError('The batch load function returned {} values for {} keys.'.format(len(values), len(keys)))
+
+        return values
@@ -1,4 +1,4 @@
-from ....metaclasses.mutation import MutationMeta
+from ....metaclasses.mutation import MutationMeta, execute_many
 
 
 class RelayMutationMeta(MutationMeta):
@@ -18,3 +18,13 @@ class RelayMutationMeta(MutationMeta):
         result = resolver(obj, input_obj, info)
         result.client_mutation_id = input_obj.client_mutation_id
         return result
+
+    @staticmethod
+    def _process_bulk_resolver(resolver, input_class, obj, args, info):
+        input_objs = [input_class(value) for value in args.get('inputs')]
+        outputs = execute_many(resolver, input_objs, obj, info)
+        for input_obj, output in zip(input_objs, outputs):
+            if output is not None:
+                output.client_mutation_id = input_obj.client_mutation_id
+
+        return outputs
@@ -2,14 +2,30 @@ from graphql.core.type.definition import GraphQLObjectType
 import six
 from ...bases.mutation import MutationBase
 from .connections import connection_args
+from .id_codec import Base64IDCodec
 from .metaclasses.mutation import RelayMutationMeta
-from .utils import base64, unbase64
+
+
+def resolve_lazily(obj, attr, get_value_attr):
+    """
+    Resolves the `attr` field of `obj`, working it out with the function in `get_value_attr` if it holds one.
+    Connections do that for the values that are expensive to work out and seldom selected.
+    """
+    get_value = getattr(obj, get_value_attr, None)
+    if get_value is not None:
+        return get_value()
+
+    value = getattr(obj, attr, None)
+    return value() if callable(value) else value
 
 
 class RelayMixin(object):
-    def __init__(self, registry, data_source):
+    def __init__(self, registry, data_source, max_batch_size=None, id_codec=None):
         self.R = registry
         self.data_source = data_source
+        self.max_batch_size = max_batch_size
+        self.id_codec = id_codec or Base64IDCodec()
+        self._node_type_names_by_class = {}
         self._node_field = None
         self._connections = {}
         self.Mutation = self._create_mutation_type_class()
@@ -25,6 +41,17 @@ class RelayMixin(object):
             resolver=lambda obj, args, info: self.fetch_node(args.get('id'), info)
         )
 
+    @property
+    def NodesField(self):
+        return self.R.Field(
+            self.R.Node.List.NonNull,
+            description='Fetches objects given their IDs',
+            args={
+                'ids': self.R.ID.NonNull.List.NonNull(description='The IDs of objects')
+            },
+            resolver=lambda obj, args, info: self.fetch_nodes(args.get('ids'), info)
+        )
+
     def get_connection_and_edge_types(self, type_name):
         return self._connections[type_name]
 
@@ -46,17 +73,55 @@ class RelayMixin(object):
         self.PageInfo = PageInfo
 
     def fetch_node(self, id, info):
-        object_type_name, object_id = unbase64(id).split(':', 1)
+        return self.node_loader(info).load(self.parse_node_id(id))
+
+    def fetch_nodes(self, ids, info):
+        return self.node_loader(info).load_many([self.parse_node_id(id) for id in ids])
+
+    def parse_node_id(self, id):
+        object_type_name, object_id = self.id_codec.decode(id)
         object_type = self.R[object_type_name]()
         assert isinstance(object_type, GraphQLObjectType)
-        return self.data_source.fetch_node(object_type, object_id, info)
+        return object_type, object_id
+
+    def node_loader(self, info):
+        """
+        Returns the loader that batches node fetches for the request `info` belongs to. The loader is shared by the
+        whole request, so the data source gets the `info` of the first field that created it.
+        """
+        request_context = info and info.request_context
+        if not isinstance(request_context, dict):
+            return self._create_node_loader(info)
+
+        loader = request_context.get(self)
+        if loader is None:
+            loader = request_context[self] = self._create_node_loader(info)
+
+        return loader
+
+    def _create_node_loader(self, info):
+        return self.data_source.create_node_loader(info, self.max_batch_size)
 
     def _resolve_node_id(self, obj, args, info):
         return self.node_id_for(obj, info)
 
     def node_id_for(self, obj, info=None):
-        object_type = self.Node.T.resolve_type(obj, info)
-        return base64('%s:%s' % (object_type, obj.id))
+        return self.id_codec.encode(self.node_type_name_for(obj, info), obj.id)
+
+    def node_type_name_for(self, obj, info=None):
+        klass = obj.__class__
+        type_name = self._node_type_names_by_class.get(klass)
+        if type_name is not None:
+            return type_name
+
+        node_type = self.Node.T
+        for object_type in self.R._get_types_for_class(klass):
+            if node_type.is_possible_type(object_type):
+                # The registry knows the type from the class alone, so it can't change from one object to the next.
+                type_name = self._node_type_names_by_class[klass] = object_type.name
+                return type_name
+
+        return node_type.resolve_type(obj, info).name
 
     def connection_definitions(self, name, object_type):
         R = self.R
@@ -74,6 +139,14 @@ class RelayMixin(object):
 
             page_info = R.PageInfo.NonNull
             edges = R[Edge].List
+            total_count = R.Int(description='The number of items in the connection, ignoring pagination.')
+            start_offset = R.Int(description='The position of the first edge among all the items in the connection.')
+
+            def resolve_total_count(self, obj, args, info):
+                return resolve_lazily(obj, 'total_count', '_total_count')
+
+            def resolve_start_offset(self, obj, args, info):
+                return resolve_lazily(obj, 'start_offset', '_start_offset')
 
         self._connections[name] = Connection, Edge
         return Connection, Edge
@@ -0,0 +1,220 @@
+"""
+Caching of field values across requests.
+
+Fields whose resolvers are slow, but whose values stay good for a while, can be given a cache:
+
+    class Ship(R.ObjectType):
+        route = R.String(args={'to': R.String}, cache=TTL(60), key=lambda ship, args: (ship.id, args.get('to')))
+
+The value of the field is then computed once for each key, and reused by every request for `seconds` (forever with
+`None`), as long as the cache doesn't run out of room for it. The key defaults to the `id` of the object (or the object
+itself if it has none) along with the arguments.
+
+Values are kept in a backend: by default a `MemoryCacheBackend`, an LRU cache of `maxsize` values in the process, or a
+`PickledCacheBackend`, which stands in for a cache shared between processes. When many threads miss the same key at
+once, only one of them computes the value, and the others wait for it. Resolvers that return a `Deferred` or an
+awaitable are called every time, as those can't be handed out twice.
+"""
+import pickle
+import re
+import threading
+import time
+from .memoize import freeze_args, is_pending
+from .utils.lru_cache import LRUCache
+
+_missing = object()
+_monotonic = getattr(time, 'monotonic', time.time)
+# What the default repr of objects (and functions) ends with, which differs from one process to the next.
+_address_re = re.compile(r' at 0x[0-9a-fA-F]+>')
+
+
+def default_key(source, args):
+    source_key = getattr(source, 'id', _missing)
+    if source_key is _missing:
+        # Dicts (and lists) are frozen like arguments are.
+        source_key = freeze_args(source)
+
+    return source_key, freeze_args(args) if args else ()
+
+
+class MemoryCacheBackend(object):
+    """
+    Keeps up to `maxsize` values in the process, evicting the least recently used one when full.
+    """
+
+    def __init__(self, maxsize=1024, clock=_monotonic):
+        self.clock = clock
+        self._items = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self.clock():
+                self._items.pop(key)
+                return default
+
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._items.set(key, (None if ttl is None else self.clock() + ttl, value))
+
+    def delete(self, key):
+        with self._lock:
+            self._items.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class PickledCacheBackend(object):
+    """
+    Stands in for a cache shared between processes, like memcached: keys are turned into strings, and values are
+    pickled, so they have to be picklable and come back as copies. Backends given the same `store` dict share their
+    values, as processes sharing a cache would.
+
+    Keys are stored under their `repr`, so it must be the same in every process: keys holding objects with the default
+    repr, which has their address in it, are rejected with a `TypeError`.
+    """
+
+    def __init__(self, store=None, clock=time.time):
+        self.store = {} if store is None else store
+        self.clock = clock
+
+    @staticmethod
+    def key_string(key):
+        text = repr(key)
+        if _address_re.search(text):
+            raise TypeError('Cannot share values under the key {}, as its repr differs from one process to the '
+                            'next.'.format(text))
+
+        return text
+
+    def get(self, key, default=None):
+        key = self.key_string(key)
+        entry = self.store.get(key)
+        if entry is None:
+            return default
+
+        expires_at, data = entry
+        if expires_at is not None and expires_at <= self.clock():
+            self.store.pop(key, None)
+            return default
+
+        return pickle.loads(data)
+
+    def set(self, key, value, ttl=None):
+        self.store[self.key_string(key)] = (None if ttl is None else self.clock() + ttl,
+                                            pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def delete(self, key):
+        self.store.pop(self.key_string(key), None)
+
+    def clear(self):
+        self.store.clear()
+
+    def __len__(self):
+        return len(self.store)
+
+
+class TTL(object):
+    """
+    Caches the values of a field for `seconds`, in `backend`, or in a `MemoryCacheBackend` of `maxsize` values. `hits`
+    and `misses` count how often values were found in the cache or had to be computed.
+
+    Threads that miss a key another thread is computing wait for it for up to `wait_timeout` seconds (forever with
+    `None`), and then compute the value themselves, so that a computation that hangs doesn't hold up every request.
+    """
+
+    def __init__(self, seconds, maxsize=1024, backend=None, wait_timeout=10):
+        assert seconds is None or seconds > 0, 'seconds must be positive, or None for values that never expire.'
+        self.seconds = seconds
+        self.wait_timeout = wait_timeout
+        self.backend = MemoryCacheBackend(maxsize) if backend is None else backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # The keys being computed, with the event set once they are and the thread computing them.
+        self._computing = {}
+
+    def clear(self):
+        self.backend.clear()
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_or_compute(self, key, compute):
+        value = self.backend.get(key, _missing)
+        if value is not _missing:
+            self._count(True)
+            return value
+
+        thread = threading.current_thread()
+        with self._lock:
+            computing = self._computing.get(key)
+            if computing is None:
+                event = threading.Event()
+                self._computing[key] = event, thread
+
+        if computing is not None:
+            event, computing_thread = computing
+            if computing_thread is thread:
+                # The value depends on itself, waiting for it would never end.
+                return compute()
+
+            event.wait(self.wait_timeout)
+            value = self.backend.get(key, _missing)
+            if value is not _missing:
+                self._count(True)
+                return value
+
+            # Computing it failed, is taking too long, or it's gone already.
+            self._count(False)
+            return compute()
+
+        try:
+            # Another thread may have just finished computing it.
+            value = self.backend.get(key, _missing)
+            if value is not _missing:
+                self._count(True)
+                return value
+
+            self._count(False)
+            value = compute()
+            if not is_pending(value):
+                self.backend.set(key, value, self.seconds)
+
+            return value
+
+        finally:
+            with self._lock:
+                del self._computing[key]
+
+            event.set()
+
+    def wrap(self, resolver, type_name, field_name, key=None):
+        """
+        Wraps the resolver of a field so that its values are looked up in the cache first.
+        """
+        field = '{}.{}'.format(type_name, field_name)
+        key = key or default_key
+        get_or_compute = self.get_or_compute
+
+        def cached(source, args, info):
+            return get_or_compute((field, key(source, args)), lambda: resolver(source, args, info))
+
+        cached.__name__ = getattr(resolver, '__name__', 'cached')
+        return cached
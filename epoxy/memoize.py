@@ -0,0 +1,147 @@
+"""
+Opt-in memoization of resolvers within a request.
+
+A resolver marked as pure, either with the `pure` decorator or with `pure=True` on its field, is assumed to return the
+same value whenever it's given the same source object and arguments. Within a request, the value it returns for a
+source and arguments is remembered, so when the same object shows up many times in a response, e.g. friends of
+friends, the resolver runs only once for it:
+
+    class Human(R.ObjectType):
+        name = R.String
+        friends = R.Human.List(pure=True)
+
+        @pure
+        def resolve_name(self, obj, args, info):
+            ...
+
+A field without a resolver can be marked with `pure=True` too, which remembers the value read from the source object:
+that is worth it when the attribute is a method or property that works the value out, like `friends` above.
+
+Values are remembered in the `request_context` of the request, which graphql-core makes a fresh dict for unless it's
+given a (non empty) one; when it isn't a dict, pure resolvers are simply called every time. Since the values go away
+with the request, a resolver only has to be pure for as long as a request lasts. When a resolver returns a `Deferred`,
+the value it resolves to is remembered; awaitables are not remembered at all.
+`ResolverMemo.for_request(request_context)` returns what was remembered, along with how often each field was found
+there (`hits`) or not (`misses`), to help decide which resolvers are worth marking.
+"""
+from collections import defaultdict
+from graphql.core.pyutils.defer import Deferred
+from six import wraps
+
+
+def pure(resolver):
+    """
+    Marks a resolver as pure, so that its value is remembered within a request.
+    """
+    resolver._pure = True
+    return resolver
+
+
+def is_pure(resolver):
+    return getattr(resolver, '_pure', False)
+
+
+def is_pending(value):
+    """
+    Tells whether `value` is a `Deferred` or an awaitable, which stand for a value that isn't there yet.
+    """
+    return isinstance(value, Deferred) or hasattr(value, '__await__')
+
+
+def freeze_args(value):
+    """
+    Turns argument values into hashable ones, so that equal arguments make equal keys.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze_args(item)) for key, item in value.items()))
+
+    if isinstance(value, list):
+        return tuple(freeze_args(item) for item in value)
+
+    return value
+
+
+class ResolverMemo(object):
+    def __init__(self):
+        # Values by (field, id of the source, arguments), along with the source itself, which must not be collected
+        # while its id is in use.
+        self._values = {}
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+    @classmethod
+    def for_request(cls, request_context):
+        """
+        Returns the memo of the request whose `request_context` is given, or `None` if it isn't a dict.
+        """
+        if not isinstance(request_context, dict):
+            return None
+
+        memo = request_context.get(cls)
+        if memo is None:
+            memo = request_context[cls] = cls()
+
+        return memo
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+
+    def stats(self):
+        """
+        Returns `(hits, misses)` by field, as `'Type.field'`.
+        """
+        return dict((field, (self.hits[field], self.misses[field])) for field in set(self.hits) | set(self.misses))
+
+    def resolve(self, field, resolver, source, args, info):
+        key = field, id(source), freeze_args(args) if args else ()
+        try:
+            entry = self._values.get(key)
+
+        except TypeError:
+            # Some of the arguments can't be hashed.
+            return resolver(source, args, info)
+
+        if entry is not None and entry[0] is source:
+            self.hits[field] += 1
+            return entry[1]
+
+        self.misses[field] += 1
+        value = resolver(source, args, info)
+        if isinstance(value, Deferred):
+            # graphql-core chains its own callbacks onto the `Deferred`, so another field given the same one would get
+            # what the first made of the value: the value itself is remembered once it's there instead.
+            value.add_callback(self._remember, key, source)
+
+        elif not is_pending(value):
+            # Awaitables are left out, as a coroutine can only be awaited once.
+            self._values[key] = source, value
+
+        return value
+
+    def _remember(self, value, key, source):
+        self._values[key] = source, value
+        return value
+
+
+def memoize_resolver(resolver, type_name, field_name):
+    """
+    Wraps a pure resolver so that its values are remembered within each request.
+    """
+    field = '{}.{}'.format(type_name, field_name)
+    for_request = ResolverMemo.for_request
+
+    @wraps(resolver)
+    def memoized(source, args, info):
+        memo = for_request(info.request_context)
+        if memo is None:
+            return resolver(source, args, info)
+
+        return memo.resolve(field, resolver, source, args, info)
+
+    # `wraps` gives the wrapper the name of the resolver, so the schema cache tells them apart with these.
+    memoized._memoized_field = type_name, field_name
+    memoized._memoized_resolver = resolver
+    return memoized
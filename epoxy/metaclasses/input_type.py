@@ -1,14 +1,38 @@
 from collections import OrderedDict
 from functools import partial
 
-from graphql.core.type.definition import GraphQLInputObjectType
+from graphql.core.type.definition import GraphQLInputObjectType, GraphQLList, GraphQLNonNull
 
+from ..bases.input_type import InputTypeBase
+from ..profiler import BUILD_FIELD_MAP
 from ..types.field import InputField
-from ..utils.get_declared_fields import get_declared_fields
+from ..utils.make_init import can_generate_init, make_input_type_init, should_generate_init
+from ..utils.maybe_callable import maybe_callable
 from ..utils.weak_ref_holder import WeakRefHolder
 from ..utils.yank_potential_fields import yank_potential_fields
 
 
+def make_converter(registry, type):
+    """
+    Returns the function converting values of `type` into instances of the epoxy classes of the input types in it,
+    or `None` if there are none of those.
+    """
+    if isinstance(type, GraphQLNonNull):
+        type = type.of_type
+
+    if isinstance(type, GraphQLList):
+        convert = make_converter(registry, type.of_type)
+        if convert is None:
+            return None
+
+        return lambda values: [None if value is None else convert(value) for value in values]
+
+    if isinstance(type, GraphQLInputObjectType):
+        return registry._get_input_type_class(type)
+
+    return None
+
+
 class InputTypeMeta(type):
     def __new__(mcs, name, bases, attrs):
         if attrs.pop('abstract', False):
@@ -16,23 +40,30 @@ class InputTypeMeta(type):
 
         name = attrs.pop('_name', name)
         class_ref = WeakRefHolder()
-        declared_fields = get_declared_fields(name, yank_potential_fields(attrs, bases, InputField), InputField)
+        registry = mcs._get_registry()
+        field_attrs = yank_potential_fields(attrs, bases, InputField)
+        declared_fields = registry._declare_fields(name, field_attrs, InputField)
+
+        slots = attrs['_slots'] if '_slots' in attrs else any(getattr(base, '_slots', False) for base in bases)
+        if slots and '__slots__' not in attrs:
+            attrs['__slots__'] = tuple(sorted(field_attrs))
+
         interface = GraphQLInputObjectType(
             name,
-            fields=partial(mcs._build_field_map, class_ref, declared_fields),
+            fields=registry._profiled(BUILD_FIELD_MAP, name, partial(mcs._build_field_map, class_ref, declared_fields)),
             description=attrs.get('__doc__'),
         )
 
-        mcs._register(interface)
         cls = super(InputTypeMeta, mcs).__new__(mcs, name, bases, attrs)
+        mcs._register(interface, cls)
         cls.T = interface
-        cls._registry = mcs._get_registry()
+        cls._registry = registry
         class_ref.set(cls)
 
         return cls
 
     @staticmethod
-    def _register(object_type):
+    def _register(input_type, cls):
         raise NotImplementedError('_register must be implemented in the sub-metaclass')
 
     @staticmethod
@@ -48,14 +79,23 @@ class InputTypeMeta(type):
         registry = cls._registry
         field_map = OrderedDict()
         field_attr_map = OrderedDict()
+        field_converters = {}
 
-        for field_attr_name, field in fields:
+        for field_attr_name, field in maybe_callable(fields):
             graphql_field = field_map[field.name] = field.to_field(registry)
 
             if field_attr_name in field_attr_map:
                 del field_attr_map[field_attr_name]
 
             field_attr_map[field_attr_name] = (field.name, graphql_field)
+            field_converters[field_attr_name] = make_converter(registry, graphql_field.type)
 
         cls._field_attr_map = field_attr_map
+        cls._field_converters = field_converters
+        if should_generate_init(cls, InputTypeBase.__init__) and can_generate_init(field_attr_map):
+            cls.__init__ = make_input_type_init(cls.T.name, [
+                (field_attr_name, field_name, graphql_field.default_value, field_converters[field_attr_name])
+                for field_attr_name, (field_name, graphql_field) in field_attr_map.items()
+            ])
+
         return field_map
@@ -1,8 +1,9 @@
 from collections import OrderedDict
 from functools import partial
 from graphql.core.type.definition import GraphQLInterfaceType
-from ..utils.get_declared_fields import get_declared_fields
+from ..profiler import BUILD_FIELD_MAP
 from ..utils.make_default_resolver import make_default_resolver
+from ..utils.maybe_callable import maybe_callable
 from ..utils.weak_ref_holder import WeakRefHolder
 from ..utils.yank_potential_fields import yank_potential_fields
 
@@ -13,17 +14,20 @@ class InterfaceMeta(type):
             return super(InterfaceMeta, mcs).__new__(mcs, name, bases, attrs)
 
         class_ref = WeakRefHolder()
-        declared_fields = get_declared_fields(name, yank_potential_fields(attrs, bases))
+        registry = mcs._get_registry()
+        declared_fields = registry._declare_fields(name, yank_potential_fields(attrs, bases))
+
         interface = GraphQLInterfaceType(
             name,
-            fields=partial(mcs._build_field_map, class_ref, declared_fields),
+            fields=registry._profiled(BUILD_FIELD_MAP, name, partial(mcs._build_field_map, class_ref, declared_fields)),
             description=attrs.get('__doc__'),
         )
+        interface.type_resolver = registry._create_resolve_type(interface)
 
         mcs._register(interface, declared_fields)
         cls = super(InterfaceMeta, mcs).__new__(mcs, name, bases, attrs)
         cls.T = interface
-        cls._registry = mcs._get_registry()
+        cls._registry = registry
         class_ref.set(cls)
 
         return cls
@@ -47,7 +51,7 @@ class InterfaceMeta(type):
 
         field_map = OrderedDict()
 
-        for field_attr_name, field in fields:
+        for field_attr_name, field in maybe_callable(fields):
             interface_resolve_fn = (
                 field.resolver or
                 getattr(instance, 'resolve_{}'.format(field_attr_name), None)
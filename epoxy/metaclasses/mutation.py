@@ -1,5 +1,5 @@
 import functools
-from graphql.core.type import GraphQLField, GraphQLNonNull
+from graphql.core.type import GraphQLField, GraphQLList, GraphQLNonNull
 from graphql.core.type.definition import GraphQLArgument
 
 
@@ -9,6 +9,7 @@ class MutationMeta(type):
             return super(MutationMeta, mcs).__new__(mcs, name, bases, attrs)
 
         registry = mcs._get_registry()
+        bulk = attrs.pop('bulk', False)
 
         input = attrs.pop('Input')
         output = attrs.pop('Output')
@@ -44,6 +45,16 @@ class MutationMeta(type):
             description=attrs.get('__doc__', None)
         )))
 
+        if bulk:
+            mcs._register(mutation_name + 'Bulk', registry.with_resolved_types(lambda R: GraphQLField(
+                type=GraphQLList(R[Output]),
+                args={
+                    'inputs': GraphQLArgument(GraphQLNonNull(GraphQLList(GraphQLNonNull(R[Input]))))
+                },
+                resolver=functools.partial(mcs._process_bulk_resolver, instance.execute_many, Input),
+                description=attrs.get('__doc__', None)
+            )))
+
     @staticmethod
     def _register(mutation_name, mutation):
         raise NotImplementedError('_register must be implemented in the sub-metaclass')
@@ -63,3 +74,15 @@ class MutationMeta(type):
     @staticmethod
     def _process_resolver(resolver, input_class, obj, args, info):
         return resolver(obj, input_class(args.get('input')), info)
+
+    @staticmethod
+    def _process_bulk_resolver(resolver, input_class, obj, args, info):
+        return execute_many(resolver, [input_class(value) for value in args.get('inputs')], obj, info)
+
+
+def execute_many(resolver, inputs, obj, info):
+    outputs = list(resolver(obj, inputs, info))
+    if len(outputs) != len(inputs):
+        raise ValueError('execute_many returned {} outputs for {} inputs.'.format(len(outputs), len(inputs)))
+
+    return outputs
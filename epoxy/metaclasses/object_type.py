@@ -1,8 +1,13 @@
 from collections import OrderedDict
 from functools import partial
+import six
 from graphql.core.type import GraphQLObjectType
-from ..utils.get_declared_fields import get_declared_fields
-from ..utils.make_default_resolver import make_default_resolver
+from ..bases.object_type import ObjectTypeBase
+from ..memoize import is_pure, memoize_resolver
+from ..profiler import BUILD_FIELD_MAP
+from ..utils.make_default_resolver import make_resolver_for_field_source
+from ..utils.make_init import can_generate_init, make_object_type_init, should_generate_init
+from ..utils.maybe_callable import maybe_callable
 from ..utils.no_implementation_registration import no_implementation_registration
 from ..utils.weak_ref_holder import WeakRefHolder
 from ..utils.yank_potential_fields import yank_potential_fields
@@ -17,12 +22,17 @@ class ObjectTypeMeta(type):
         class_ref = WeakRefHolder()
         registry = mcs._get_registry()
 
-        declared_fields = get_declared_fields(name, yank_potential_fields(attrs, bases))
+        field_attrs = yank_potential_fields(attrs, bases)
+        declared_fields = registry._declare_fields(name, field_attrs)
+
+        slots = attrs['_slots'] if '_slots' in attrs else any(getattr(base, '_slots', False) for base in bases)
+        if slots and '__slots__' not in attrs:
+            attrs['__slots__'] = mcs._get_slot_names(registry, field_attrs, bases)
 
         with no_implementation_registration():
             object_type = GraphQLObjectType(
                 name,
-                fields=partial(mcs._build_field_map, class_ref, declared_fields),
+                fields=registry._profiled(BUILD_FIELD_MAP, name, partial(mcs._build_field_map, class_ref, declared_fields)),
                 description=attrs.get('__doc__'),
                 interfaces=mcs._get_interfaces()
             )
@@ -67,18 +77,30 @@ class ObjectTypeMeta(type):
             if field._interface_resolver and field.name not in known_interface_resolvers:
                 known_interface_resolvers[field.name] = field._interface_resolver
 
-        fields += declared_fields
+        fields += maybe_callable(declared_fields)
         field_map = OrderedDict()
         field_attr_map = OrderedDict()
+        field_source = getattr(cls, '_field_source', None)
 
         for field_attr_name, field in fields:
             resolve_fn = (
                 field.resolver or
                 getattr(instance, 'resolve_{}'.format(field_attr_name), None) or
                 field._interface_resolver or
-                known_interface_resolvers.get(field.name) or
-                make_default_resolver(field_attr_name)
+                known_interface_resolvers.get(field.name)
             )
+            uses_default_resolver = resolve_fn is None
+            if uses_default_resolver:
+                resolve_fn = make_resolver_for_field_source(field_attr_name, field_source)
+
+            # The default resolver is only worth memoizing when asked for, as it may call a method of the source.
+            pure = field.pure or (not uses_default_resolver and is_pure(resolve_fn))
+            if field.cache is not None:
+                resolve_fn = field.cache.wrap(resolve_fn, type.name, field.name, field.key)
+
+            # Within a request, the memo is cheaper to look values up in than the cache.
+            if pure:
+                resolve_fn = memoize_resolver(resolve_fn, type.name, field.name)
 
             # In the case where field definitions are duplicated, we are going to use the latest definition.
             # We delete, so that when inserted into the OrderedMap again, it will be ordered last, instead
@@ -86,7 +108,7 @@ class ObjectTypeMeta(type):
             if field.name in field_map:
                 del field_map[field.name]
 
-            graphql_field = field.to_field(registry, resolve_fn)
+            graphql_field = field.to_field(registry, resolve_fn, translate_arguments=not uses_default_resolver)
             field_map[field.name] = graphql_field
 
             if field_attr_name in field_attr_map:
@@ -95,8 +117,28 @@ class ObjectTypeMeta(type):
             field_attr_map[field_attr_name] = graphql_field
 
         cls._field_attr_map = field_attr_map
+        if should_generate_init(cls, ObjectTypeBase.__init__) and can_generate_init(field_attr_map):
+            cls.__init__ = make_object_type_init(type.name, field_attr_map)
+
         return field_map
 
+    @classmethod
+    def _get_slot_names(mcs, registry, field_attrs, bases):
+        """
+        Returns the names of the fields of the type, including the ones of its interfaces, which therefore have to be
+        defined before it, leaving out the ones that already have a slot in one of the bases.
+        """
+        names = set(field_attrs)
+        for interface in maybe_callable(mcs._get_interfaces()) or ():
+            names.update(field_attr_name for field_attr_name, field in registry._get_interface_declared_fields(interface))
+
+        for base in bases:
+            for klass in base.__mro__:
+                base_slots = klass.__dict__.get('__slots__', ())
+                names.difference_update((base_slots,) if isinstance(base_slots, six.string_types) else base_slots)
+
+        return tuple(sorted(names))
+
     @staticmethod
     def _get_interfaces():
         return None
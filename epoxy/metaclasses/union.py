@@ -6,15 +6,17 @@ class UnionMeta(type):
         if attrs.pop('abstract', False):
             return super(UnionMeta, mcs).__new__(mcs, name, bases, attrs)
 
+        registry = mcs._get_registry()
         union_type = GraphQLUnionType(
             name,
             types=mcs._get_types(),
             description=attrs.get('__doc__'),
         )
+        union_type._resolve_type = registry._create_resolve_type(union_type)
         mcs._register(union_type)
         cls = super(UnionMeta, mcs).__new__(mcs, name, bases, attrs)
         cls.T = union_type
-        cls._registry = mcs._get_registry()
+        cls._registry = registry
 
         return cls
 
@@ -0,0 +1,136 @@
+"""
+Opt-in instrumentation of how long a `TypeRegistry` spends building its types.
+
+Enable it with `TypeRegistry(profile=True)`, or by setting the `EPOXY_PROFILE_BUILD` environment variable before the
+registry is created, then inspect `R.profiler.report()`. The report for a module can also be dumped from the command
+line:
+
+    python -m epoxy.build_report my_app.schema:R --query Query
+
+Timings are inclusive, so a phase that triggers another one (e.g. `declare` of a mutation creating its input type)
+includes the time spent in the nested phase as well.
+"""
+import os
+from collections import OrderedDict, defaultdict
+from functools import wraps
+from timeit import default_timer
+
+PROFILE_ENV_VAR = 'EPOXY_PROFILE_BUILD'
+
+# The phases that a registry records.
+DECLARE = 'declare'
+DECLARED_FIELDS = 'declared_fields'
+RESOLVE_THUNK = 'resolve_thunk'
+BUILD_FIELD_MAP = 'build_field_map'
+ADD_IMPL_TO_INTERFACES = 'add_impl_to_interfaces'
+SCHEMA = 'schema'
+
+
+def profiling_enabled_by_env():
+    return os.environ.get(PROFILE_ENV_VAR, '').lower() not in ('', '0', 'false', 'no')
+
+
+class _Measurement(object):
+    __slots__ = 'profiler', 'phase', 'type_name', 'start'
+
+    def __init__(self, profiler, phase, type_name):
+        self.profiler = profiler
+        self.phase = phase
+        self.type_name = type_name
+        self.start = None
+
+    def __enter__(self):
+        self.start = self.profiler._clock()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profiler.add(self.phase, self.type_name, self.profiler._clock() - self.start)
+
+
+class _NullMeasurement(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+null_measurement = _NullMeasurement()
+
+
+class BuildProfiler(object):
+    def __init__(self, clock=default_timer):
+        self._clock = clock
+        self._records = OrderedDict()
+
+    def measure(self, phase, type_name=None):
+        return _Measurement(self, phase, type_name)
+
+    def wrap(self, phase, type_name, fn):
+        """
+        Wraps `fn` so that every call to it is recorded under `phase`. `type_name` may either be a string or a
+        function that derives the type name from the arguments `fn` is called with.
+        """
+        get_type_name = type_name if callable(type_name) else None
+
+        @wraps(fn)
+        def wrapped(*args, **kwargs):
+            with self.measure(phase, get_type_name(*args, **kwargs) if get_type_name else type_name):
+                return fn(*args, **kwargs)
+
+        return wrapped
+
+    def add(self, phase, type_name, seconds):
+        key = phase, type_name
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = [0, 0.0]
+
+        record[0] += 1
+        record[1] += seconds
+
+    def reset(self):
+        self._records.clear()
+
+    def report(self):
+        """
+        Returns a list of `{'phase', 'type', 'calls', 'seconds'}` dicts, one per phase and type, most expensive first.
+        """
+        records = [
+            OrderedDict([('phase', phase), ('type', type_name), ('calls', calls), ('seconds', seconds)])
+            for (phase, type_name), (calls, seconds) in self._records.items()
+        ]
+        records.sort(key=lambda r: r['seconds'], reverse=True)
+        return records
+
+    def totals_by_phase(self):
+        return self._totals('phase')
+
+    def totals_by_type(self):
+        return self._totals('type')
+
+    def _totals(self, group_by):
+        totals = defaultdict(lambda: OrderedDict([(group_by, None), ('calls', 0), ('seconds', 0.0)]))
+        for record in self.report():
+            total = totals[record[group_by]]
+            total[group_by] = record[group_by]
+            total['calls'] += record['calls']
+            total['seconds'] += record['seconds']
+
+        return sorted(totals.values(), key=lambda r: r['seconds'], reverse=True)
+
+    def format_report(self, limit=None):
+        lines = ['{:<24} {:<40} {:>8} {:>12}'.format('phase', 'type', 'calls', 'ms')]
+        for record in self.report()[:limit]:
+            lines.append('{:<24} {:<40} {:>8} {:>12.3f}'.format(
+                record['phase'], record['type'] or '-', record['calls'], record['seconds'] * 1000
+            ))
+
+        lines.append('')
+        lines.append('{:<24} {:>49} {:>12}'.format('phase totals', 'calls', 'ms'))
+        for total in self.totals_by_phase():
+            lines.append('{:<24} {:>49} {:>12.3f}'.format(total['phase'], total['calls'], total['seconds'] * 1000))
+
+        return '\n'.join(lines)
@@ -16,7 +16,7 @@ from graphql.core.type import (
     GraphQLString,
     GraphQLUnionType
 )
-from graphql.core.type.definition import GraphQLType, get_named_type
+from graphql.core.type.definition import GraphQLType, get_named_type, get_type_of
 import six
 from .bases.class_type_creator import ClassTypeCreator
 from .bases.input_type import InputTypeBase
@@ -29,12 +29,19 @@ from .metaclasses.mutation import MutationMeta
 from .metaclasses.object_type import ObjectTypeMeta
 from .metaclasses.scalar import ScalarMeta
 from .metaclasses.union import UnionMeta
+from .profiler import (ADD_IMPL_TO_INTERFACES, DECLARE, DECLARED_FIELDS, RESOLVE_THUNK, SCHEMA, BuildProfiler,
+                       null_measurement, profiling_enabled_by_env)
+from .schema_cache import rehydrated_schema
 from .types.argument import Argument
 from .types.field import Field, InputField
 from .utils.enum_to_graphql_enum import enum_to_graphql_enum
+from .utils.get_declared_fields import get_declared_fields, get_declared_fields_lazily
+from .utils.maybe_callable import maybe_callable
 from .utils.maybe_t import maybe_t
 from .utils.method_dispatch import method_dispatch
-from .utils.thunk import AttributeTypeThunk, IdentityTypeThunk, RootTypeThunk, ThunkList, TransformThunkList
+from .utils.thunk import (AttributeTypeThunk, FrozenRootTypeThunk, IdentityTypeThunk, RootTypeThunk, ThunkList,
+                          TransformThunkList)
+from .utils.weak_ref_holder import WeakRefHolder
 
 builtin_scalars = [
     GraphQLBoolean,
@@ -61,14 +68,30 @@ class TypeRegistry(object):
     InputField = InputField
     Argument = Argument
 
-    def __init__(self):
+    def __init__(self, profile=None, lazy=False):
+        if profile is None:
+            profile = profiling_enabled_by_env()
+
+        self.profiler = BuildProfiler() if profile else None
+        if self.profiler:
+            self._resolve_type = self.profiler.wrap(RESOLVE_THUNK, _thunk_type_name, self._resolve_type)
+            self._add_impl_to_interfaces = self.profiler.wrap(ADD_IMPL_TO_INTERFACES, None, self._add_impl_to_interfaces)
+
+        self._lazy = lazy
+        self._pinned_types = []
+        self._reachable_type_names = set()
         self._registered_types = OrderedDict()
         self._added_impl_types = set()
         self._interface_declared_fields = {}
+        self._input_type_classes = {}
         self._registered_types_can_be = defaultdict(set)
         self._pending_types_can_be = defaultdict(set)
+        self._types_by_class = {}
+        self._resolved_types_by_class = {}
         self._proxy = ResolvedRegistryProxy(self)
         self._mutations = OrderedDict()
+        self._frozen_thunks = None
+        self._rehydrated_schema = None
         self.ObjectType = self._create_object_type_class()
         self.InputType = self._create_input_type_class()
         self.Implements = ClassTypeCreator(self, self._create_object_type_class)
@@ -99,6 +122,7 @@ class TypeRegistry(object):
         if t.name in self._registered_types and self._registered_types[t.name] is t:
             return t
 
+        self._assert_not_frozen('register type "{}"'.format(t.name))
         assert not t.name.startswith('_'), \
             'Registered type name cannot start with an "_".'
         assert t.name not in self._reserved_names, \
@@ -138,12 +162,18 @@ class TypeRegistry(object):
         if item.startswith('_'):
             raise AttributeError(item)
 
+        if self._frozen_thunks is not None and item in self._frozen_thunks:
+            return self._frozen_thunks[item]
+
         return RootTypeThunk(self, self._resolve_type, item)
 
     def __getitem__(self, item):
         if isinstance(item, tuple):
             return ThunkList([AttributeTypeThunk(self._resolve_type, i) for i in item])
 
+        if self._frozen_thunks is not None and isinstance(item, six.string_types) and item in self._frozen_thunks:
+            return self._frozen_thunks[item]
+
         return RootTypeThunk(self, self._resolve_type, item)
 
     def __call__(self, t):
@@ -153,10 +183,14 @@ class TypeRegistry(object):
         registry = self
 
         class RegistryObjectTypeMeta(ObjectTypeMeta):
+            def __new__(mcs, name, bases, attrs):
+                with registry._profile(DECLARE, attrs.get('_name', name)):
+                    return super(RegistryObjectTypeMeta, mcs).__new__(mcs, name, bases, attrs)
+
             @staticmethod
             def _register(object_type, type_class):
                 registry.Register(object_type)
-                registry._registered_types_can_be[object_type].add(type_class)
+                registry._add_possible_type(object_type, type_class)
 
             @staticmethod
             def _get_registry():
@@ -171,6 +205,7 @@ class TypeRegistry(object):
 
         @six.add_metaclass(RegistryObjectTypeMeta)
         class ObjectType(ObjectTypeBase):
+            __slots__ = ()
             abstract = True
 
         return ObjectType
@@ -179,6 +214,10 @@ class TypeRegistry(object):
         registry = self
 
         class RegistryInterfaceMeta(InterfaceMeta):
+            def __new__(mcs, name, bases, attrs):
+                with registry._profile(DECLARE, attrs.get('_name', name)):
+                    return super(RegistryInterfaceMeta, mcs).__new__(mcs, name, bases, attrs)
+
             @staticmethod
             def _register(interface, declared_fields):
                 registry.Register(interface)
@@ -197,6 +236,10 @@ class TypeRegistry(object):
         registry = self
 
         class RegistryUnionMeta(UnionMeta):
+            def __new__(mcs, name, bases, attrs):
+                with registry._profile(DECLARE, attrs.get('_name', name)):
+                    return super(RegistryUnionMeta, mcs).__new__(mcs, name, bases, attrs)
+
             @staticmethod
             def _register(union):
                 registry.Register(union)
@@ -218,9 +261,14 @@ class TypeRegistry(object):
         registry = self
 
         class RegistryInputTypeMeta(InputTypeMeta):
+            def __new__(mcs, name, bases, attrs):
+                with registry._profile(DECLARE, attrs.get('_name', name)):
+                    return super(RegistryInputTypeMeta, mcs).__new__(mcs, name, bases, attrs)
+
             @staticmethod
-            def _register(input_type):
+            def _register(input_type, cls):
                 registry.Register(input_type)
+                registry._input_type_classes[input_type] = WeakRefHolder(cls)
 
             @staticmethod
             def _get_registry():
@@ -228,6 +276,7 @@ class TypeRegistry(object):
 
         @six.add_metaclass(RegistryInputTypeMeta)
         class InputType(InputTypeBase):
+            __slots__ = ()
             abstract = True
 
         return InputType
@@ -236,6 +285,10 @@ class TypeRegistry(object):
         registry = self
 
         class RegistryScalarMeta(ScalarMeta):
+            def __new__(mcs, name, bases, attrs):
+                with registry._profile(DECLARE, attrs.get('_name', name)):
+                    return super(RegistryScalarMeta, mcs).__new__(mcs, name, bases, attrs)
+
             @staticmethod
             def _register(scalar):
                 registry.Register(scalar)
@@ -254,6 +307,10 @@ class TypeRegistry(object):
         registry = self
 
         class RegistryMutationMeta(MutationMeta):
+            def __new__(mcs, name, bases, attrs):
+                with registry._profile(DECLARE, attrs.get('_name', name)):
+                    return super(RegistryMutationMeta, mcs).__new__(mcs, name, bases, attrs)
+
             @staticmethod
             def _register(mutation_name, mutation):
                 registry._register_mutation(mutation_name, mutation)
@@ -269,6 +326,7 @@ class TypeRegistry(object):
         return Mutation
 
     def _register_mutation(self, mutation_name, mutation):
+        self._assert_not_frozen('register mutation "{}"'.format(mutation_name))
         assert mutation_name not in self._mutations, \
             'There is already a registered mutation named "{}".'.format(mutation_name)
 
@@ -283,6 +341,7 @@ class TypeRegistry(object):
         if existing_mutation_type:
             return IdentityTypeThunk(existing_mutation_type)
 
+        self._assert_not_frozen('create the "Mutations" type')
         mutations = GraphQLObjectType(
             name='Mutations',
             fields=lambda: OrderedDict([(k, v()) for k, v in sorted(self._mutations.items(), key=itemgetter(0))])
@@ -294,29 +353,80 @@ class TypeRegistry(object):
         return partial(self._is_type_of, type)
 
     def _is_type_of(self, type, obj, info):
-        return obj.__class__ in self._registered_types_can_be[type]
+        return type in self._get_types_for_class(obj.__class__)
+
+    def _create_resolve_type(self, abstract_type):
+        return partial(self._resolve_abstract_type, abstract_type)
+
+    def _resolve_abstract_type(self, abstract_type, obj, info):
+        for type in self._get_types_for_class(obj.__class__):
+            if abstract_type.is_possible_type(type):
+                return type
+
+        # The object isn't known to the registry, but a type that was not created by epoxy might still claim it.
+        return get_type_of(obj, info, abstract_type)
+
+    def _get_types_for_class(self, klass):
+        types = self._resolved_types_by_class.get(klass)
+        if types is not None:
+            return types
+
+        # Classes that were not registered themselves can still be of a type through one of their bases.
+        for base in klass.__mro__:
+            types = self._types_by_class.get(base)
+            if types:
+                break
+
+        else:
+            types = ()
+
+        self._resolved_types_by_class[klass] = types
+        return types
+
+    def _add_possible_type(self, type, klass):
+        self._registered_types_can_be[type].add(klass)
+        types = self._types_by_class.get(klass, ())
+        if type not in types:
+            self._types_by_class[klass] = types + (type,)
+            self._resolved_types_by_class.clear()
 
     def _add_interface_declared_fields(self, interface, attrs):
         self._interface_declared_fields[interface] = attrs
 
+    def _get_input_type_class(self, input_type):
+        class_ref = self._input_type_classes.get(input_type)
+        return class_ref and class_ref.get()
+
     def _get_interface_declared_fields(self, interface):
-        return self._interface_declared_fields.get(interface, {})
+        return maybe_callable(self._interface_declared_fields.get(interface, []))
+
+    def _declare_fields(self, type_name, attrs, field_class=Field):
+        if self._lazy:
+            # Collecting the fields is deferred until the type's field map is built, if it ever is.
+            return get_declared_fields_lazily(
+                type_name, attrs, field_class, collect=self._profiled(DECLARED_FIELDS, type_name, get_declared_fields)
+            )
+
+        with self._profile(DECLARED_FIELDS, type_name):
+            return get_declared_fields(type_name, attrs, field_class)
 
     def _register_possible_type_for(self, type_name, klass):
+        self._assert_not_frozen('register {} as a possible type for "{}"'.format(klass, type_name))
         type = self._registered_types.get(type_name)
         if type:
-            self._registered_types_can_be[type].add(klass)
+            self._add_possible_type(type, klass)
 
         else:
             self._pending_types_can_be[type_name].add(klass)
 
-    def _add_impl_to_interfaces(self):
-        for type in self._registered_types.values():
+    def _add_impl_to_interfaces(self, types=None):
+        for type in types if types is not None else list(self._registered_types.values()):
             if not isinstance(type, GraphQLObjectType):
                 continue
 
             if type.name in self._pending_types_can_be:
-                self._registered_types_can_be[type] |= self._pending_types_can_be.pop(type.name)
+                for klass in self._pending_types_can_be.pop(type.name):
+                    self._add_possible_type(type, klass)
 
             if type in self._added_impl_types:
                 continue
@@ -329,11 +439,116 @@ class TypeRegistry(object):
                 interface._impls.append(type)
 
     def Schema(self, query, mutation=None, subscription=None):
-        query = self[query]()
-        mutation = self[mutation]()
-        subscription = self[subscription]()
-        self._add_impl_to_interfaces()
-        return GraphQLSchema(query=query, mutation=mutation, subscription=subscription)
+        with self._profile(SCHEMA):
+            query = self[query]()
+            mutation = self[mutation]()
+            subscription = self[subscription]()
+            schema = rehydrated_schema(self._registered_types, query, mutation, subscription)
+            if schema is not None:
+                # The schema was loaded from a cache, which is importing this module for its resolvers. Rather than
+                # building it again, the types build their field maps as they get constructed.
+                self._rehydrated_schema = schema
+                return schema
+
+            if self._lazy:
+                pinned_types = [self[t]() for t in self._pinned_types]
+                self._add_impl_to_interfaces(self._collect_reachable_types([query, mutation, subscription] + pinned_types))
+
+            else:
+                self._add_impl_to_interfaces()
+
+            return GraphQLSchema(query=query, mutation=mutation, subscription=subscription)
+
+    def pin(self, *types):
+        """
+        Makes sure that the given types end up in schemas created by a lazy registry, even if they are not reachable
+        from the schema's root types (e.g. implementations of an interface that are only ever returned through it).
+        """
+        self._pinned_types.extend(types)
+        return types[0] if len(types) == 1 else types
+
+    def _collect_reachable_types(self, roots):
+        reachable = set()
+        pending = [get_named_type(t) for t in roots if t is not None]
+
+        while pending:
+            type = pending.pop()
+            if type.name in reachable:
+                continue
+
+            reachable.add(type.name)
+            if isinstance(type, GraphQLUnionType):
+                pending += type.get_possible_types()
+
+            if isinstance(type, GraphQLObjectType):
+                pending += type.get_interfaces()
+
+            if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)):
+                for field in type.get_fields().values():
+                    pending.append(get_named_type(field.type))
+                    pending += [get_named_type(arg.type) for arg in getattr(field, 'args', None) or ()]
+
+        self._reachable_type_names |= reachable
+        return [t for t in self._registered_types.values() if t.name in reachable]
+
+    def _profile(self, phase, type_name=None):
+        if self.profiler is None:
+            return null_measurement
+
+        return self.profiler.measure(phase, type_name)
+
+    def _profiled(self, phase, type_name, fn):
+        if self.profiler is None:
+            return fn
+
+        return self.profiler.wrap(phase, type_name, fn)
+
+    def freeze(self):
+        """
+        Resolves every thunk held by the registered types and makes the registry read-only. Afterwards, registering
+        anything raises a `RuntimeError`, and looking up a registered type by name is a plain dict lookup.
+        """
+        if self._frozen_thunks is not None:
+            return self
+
+        if self._lazy:
+            # Only the types that made it into a schema are materialized, the rest are left as they are.
+            types = [t for t in self._registered_types.values() if t.name in self._reachable_type_names]
+
+        else:
+            self._add_impl_to_interfaces()
+            types = self._registered_types.values()
+
+        for type in types:
+            self._freeze_type(type)
+
+        self._frozen_thunks = dict(
+            (name, FrozenRootTypeThunk(self, type)) for name, type in self._registered_types.items()
+        )
+        return self
+
+    @property
+    def frozen(self):
+        return self._frozen_thunks is not None
+
+    @staticmethod
+    def _freeze_type(type):
+        # Replace the lazy field/type thunks (and the metaclass partials they hold on to) with the resolved values.
+        if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)):
+            type._fields = type.get_fields()
+
+        if isinstance(type, GraphQLObjectType):
+            type._provided_interfaces = type.get_interfaces()
+
+        elif isinstance(type, GraphQLUnionType):
+            type._types = type.get_possible_types()
+
+        if isinstance(type, (GraphQLInterfaceType, GraphQLUnionType)):
+            type._possible_type_names = set(t.name for t in type.get_possible_types())
+
+    def _assert_not_frozen(self, action):
+        if self._frozen_thunks is not None:
+            raise RuntimeError('Unable to {}, the registry has been frozen.'.format(action))
 
     def Mixin(self, mixin_cls, *args, **kwargs):
         mixin = mixin_cls(self, *args, **kwargs)
@@ -351,6 +566,13 @@ class TypeRegistry(object):
         return partial(thunk, self._proxy)
 
 
+def _thunk_type_name(item):
+    if item is None or isinstance(item, str):
+        return item
+
+    return str(maybe_t(item))
+
+
 class ResolvedRegistryProxy(object):
     def __init__(self, registry):
         self._registry = registry
@@ -0,0 +1,615 @@
+"""
+On-disk cache of a fully built schema, so that workers can skip building it at boot.
+
+The cache holds the resolved type graph (names, descriptions, fields, arguments, enum values, interface and union
+membership) along with references to resolvers by import path. It is keyed by a hash of the source of the modules
+that declare the schema, so editing any of them invalidates it:
+
+    cache = SchemaCache('/var/cache/my_app/schema.cache', modules=['my_app.schema'])
+    schema = cache.get_or_build(lambda: importlib.import_module('my_app.schema').Schema)
+
+Loading a cached schema doesn't import the declaring modules. Resolvers (and the functions of custom scalars) that
+live in them are imported the first time they are called, after which the field calls them directly. While one of
+those imports runs, `TypeRegistry.Schema()` hands back the cached schema instead of building it again, and the types
+of that registry only build their field maps once they get constructed.
+
+Only schemas whose resolvers can be found by import path can be cached: module level functions, methods of module
+level classes, the default resolvers epoxy creates and the wrappers it puts around resolvers (to translate arguments
+or memoize them). Anything else (lambdas, closures, classes defined inside of functions...) raises
+`UnsupportedSchemaError` when dumping, and `get_or_build` simply doesn't cache the schema.
+"""
+import hashlib
+import importlib
+import marshal
+import os
+import pkgutil
+import sys
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+
+from graphql.core.type import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLEnumType,
+    GraphQLEnumValue,
+    GraphQLField,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInputObjectField,
+    GraphQLInputObjectType,
+    GraphQLInt,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLString,
+    GraphQLUnionType
+)
+from graphql.core.type.definition import get_type_of
+import six
+from .bases.object_type import ObjectTypeBase
+from .memoize import memoize_resolver
+from .utils.make_default_resolver import make_resolver_for_field_source
+from .utils.wrap_resolver_translating_arguments import wrap_resolver_translating_arguments
+
+CACHE_FORMAT_VERSION = 2
+
+builtin_scalars = dict((t.name, t) for t in (GraphQLBoolean, GraphQLFloat, GraphQLID, GraphQLInt, GraphQLString))
+primitive_types = six.string_types + six.integer_types + (float, bool, type(None), six.binary_type, six.text_type)
+
+
+class UnsupportedSchemaError(ValueError):
+    pass
+
+
+# Schemas loaded from a cache whose declaring modules are being imported, to find their resolvers.
+_rehydrating_schemas = []
+
+
+@contextmanager
+def _rehydrating(schema):
+    if schema is None:
+        yield
+        return
+
+    _rehydrating_schemas.append(schema)
+    try:
+        yield
+
+    finally:
+        _rehydrating_schemas.remove(schema)
+
+
+def _root_type_names(schema):
+    roots = schema.get_query_type(), schema.get_mutation_type(), schema.get_subscription_type()
+    return tuple(t and t.name for t in roots)
+
+
+def rehydrated_schema(registered_types, query, mutation=None, subscription=None):
+    """
+    Returns the schema being loaded from a cache that has the given root types, if all of its types are among
+    `registered_types` (by name), and its declaring modules are being imported. Otherwise returns `None`.
+    """
+    roots = tuple(t and t.name for t in (query, mutation, subscription))
+    for schema in _rehydrating_schemas:
+        if _root_type_names(schema) == roots and all(
+            name in registered_types for name in schema.get_type_map()
+            if not name.startswith('__') and name not in builtin_scalars
+        ):
+            return schema
+
+    return None
+
+
+def _qualname(obj):
+    return getattr(obj, '__qualname__', obj.__name__)
+
+
+def _encode_path(obj):
+    module, qualname = obj.__module__, _qualname(obj)
+    if '<' in qualname or module in (None, '__main__'):
+        raise UnsupportedSchemaError('{!r} cannot be referenced by its import path.'.format(obj))
+
+    # Wrappers can carry the name of what they wrap, which then leads somewhere else.
+    try:
+        found = _import_path(module, qualname)
+
+    except (ImportError, AttributeError):
+        found = None
+
+    if found is not obj:
+        raise UnsupportedSchemaError('{!r} cannot be found at its import path {}.{}.'.format(obj, module, qualname))
+
+    return module, qualname
+
+
+def _encode_value(value):
+    if isinstance(value, primitive_types):
+        return value
+
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v) for v in value]
+
+    if isinstance(value, dict):
+        return dict((_encode_value(k), _encode_value(v)) for k, v in value.items())
+
+    raise UnsupportedSchemaError('Unable to cache the value {!r}.'.format(value))
+
+
+def _encode_callable(fn):
+    """
+    Describes `fn` as nested tuples of primitives, so it can be re-created by `_decode_callable`.
+    """
+    if fn is None:
+        return None
+
+    default_resolver_for = getattr(fn, '_default_resolver_for', None)
+    if default_resolver_for:
+        return ('default',) + tuple(default_resolver_for)
+
+    translation_plan = getattr(fn, '_translation_plan', None)
+    if translation_plan:
+        return 'translate', [list(p) for p in translation_plan], _encode_callable(fn._translated_resolver)
+
+    memoized_field = getattr(fn, '_memoized_field', None)
+    if memoized_field:
+        return ('memoize',) + tuple(memoized_field) + (_encode_callable(fn._memoized_resolver),)
+
+    if isinstance(fn, partial):
+        return (
+            'partial',
+            _encode_callable(fn.func),
+            [_encode_argument(a) for a in fn.args],
+            dict((k, _encode_argument(v)) for k, v in (fn.keywords or {}).items())
+        )
+
+    bound_to = getattr(fn, '__self__', None)
+    if bound_to is not None and not isinstance(bound_to, type) and not isinstance(bound_to, type(sys)):
+        return ('method',) + _encode_path(bound_to.__class__) + (fn.__name__,)
+
+    if isinstance(fn, type):
+        return ('class',) + _encode_path(fn)
+
+    if callable(fn) and hasattr(fn, '__module__') and hasattr(fn, '__name__'):
+        return ('function',) + _encode_path(fn)
+
+    raise UnsupportedSchemaError('Unable to cache a reference to {!r}.'.format(fn))
+
+
+def _encode_argument(value):
+    if isinstance(value, primitive_types):
+        return 'value', value
+
+    return _encode_callable(value)
+
+
+def _needs_import(spec):
+    if not isinstance(spec, (list, tuple)) or not spec:
+        return False
+
+    kind = spec[0]
+    if kind in ('method', 'function', 'class'):
+        return True
+
+    if kind == 'translate':
+        return _needs_import(spec[2])
+
+    if kind == 'memoize':
+        return _needs_import(spec[3])
+
+    if kind == 'partial':
+        return _needs_import(spec[1]) or any(_needs_import(a) for a in spec[2]) or \
+            any(_needs_import(a) for a in spec[3].values())
+
+    return False
+
+
+def _import_path(module, qualname):
+    obj = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+def _decode_callable(spec):
+    if spec is None:
+        return None
+
+    kind = spec[0]
+    if kind == 'value':
+        return spec[1]
+
+    if kind == 'default':
+        return make_resolver_for_field_source(spec[1], spec[2])
+
+    if kind == 'translate':
+        return wrap_resolver_translating_arguments(_decode_callable(spec[2]), tuple(tuple(p) for p in spec[1]))
+
+    if kind == 'memoize':
+        return memoize_resolver(_decode_callable(spec[3]), spec[1], spec[2])
+
+    if kind == 'partial':
+        return partial(
+            _decode_callable(spec[1]),
+            *[_decode_callable(a) for a in spec[2]],
+            **dict((k, _decode_callable(v)) for k, v in spec[3].items())
+        )
+
+    if kind == 'method':
+        cls = _import_path(spec[1], spec[2])
+        instance = cls(__field_map_init=True) if issubclass(cls, ObjectTypeBase) else cls()
+        return getattr(instance, spec[3])
+
+    if kind in ('function', 'class'):
+        return _import_path(spec[1], spec[2])
+
+    raise ValueError('Unknown callable reference {!r}.'.format(spec))
+
+
+class LazyCallable(object):
+    """
+    Stands in for a callable that lives in a module that hasn't been imported yet. When used as the resolver of a
+    field, it replaces itself on the field once loaded.
+    """
+    __slots__ = 'spec', 'fn', 'field', 'schema'
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.fn = None
+        self.field = None
+        self.schema = None
+
+    def __call__(self, *args, **kwargs):
+        fn = self.fn
+        if fn is None:
+            with _rehydrating(self.schema):
+                fn = self.fn = _decode_callable(self.spec)
+
+            if self.field is not None:
+                self.field.resolver = fn
+
+        return fn(*args, **kwargs)
+
+
+def _load_callable(spec):
+    if _needs_import(spec):
+        return LazyCallable(spec)
+
+    return _decode_callable(spec)
+
+
+def _encode_type_ref(type):
+    if isinstance(type, GraphQLNonNull):
+        return 'non_null', _encode_type_ref(type.of_type)
+
+    if isinstance(type, GraphQLList):
+        return 'list', _encode_type_ref(type.of_type)
+
+    return type.name
+
+
+def _encode_fields(type):
+    fields = []
+    for name, field in type.get_fields().items():
+        fields.append({
+            'name': name,
+            'type': _encode_type_ref(field.type),
+            'description': field.description,
+            'deprecation_reason': field.deprecation_reason,
+            'resolver': _encode_callable(field.resolver),
+            'args': [{
+                'name': arg.name,
+                'type': _encode_type_ref(arg.type),
+                'default_value': _encode_value(arg.default_value),
+                'description': arg.description,
+            } for arg in field.args]
+        })
+
+    return fields
+
+
+def _encode_possible_classes(type):
+    is_type_of = type.is_type_of
+    if is_type_of is None:
+        return None, None
+
+    owner = getattr(getattr(is_type_of, 'func', None), '__self__', None)
+    if isinstance(owner, _ClassPathTypeTable):
+        return owner.get_paths(type), None
+
+    can_be = getattr(owner, '_registered_types_can_be', None)
+    if can_be is None:
+        return None, _encode_callable(is_type_of)
+
+    return sorted(_encode_path(klass) for klass in can_be.get(type, ())), None
+
+
+def serialize_schema(schema):
+    """
+    Turns a schema into plain data (dicts, lists and primitives) that `deserialize_schema` can build it back from.
+    """
+    types = []
+
+    for type in schema.get_type_map().values():
+        if type.name.startswith('__') or type.name in builtin_scalars:
+            continue
+
+        data = {'name': type.name, 'description': type.description}
+        if isinstance(type, GraphQLObjectType):
+            classes, is_type_of = _encode_possible_classes(type)
+            data.update(kind='object', fields=_encode_fields(type), classes=classes, is_type_of=is_type_of,
+                        interfaces=[i.name for i in type.get_interfaces()])
+
+        elif isinstance(type, GraphQLInterfaceType):
+            data.update(kind='interface', fields=_encode_fields(type))
+
+        elif isinstance(type, GraphQLUnionType):
+            data.update(kind='union', types=[t.name for t in type.get_possible_types()])
+
+        elif isinstance(type, GraphQLInputObjectType):
+            data.update(kind='input_object', fields=[{
+                'name': name,
+                'type': _encode_type_ref(field.type),
+                'default_value': _encode_value(field.default_value),
+                'description': field.description,
+            } for name, field in type.get_fields().items()])
+
+        elif isinstance(type, GraphQLEnumType):
+            data.update(kind='enum', values=[{
+                'name': value.name,
+                'value': _encode_value(value.value),
+                'deprecation_reason': value.deprecation_reason,
+                'description': value.description,
+            } for value in type.get_values()])
+
+        elif isinstance(type, GraphQLScalarType):
+            data.update(kind='scalar', serialize=_encode_callable(type._serialize),
+                        parse_value=_encode_callable(type._parse_value),
+                        parse_literal=_encode_callable(type._parse_literal))
+
+        else:
+            raise UnsupportedSchemaError('Unable to cache type {!r}.'.format(type))
+
+        types.append(data)
+
+    return {
+        'types': types,
+        'query': schema.get_query_type().name,
+        'mutation': schema.get_mutation_type() and schema.get_mutation_type().name,
+        'subscription': schema.get_subscription_type() and schema.get_subscription_type().name,
+    }
+
+
+class _ClassPathTypeTable(object):
+    """
+    Resolves the runtime type of an object from the import path of its class (or one of its bases), without needing
+    the classes to be imported.
+    """
+
+    def __init__(self):
+        self.types_by_path = {}
+        self.types_by_class = {}
+
+    def add(self, type, path):
+        self.types_by_path.setdefault(tuple(path), []).append(type)
+
+    def get_paths(self, type):
+        return sorted(path for path, types in self.types_by_path.items() if type in types)
+
+    def get_types(self, klass):
+        types = self.types_by_class.get(klass)
+        if types is None:
+            types = ()
+            for base in klass.__mro__:
+                types = self.types_by_path.get((base.__module__, _qualname(base)))
+                if types:
+                    break
+
+            types = self.types_by_class[klass] = tuple(types or ())
+
+        return types
+
+    def is_type_of(self, type, obj, info):
+        return type in self.get_types(obj.__class__)
+
+    def resolve_type(self, abstract_type, obj, info):
+        for type in self.get_types(obj.__class__):
+            if abstract_type.is_possible_type(type):
+                return type
+
+        return get_type_of(obj, info, abstract_type)
+
+
+def deserialize_schema(data):
+    types = dict(builtin_scalars)
+    table = _ClassPathTypeTable()
+    lazy_callables = []
+
+    def get_type(ref):
+        if isinstance(ref, six.string_types):
+            return types[ref]
+
+        kind, of_type = ref
+        if kind == 'non_null':
+            return GraphQLNonNull(get_type(of_type))
+
+        return GraphQLList(get_type(of_type))
+
+    def load_callable(spec):
+        fn = _load_callable(spec)
+        if isinstance(fn, LazyCallable):
+            lazy_callables.append(fn)
+
+        return fn
+
+    def build_fields(fields):
+        return OrderedDict((field['name'], GraphQLField(
+            get_type(field['type']),
+            args=OrderedDict((arg['name'], GraphQLArgument(
+                get_type(arg['type']), arg['default_value'], arg['description']
+            )) for arg in field['args']) or None,
+            resolver=load_callable(field['resolver']),
+            deprecation_reason=field['deprecation_reason'],
+            description=field['description']
+        )) for field in fields)
+
+    def build_input_fields(fields):
+        return OrderedDict((field['name'], GraphQLInputObjectField(
+            get_type(field['type']), field['default_value'], field['description']
+        )) for field in fields)
+
+    for type_data in data['types']:
+        kind = type_data['kind']
+        name, description = type_data['name'], type_data['description']
+
+        if kind == 'object':
+            type = GraphQLObjectType(
+                name,
+                fields=partial(build_fields, type_data['fields']),
+                interfaces=partial(lambda names: [types[n] for n in names], type_data['interfaces']),
+                description=description
+            )
+            if type_data['classes'] is not None:
+                type.is_type_of = partial(table.is_type_of, type)
+                for path in type_data['classes']:
+                    table.add(type, path)
+
+            elif type_data['is_type_of'] is not None:
+                type.is_type_of = load_callable(type_data['is_type_of'])
+
+        elif kind == 'interface':
+            type = GraphQLInterfaceType(name, fields=partial(build_fields, type_data['fields']),
+                                        description=description)
+            type.type_resolver = partial(table.resolve_type, type)
+
+        elif kind == 'union':
+            type = GraphQLUnionType(name, types=partial(lambda names: [types[n] for n in names], type_data['types']),
+                                    description=description)
+            type._resolve_type = partial(table.resolve_type, type)
+
+        elif kind == 'input_object':
+            type = GraphQLInputObjectType(name, fields=partial(build_input_fields, type_data['fields']),
+                                          description=description)
+
+        elif kind == 'enum':
+            type = GraphQLEnumType(name, values=OrderedDict(
+                (value['name'], GraphQLEnumValue(value['value'], value['deprecation_reason'], value['description']))
+                for value in type_data['values']
+            ), description=description)
+
+        else:
+            type = GraphQLScalarType(
+                name,
+                description=description,
+                serialize=load_callable(type_data['serialize']),
+                parse_value=load_callable(type_data['parse_value']),
+                parse_literal=load_callable(type_data['parse_literal'])
+            )
+
+        types[name] = type
+
+    for type in types.values():
+        if isinstance(type, GraphQLObjectType):
+            for interface in type.get_interfaces():
+                interface._impls.append(type)
+
+    schema = GraphQLSchema(
+        query=types[data['query']],
+        mutation=data['mutation'] and types[data['mutation']],
+        subscription=data['subscription'] and types[data['subscription']]
+    )
+
+    # Building the schema copied the fields, point the lazy resolvers at the copies so they can swap themselves out.
+    fields_by_resolver = dict(
+        (id(field.resolver), field)
+        for type in types.values() if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType))
+        for field in type.get_fields().values()
+    )
+    for fn in lazy_callables:
+        fn.field = fields_by_resolver.get(id(fn))
+        fn.schema = schema
+
+    return schema
+
+
+def _module_filename(module_name):
+    loader = pkgutil.get_loader(module_name)
+    if loader is None or not hasattr(loader, 'get_filename'):
+        raise ImportError('Unable to find the source of module "{}".'.format(module_name))
+
+    return loader.get_filename(module_name)
+
+
+class SchemaCache(object):
+    def __init__(self, path, modules):
+        self.path = path
+        self.modules = list(modules)
+
+    def key(self):
+        """
+        Hashes the source of the declaring modules, along with the versions of everything that affects the format.
+        """
+        digest = hashlib.sha1()
+        digest.update(repr((CACHE_FORMAT_VERSION, sys.version_info[:2], marshal.version)).encode('utf-8'))
+        for module_name in self.modules:
+            digest.update(module_name.encode('utf-8'))
+            with open(_module_filename(module_name), 'rb') as f:
+                digest.update(f.read())
+
+        return digest.hexdigest()
+
+    def load(self, key=None):
+        """
+        Returns the cached schema, or `None` if there's no cache or it is stale.
+        """
+        key = key or self.key()
+        try:
+            with open(self.path, 'rb') as f:
+                cached = marshal.load(f)
+
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get('key') != key:
+            return None
+
+        return deserialize_schema(cached['schema'])
+
+    def dump(self, schema, key=None):
+        data = marshal.dumps({'key': key or self.key(), 'schema': serialize_schema(schema)})
+
+        # Write to a temporary file first, so that concurrently booting workers never see a partial cache.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.epoxy-schema-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+            os.rename(tmp_path, self.path)
+
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def get_or_build(self, build):
+        """
+        Returns the cached schema if it is up to date, otherwise calls `build` to build it and caches the result.
+        """
+        key = self.key()
+        schema = self.load(key)
+        if schema is not None:
+            return schema
+
+        schema = build()
+        try:
+            self.dump(schema, key)
+
+        except UnsupportedSchemaError:
+            pass
+
+        return schema
@@ -4,25 +4,31 @@ from ..types.argument import Argument
 from ..utils.gen_id import gen_id
 from ..utils.thunk import TypeThunk
 from ..utils.to_camel_case import to_camel_case
-from ..utils.wrap_resolver_translating_arguments import wrap_resolver_translating_arguments
+from ..utils.wrap_resolver_translating_arguments import make_argument_translation_plan, wrap_resolver_translating_arguments
 
 
 class Field(object):
-    def __init__(self, type, description=None, args=None, name=None, resolver=None, _counter=None,
-                 _interface_resolver=None):
+    def __init__(self, type, description=None, args=None, name=None, resolver=None, pure=False, cache=None, key=None,
+                 _counter=None, _interface_resolver=None):
         self.name = name
         self.type = type
         self.description = description
         self.args = args
         self.resolver = resolver
+        # Whether the resolver's values are remembered within a request, see `epoxy.memoize`.
+        self.pure = pure
+        # Caches the field's values across requests, by `key(source, args)`, see `epoxy.field_cache`.
+        self.cache = cache
+        self.key = key
         self._interface_resolver = _interface_resolver
         self._counter = _counter or gen_id()
 
-    def to_field(self, registry, resolver):
-        args, arguments_to_original_case = self.get_arguments(registry)
+    def to_field(self, registry, resolver, translate_arguments=True):
+        args, translation_plan = self.get_arguments(registry)
 
-        if arguments_to_original_case:
-            resolver = wrap_resolver_translating_arguments(resolver, arguments_to_original_case)
+        # Resolvers that never look at their arguments (i.e. the default resolvers) don't need them translated.
+        if translation_plan and translate_arguments:
+            resolver = wrap_resolver_translating_arguments(resolver, translation_plan)
 
         return GraphQLField(registry[self.type](), args=args, resolver=resolver)
 
@@ -57,12 +63,10 @@ class Field(object):
                 key=lambda i: i[1]._counter
             )
 
-        # Remove things that wouldn't perform any meaningful translation.
-        for k, v in list(arguments_to_original_case.items()):
-            if k == v:
-                del arguments_to_original_case[k]
+        # Freeze the translation, leaving out things that wouldn't perform any meaningful translation.
+        translation_plan = make_argument_translation_plan(arguments_to_original_case)
 
-        return OrderedDict([(k, v.to_argument(registry)) for k, v in arguments]), arguments_to_original_case
+        return OrderedDict([(k, v.to_argument(registry)) for k, v in arguments]), translation_plan
 
 
 class InputField(object):
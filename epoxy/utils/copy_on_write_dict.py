@@ -0,0 +1,90 @@
+class CopyOnWriteDict(object):
+    """
+    A dict split into shards by the hash of its keys, whose `copy` shares the shards with the original. Either of
+    them copies a shard the first time it changes it, so changing a few keys of a copy only copies a few shards.
+    """
+    __slots__ = '_shards', '_owned', '_len'
+
+    def __init__(self, items=(), shard_count=64):
+        self._shards = [{} for _ in range(shard_count)]
+        # The indexes of the shards this dict may change in place, or None if it owns all of them.
+        self._owned = None
+        self._len = 0
+        for key, value in (items.items() if hasattr(items, 'items') else items):
+            self[key] = value
+
+    def copy(self):
+        copied = self.__class__.__new__(self.__class__)
+        copied._shards = self._shards[:]
+        copied._len = self._len
+        self._owned = set()
+        copied._owned = set()
+        return copied
+
+    def _shard_for(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _owned_shard_for(self, key):
+        i = hash(key) % len(self._shards)
+        owned = self._owned
+        if owned is not None and i not in owned:
+            self._shards[i] = dict(self._shards[i])
+            owned.add(i)
+
+        return self._shards[i]
+
+    def get(self, key, default=None):
+        return self._shard_for(key).get(key, default)
+
+    def __getitem__(self, key):
+        return self._shard_for(key)[key]
+
+    def __contains__(self, key):
+        return key in self._shard_for(key)
+
+    def __setitem__(self, key, value):
+        shard = self._owned_shard_for(key)
+        if key not in shard:
+            self._len += 1
+
+        shard[key] = value
+
+    def __delitem__(self, key):
+        shard = self._owned_shard_for(key)
+        del shard[key]
+        self._len -= 1
+
+    def update(self, items):
+        for key, value in (items.items() if hasattr(items, 'items') else items):
+            self[key] = value
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for shard in self._shards:
+            for key in shard:
+                yield key
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [value for shard in self._shards for value in shard.values()]
+
+    def items(self):
+        return [item for shard in self._shards for item in shard.items()]
+
+    def __eq__(self, other):
+        if isinstance(other, CopyOnWriteDict):
+            other = dict(other.items())
+
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, dict(self.items()))
@@ -35,3 +35,19 @@ def get_declared_fields(type_name, attrs, field_class=Field):
         seen_field_names.add(field.name)
 
     return fields
+
+
+def get_declared_fields_lazily(type_name, attrs, field_class=Field, collect=get_declared_fields):
+    """
+    Returns a thunk that collects the declared fields the first time it's called, and hands out the very same
+    fields on every call after that.
+    """
+    declared_fields = []
+
+    def thunk():
+        if not declared_fields:
+            declared_fields.append(collect(type_name, attrs, field_class))
+
+        return declared_fields[0]
+
+    return thunk
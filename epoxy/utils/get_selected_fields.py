@@ -0,0 +1,33 @@
+from graphql.core.language import ast
+
+
+def get_selected_fields(info, field_asts=None):
+    """
+    Returns the fields selected under `field_asts` (by default, the ones of the field being resolved) as a dict of
+    field names to the ASTs selecting them, which can be passed back in to look further down. Fragments are followed,
+    but directives aren't evaluated, so fields that end up skipped are included too.
+    """
+    if field_asts is None:
+        field_asts = info.field_asts
+
+    selected = {}
+    fragments = info.fragments
+    visited_fragments = set()
+    pending = [field_ast.selection_set for field_ast in field_asts if field_ast.selection_set]
+
+    while pending:
+        for selection in pending.pop().selections:
+            if isinstance(selection, ast.Field):
+                selected.setdefault(selection.name.value, []).append(selection)
+
+            elif isinstance(selection, ast.InlineFragment):
+                pending.append(selection.selection_set)
+
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = fragments.get(name)
+                if fragment is not None and name not in visited_fragments:
+                    visited_fragments.add(name)
+                    pending.append(fragment.selection_set)
+
+    return selected
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+
+# Python 2's OrderedDict can't move a key to the end in place.
+_move_to_end = getattr(OrderedDict, 'move_to_end', None)
+_missing = object()
+
+
+class LRUCache(object):
+    """
+    A dict-like cache that holds at most `maxsize` items, evicting the least recently used one when full.
+
+    It can be shared between threads: when they race, an item may be evicted a little early, but no call fails.
+    """
+    __slots__ = 'maxsize', '_items'
+
+    def __init__(self, maxsize=1024):
+        assert maxsize > 0, 'maxsize must be a positive integer.'
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+
+    def get(self, key, default=None):
+        items = self._items
+        value = items.get(key, _missing)
+        if value is _missing:
+            return default
+
+        if _move_to_end is not None:
+            try:
+                _move_to_end(items, key)
+
+            except KeyError:
+                # Evicted by another thread since we read it, which is fine.
+                pass
+
+        else:
+            items.pop(key, None)
+            items[key] = value
+
+        return value
+
+    def get_or_create(self, key, create):
+        """
+        Returns the cached value for `key`, calling `create(key)` and caching what it returns if there is none.
+        """
+        items = self._items
+        value = items.get(key, _missing)
+        if value is _missing:
+            value = create(key)
+            if len(items) >= self.maxsize:
+                try:
+                    items.popitem(last=False)
+
+                except KeyError:
+                    pass
+
+            items[key] = value
+
+        elif _move_to_end is not None:
+            try:
+                _move_to_end(items, key)
+
+            except KeyError:
+                pass
+
+        else:
+            items.pop(key, None)
+            items[key] = value
+
+        return value
+
+    def set(self, key, value):
+        items = self._items
+        if items.pop(key, _missing) is _missing and len(items) >= self.maxsize:
+            try:
+                items.popitem(last=False)
+
+            except KeyError:
+                pass
+
+        items[key] = value
+
+    def pop(self, key, default=None):
+        return self._items.pop(key, default)
+
+    def clear(self):
+        self._items.clear()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
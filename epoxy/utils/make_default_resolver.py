@@ -1,3 +1,15 @@
+FIELD_SOURCE_ATTRIBUTE = 'attribute'
+FIELD_SOURCE_KEY = 'key'
+FIELD_SOURCE_METHOD = 'method'
+
+
+def _name_resolver(resolver, field_attr_name, field_source):
+    resolver.__name__ = 'resolve_{}'.format(field_attr_name)
+    # Lets the resolver be re-created from its description, e.g. when loading a cached schema.
+    resolver._default_resolver_for = field_attr_name, field_source
+    return resolver
+
+
 def make_default_resolver(field_attr_name):
     def resolver(source, args, info):
         property = getattr(source, field_attr_name, None)
@@ -6,5 +18,48 @@ def make_default_resolver(field_attr_name):
 
         return property
 
-    resolver.__name__ = 'resolve_{}'.format(field_attr_name)
-    return resolver
+    return _name_resolver(resolver, field_attr_name, None)
+
+
+def make_attribute_resolver(field_attr_name):
+    def resolver(source, args, info):
+        return getattr(source, field_attr_name, None)
+
+    return _name_resolver(resolver, field_attr_name, FIELD_SOURCE_ATTRIBUTE)
+
+
+def make_key_resolver(field_attr_name):
+    def resolver(source, args, info):
+        return source.get(field_attr_name)
+
+    return _name_resolver(resolver, field_attr_name, FIELD_SOURCE_KEY)
+
+
+def make_method_resolver(field_attr_name):
+    def resolver(source, args, info):
+        return getattr(source, field_attr_name)()
+
+    return _name_resolver(resolver, field_attr_name, FIELD_SOURCE_METHOD)
+
+
+_resolver_factories = {
+    None: make_default_resolver,
+    FIELD_SOURCE_ATTRIBUTE: make_attribute_resolver,
+    FIELD_SOURCE_KEY: make_key_resolver,
+    FIELD_SOURCE_METHOD: make_method_resolver,
+}
+
+
+def make_resolver_for_field_source(field_attr_name, field_source=None):
+    """
+    Picks the specialized resolver for a field that has no explicit resolver, based on how the values backing
+    the type are stored. This is decided once when the field map is built, so resolution does not need to
+    inspect the source object.
+    """
+    factory = _resolver_factories.get(field_source)
+    if factory is None:
+        raise ValueError('Unknown field source {!r}, expected one of: {}.'.format(
+            field_source, ', '.join(repr(k) for k in sorted(k for k in _resolver_factories if k))
+        ))
+
+    return factory(field_attr_name)
@@ -0,0 +1,111 @@
+"""
+Generates `__init__` methods specialized to the fields of a type, that assign every field directly instead of looping
+over the type's field map.
+"""
+import keyword
+import re
+import six
+
+_identifier_re = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\Z')
+# Python 2, and Python 3 before 3.7, don't allow a function more than 255 arguments.
+MAX_GENERATED_ARGUMENTS = 250
+
+
+def can_generate_init(names):
+    return len(names) <= MAX_GENERATED_ARGUMENTS and all(
+        _identifier_re.match(name) and not keyword.iskeyword(name) for name in names
+    )
+
+
+def get_init(cls):
+    """
+    Returns the `__init__` function `cls` would use, as found in the `__dict__` of the first class of its MRO that has
+    one.
+    """
+    for klass in cls.__mro__:
+        if '__init__' in klass.__dict__:
+            return klass.__dict__['__init__']
+
+
+def should_generate_init(cls, generic_init):
+    """
+    Whether `cls` can use a generated `__init__`, that is, whether it would use `generic_init` or an `__init__` generated
+    for another type, and not one of its own.
+    """
+    init = get_init(cls)
+    return init is generic_init or getattr(init, '_generated', False)
+
+
+def unused_name(name, taken):
+    while name in taken:
+        name = '_' + name
+
+    return name
+
+
+def compile_function(name, source, namespace, filename):
+    six.exec_(compile(source, filename, 'exec'), namespace)
+    function = namespace[name]
+    function._generated = True
+    return function
+
+
+def check_object_type_kwargs(obj, kwargs):
+    kwargs = dict(kwargs)
+    if kwargs.pop('__field_map_init', False) and not kwargs:
+        return
+
+    raise TypeError('Type {} received unexpected keyword argument(s): {}.'.format(obj.T, ', '.join(kwargs.keys())))
+
+
+def make_object_type_init(type_name, field_attr_names):
+    """
+    Makes the `__init__` of an object type with the given fields. Like `ObjectTypeBase.__init__`, it takes the fields
+    as keyword arguments and sets the ones not given to `None`, but it also takes them as positional arguments, in
+    order.
+    """
+    names = list(field_attr_names)
+    self_name = unused_name('self', names)
+    kwargs_name = unused_name('kwargs', names)
+    check_name = unused_name('check_kwargs', names)
+
+    lines = [
+        'def __init__({}):'.format(', '.join(
+            [self_name] + ['{}=None'.format(name) for name in names] + ['**' + kwargs_name]
+        )),
+        '    if {}:'.format(kwargs_name),
+        '        return {}({}, {})'.format(check_name, self_name, kwargs_name),
+    ]
+    lines += ['    {0}.{1} = {1}'.format(self_name, name) for name in names]
+
+    return compile_function('__init__', '\n'.join(lines) + '\n', {check_name: check_object_type_kwargs},
+                            '<epoxy generated {}.__init__>'.format(type_name))
+
+
+def make_input_type_init(type_name, fields):
+    """
+    Makes the `__init__` of an input type from `(field_attr_name, field_name, default_value, convert)` tuples, where
+    `convert` turns values that aren't `None` into their epoxy classes, or is `None` for values kept as they are. Like
+    `InputTypeBase.__init__`, it takes the argument value, a dict keyed by field name.
+    """
+    namespace = {}
+    lines = [
+        'def __init__(self, arg_value=None):',
+        '    if arg_value is None:',
+        '        return',
+        '    get = arg_value.get',
+    ]
+    for i, (field_attr_name, field_name, default_value, convert) in enumerate(fields):
+        namespace['default_{}'.format(i)] = default_value
+        if convert is None:
+            lines.append('    self.{} = get({!r}, default_{})'.format(field_attr_name, str(field_name), i))
+
+        else:
+            namespace['convert_{}'.format(i)] = convert
+            lines += [
+                '    value = get({!r}, default_{})'.format(str(field_name), i),
+                '    self.{} = None if value is None else convert_{}(value)'.format(field_attr_name, i),
+            ]
+
+    return compile_function('__init__', '\n'.join(lines) + '\n', namespace,
+                            '<epoxy generated {}.__init__>'.format(type_name))
@@ -115,3 +115,17 @@ class TransformThunkList(object):
 
     def __call__(self):
         return [self.transform(item) for item in maybe_callable(self.items)]
+
+
+class FrozenRootTypeThunk(IdentityTypeThunk):
+    def __init__(self, registry, item):
+        IdentityTypeThunk.__init__(self, item)
+        self.registry = registry
+
+    def __repr__(self):
+        return '<FrozenRootTypeThunk {}>'.format(self.item)
+
+    # noinspection PyPep8Naming
+    def CanBe(self, klass):
+        self.registry._register_possible_type_for(self.item.name, klass)
+        return klass
@@ -3,15 +3,46 @@ from collections import OrderedDict
 from six import wraps
 
 
-def wrap_resolver_translating_arguments(resolver, arguments_to_original_case):
-    translate_key = arguments_to_original_case.get
+def make_argument_translation_plan(arguments_to_original_case):
+    """
+    Freezes a mapping of GraphQL argument names to their original (python) names into a tuple of pairs,
+    leaving out the names that don't change.
+    """
+    return tuple(sorted((k, v) for k, v in arguments_to_original_case.items() if k != v))
+
+
+def wrap_resolver_translating_arguments(resolver, translation_plan):
+    if isinstance(translation_plan, dict):
+        translation_plan = make_argument_translation_plan(translation_plan)
+
+    if not translation_plan:
+        return resolver
+
+    translate_key = dict(translation_plan).get
 
     @wraps(resolver)
     def wrapped(obj, args, info):
-        new_args = OrderedDict() if isinstance(args, OrderedDict) else {}
-        for k in args:
-            new_args[translate_key(k, k)] = args[k]
+        for from_key, to_key in translation_plan:
+            if from_key in args:
+                break
+
+        else:
+            # None of the given arguments need translating, so we can hand them over as is.
+            return resolver(obj, args, info)
+
+        if isinstance(args, OrderedDict):
+            new_args = OrderedDict()
+            for k in args:
+                new_args[translate_key(k, k)] = args[k]
+
+        else:
+            new_args = args.copy()
+            for from_key, to_key in translation_plan:
+                if from_key in new_args:
+                    new_args[to_key] = new_args.pop(from_key)
 
         return resolver(obj, new_args, info)
 
+    wrapped._translation_plan = translation_plan
+    wrapped._translated_resolver = resolver
     return wrapped
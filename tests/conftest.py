@@ -0,0 +1,10 @@
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 5):
+    # These use async def, which older versions cannot even parse.
+    collect_ignore += [
+        'test_relay/test_async_data_source.py',
+        'test_benchmarks/test_async_data_source_benchmark.py',
+    ]
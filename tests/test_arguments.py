@@ -135,3 +135,48 @@ def test_will_recognize_casing_conversion_conflicts():
         'Argument foo_bar already exists as fooBar',
         'Argument fooBar already exists as foo_bar',
     )
+
+
+def test_arguments_without_translated_keys_are_passed_through():
+    R = TypeRegistry()
+    seen_args = []
+
+    class Query(R.ObjectType):
+        argument_keys = R.String.List(args={
+            'foo': R.String,
+            'foo_bar': R.String
+        })
+
+        def resolve_argument_keys(self, obj, args, info):
+            seen_args.append(args)
+            return list(sorted(args.keys()))
+
+    Schema = R.Schema(R.Query)
+    resolver = R.Query().get_fields()['argumentKeys'].resolver
+
+    given_args = {'foo': 'Hello'}
+    assert resolver(None, given_args, None) == ['foo']
+    assert seen_args[-1] is given_args
+
+    given_args = {'foo': 'Hello', 'fooBar': 'World'}
+    assert resolver(None, given_args, None) == ['foo', 'foo_bar']
+    assert seen_args[-1] is not given_args
+    assert given_args == {'foo': 'Hello', 'fooBar': 'World'}
+
+    result = graphql(Schema, '{ argumentKeys(foo: "Hello") }')
+    assert not result.errors
+    assert result.data == {'argumentKeys': ['foo']}
+
+
+def test_translation_plan_is_frozen():
+    R = TypeRegistry()
+
+    field = R.Field(R.String, args={
+        'foo': R.String,
+        'foo_bar': R.String,
+        'a_b_c': R.String,
+    })
+
+    args, translation_plan = field.get_arguments(R)
+    assert list(args.keys()) == ['foo', 'fooBar', 'aBC']
+    assert translation_plan == (('aBC', 'a_b_c'), ('fooBar', 'foo_bar'))
@@ -0,0 +1,11 @@
+import os
+
+# The full sizes take tens of seconds, so a plain test run uses small ones, and only checks that the benchmarks work.
+FULL_SIZE = os.environ.get('EPOXY_FULL_BENCHMARKS', '') not in ('', '0')
+
+
+def size(full, default):
+    """
+    Returns `full` if the benchmarks were asked to run at their full size with `EPOXY_FULL_BENCHMARKS=1`, else `default`.
+    """
+    return full if FULL_SIZE else default
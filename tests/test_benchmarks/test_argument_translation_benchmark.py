@@ -0,0 +1,116 @@
+"""
+Benchmark of argument name translation for heavily-argumented (connection style) fields: the previous
+wrapper, which rebuilt the arguments dict on every call, versus the frozen translation plan.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import timeit
+from collections import OrderedDict
+from six import wraps
+from epoxy.registry import TypeRegistry
+from epoxy.utils.wrap_resolver_translating_arguments import wrap_resolver_translating_arguments
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+CALL_COUNT = 20000
+
+
+def legacy_wrap_resolver_translating_arguments(resolver, arguments_to_original_case):
+    translate_key = arguments_to_original_case.get
+
+    @wraps(resolver)
+    def wrapped(obj, args, info):
+        new_args = OrderedDict() if isinstance(args, OrderedDict) else {}
+        for k in args:
+            new_args[translate_key(k, k)] = args[k]
+
+        return resolver(obj, new_args, info)
+
+    return wrapped
+
+
+def make_connection_field(R):
+    return R.Field(R.String, args={
+        'before': R.String,
+        'after': R.String,
+        'first': R.Int,
+        'last': R.Int,
+        'order_by': R.String,
+        'include_deleted': R.Boolean,
+        'min_score': R.Int,
+    })
+
+
+call_args = [
+    # Typical pagination requests: nothing to translate.
+    {'first': 10},
+    {'first': 10, 'after': 'YXJyYXljb25uZWN0aW9uOjk='},
+    {'last': 5, 'before': 'YXJyYXljb25uZWN0aW9uOjk='},
+    # Only some of the arguments need translating.
+    {'first': 10, 'orderBy': 'name'},
+    {'first': 10, 'orderBy': 'name', 'includeDeleted': True, 'minScore': 3},
+]
+
+
+def measure_allocations(fn):
+    if tracemalloc is None:
+        return None
+
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+
+def test_benchmark_argument_translation():
+    R = TypeRegistry()
+    field = make_connection_field(R)
+    _, translation_plan = field.get_arguments(R)
+    arguments_to_original_case = dict(translation_plan)
+
+    received = []
+    resolver = lambda obj, args, info: received.append(args)
+
+    legacy = legacy_wrap_resolver_translating_arguments(resolver, arguments_to_original_case)
+    planned = wrap_resolver_translating_arguments(resolver, translation_plan)
+
+    for args in call_args:
+        legacy(None, args, None)
+        planned(None, args, None)
+
+    legacy_received, planned_received = received[0::2], received[1::2]
+    assert legacy_received == planned_received
+    assert {'first': 10, 'order_by': 'name', 'include_deleted': True, 'min_score': 3} in planned_received
+
+    legacy_copies = sum(1 for given, got in zip(call_args, legacy_received) if given is not got)
+    planned_copies = sum(1 for given, got in zip(call_args, planned_received) if given is not got)
+    assert legacy_copies == len(call_args)
+    assert planned_copies == 2
+
+    def run(wrapped):
+        del received[:]
+        for _ in range(CALL_COUNT // len(call_args)):
+            for args in call_args:
+                wrapped(None, args, None)
+
+    legacy_peak = measure_allocations(lambda: run(legacy))
+    planned_peak = measure_allocations(lambda: run(planned))
+    del received[:]
+
+    legacy_time = min(timeit.repeat(lambda: run(legacy), repeat=3, number=1))
+    planned_time = min(timeit.repeat(lambda: run(planned), repeat=3, number=1))
+    del received[:]
+
+    print('\nargument translation x %d: dict copies per %d calls legacy %d, planned %d' % (
+        CALL_COUNT, len(call_args), legacy_copies, planned_copies
+    ))
+    print('argument translation x %d: peak allocated legacy %s bytes, planned %s bytes' % (
+        CALL_COUNT, legacy_peak, planned_peak
+    ))
+    print('argument translation x %d: legacy %.4fs, planned %.4fs' % (CALL_COUNT, legacy_time, planned_time))
@@ -0,0 +1,89 @@
+"""
+Benchmark of a query against a slow backend, simulated by waiting `LATENCY` seconds per round-trip: `NODES` node fields
+and a connection page, fetched with the synchronous in-memory data source one at a time, with the
+`BatchingExecutionMiddleware`, and with the asyncio data source, which batches the nodes and waits for the node batch
+and the connection at the same time.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import asyncio
+import time
+from timeit import default_timer
+from graphql.core.execution import Executor
+from graphql.core.execution.middlewares.asyncio import AsyncioExecutionMiddleware
+from graphql.core.execution.middlewares.sync import SynchronousExecutionMiddleware
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.data_source.async_memory import AsyncInMemoryDataSource
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.contrib.relay.loader import BatchingExecutionMiddleware
+from epoxy.contrib.relay.utils import base64
+from epoxy.registry import TypeRegistry
+
+LATENCY = 0.01
+NODES = 10
+PAGE_SIZE = 10
+
+query = '{ %s items(first: %d) { edges { node { name } } } }' % (
+    ' '.join('n%d: node(id: "%s") { ... on Item { name } }' % (i, base64('Item:%d' % i)) for i in range(NODES)),
+    PAGE_SIZE
+)
+
+
+class SlowDataSource(InMemoryDataSource):
+    def fetch_nodes(self, object_type, ids, resolve_info):
+        time.sleep(LATENCY)
+        return super(SlowDataSource, self).fetch_nodes(object_type, ids, resolve_info)
+
+    def make_connection_resolver(self, relay, object_type_thunk):
+        resolver = super(SlowDataSource, self).make_connection_resolver(relay, object_type_thunk)
+
+        def slow_resolver(obj, args, info):
+            time.sleep(LATENCY)
+            return resolver(obj, args, info)
+
+        return slow_resolver
+
+
+def make_schema(data_source):
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, data_source)
+
+    class Item(R.Implements[R.Node]):
+        name = R.String
+
+    class Query(R.ObjectType):
+        node = Relay.NodeField
+        items = Relay.Connection('Item', R.Item)
+
+    schema = R.Schema(R.Query)
+    data_source.add_many([Item(id=i, name='Item %d' % i) for i in range(100)])
+    return schema
+
+
+def test_benchmark_async_data_source():
+    sync_schema = make_schema(SlowDataSource())
+    async_schema = make_schema(AsyncInMemoryDataSource(latency=LATENCY))
+    loop = asyncio.get_event_loop()
+
+    runs = [
+        ('sync', lambda: Executor([SynchronousExecutionMiddleware()]).execute(sync_schema, query, request_context={})),
+        ('sync batched', lambda: Executor([BatchingExecutionMiddleware()]).execute(
+            sync_schema, query, request_context={}
+        )),
+        ('async', lambda: loop.run_until_complete(
+            Executor([AsyncioExecutionMiddleware()]).execute(async_schema, query, request_context={})
+        )),
+    ]
+
+    timings = []
+    results = []
+    for name, run in runs:
+        start = default_timer()
+        result = run()
+        timings.append('%s %.3fs' % (name, default_timer() - start))
+        assert not result.errors
+        results.append(result.data)
+
+    assert results[0] == results[1] == results[2]
+    assert len(results[0]['items']['edges']) == PAGE_SIZE
+    print('\n%d nodes and a connection at %dms per round-trip: %s' % (NODES, LATENCY * 1000, ', '.join(timings)))
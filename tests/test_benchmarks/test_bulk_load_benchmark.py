@@ -0,0 +1,79 @@
+"""
+Benchmark of warming up an `InMemoryDataSource`: adding objects one by one versus `add_many`.
+
+Adding one by one into the flat `SortedCollection` is quadratic, so it only runs at `ONE_BY_ONE_COUNT`.
+
+Run with `EPOXY_FULL_BENCHMARKS=1 py.test tests/test_benchmarks -s` to see the timings at full size.
+"""
+import random
+from timeit import default_timer
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+from . import size
+
+ONE_BY_ONE_COUNT = size(100000, 5000)
+BULK_COUNTS = size((100000, 1000000), (5000, 50000))
+
+R = TypeRegistry()
+
+
+class Pet(R.ObjectType):
+    name = R.String
+
+
+class Toy(R.ObjectType):
+    name = R.String
+
+
+class Node(object):
+    __slots__ = 'id', 'T'
+
+    def __init__(self, id, type):
+        self.id = id
+        self.T = type
+
+
+def make_objects(count):
+    ids = list(range(count))
+    random.Random(4).shuffle(ids)
+    return [Node(id, Pet.T if id % 2 else Toy.T) for id in ids]
+
+
+def timed(fn):
+    start = default_timer()
+    fn()
+    return default_timer() - start
+
+
+def add_one_by_one(data_source, objs):
+    for obj in objs:
+        data_source.add(obj)
+
+
+def test_benchmark_bulk_load():
+    R.Schema(R.Pet)
+    objs = make_objects(ONE_BY_ONE_COUNT)
+
+    one_by_one = InMemoryDataSource()
+    bulk = InMemoryDataSource()
+    one_by_one_time = timed(lambda: add_one_by_one(one_by_one, objs))
+    bulk_time = timed(lambda: bulk.add_many(objs))
+
+    for type in (Pet.T, Toy.T):
+        assert list(one_by_one.objects_by_type[type]) == list(bulk.objects_by_type[type])
+        assert one_by_one.objects_by_type_and_id[type] == bulk.objects_by_type_and_id[type]
+
+    print('\n%d objects: add %.4fs, add_many %.4fs' % (ONE_BY_ONE_COUNT, one_by_one_time, bulk_time))
+
+    for count in BULK_COUNTS:
+        objs = make_objects(count)
+        for collection_class in (None, BlockedSortedCollection):
+            data_source = InMemoryDataSource(collection_class=collection_class) if collection_class \
+                else InMemoryDataSource()
+            load_time = timed(lambda: data_source.add_many(objs))
+            reload_time = timed(lambda: data_source.replace_all(objs))
+            assert len(data_source.objects_by_type[Pet.T]) == count // 2
+
+            print('%d objects, %s: add_many %.4fs, replace_all %.4fs' % (
+                count, data_source.collection_class.__name__, load_time, reload_time))
@@ -0,0 +1,76 @@
+"""
+Benchmark of creating `COUNT` ships in one document: as many aliased `createShip` mutations, as one `createShipBulk`
+mutation falling back to `execute` for each input, and as one `createShipBulk` mutation with an `execute_many`.
+
+Run with `EPOXY_FULL_BENCHMARKS=1 py.test tests/test_benchmarks -s` to see the timings at full size.
+"""
+from timeit import default_timer
+from graphql.core import graphql
+from epoxy.contrib.relay import RelayMixin
+from epoxy.registry import TypeRegistry
+from . import size
+
+COUNT = size(500, 100)
+ROUNDS = size(5, 2)
+
+
+def make_schema(with_execute_many):
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, None)
+    ships = []
+
+    class CreateShip(Relay.Mutation):
+        bulk = True
+
+        class Input:
+            name = R.String.NonNull
+            faction = R.String
+
+        class Output:
+            name = R.String
+
+        def execute(self, obj, input, info):
+            ships.append(input.name)
+            return self.Output(name=input.name)
+
+        if with_execute_many:
+            def execute_many(self, obj, inputs, info):
+                ships.extend(input.name for input in inputs)
+                return [self.Output(name=input.name) for input in inputs]
+
+    class Query(R.ObjectType):
+        foo = R.String
+
+    return R.Schema(R.Query, R.Mutations), ships
+
+
+aliased_query = 'mutation { %s }' % ' '.join(
+    's%d: createShip(input: {name: "ship %d", faction: "rebels", clientMutationId: "%d"}) { name clientMutationId }'
+    % (i, i, i) for i in range(COUNT)
+)
+bulk_query = 'mutation { createShipBulk(inputs: [%s]) { name clientMutationId } }' % ', '.join(
+    '{name: "ship %d", faction: "rebels", clientMutationId: "%d"}' % (i, i) for i in range(COUNT)
+)
+
+
+def test_benchmark_bulk_mutation():
+    runs = [
+        ('aliased', False, aliased_query),
+        ('bulk with execute', False, bulk_query),
+        ('bulk with execute_many', True, bulk_query),
+    ]
+
+    timings = []
+    for name, with_execute_many, query in runs:
+        schema, ships = make_schema(with_execute_many)
+        start = default_timer()
+        for _ in range(ROUNDS):
+            result = graphql(schema, query)
+
+        timings.append('%s %.4fs' % (name, (default_timer() - start) / ROUNDS))
+        assert not result.errors
+        assert len(ships) == COUNT * ROUNDS
+        outputs = result.data['createShipBulk'] if 'createShipBulk' in result.data else list(result.data.values())
+        assert sorted(int(output['clientMutationId']) for output in outputs) == list(range(COUNT))
+
+    print('\nper document creating %d ships: %s' % (COUNT, ', '.join(timings)))
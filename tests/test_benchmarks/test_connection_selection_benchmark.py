@@ -0,0 +1,55 @@
+"""
+Benchmark of a connection page of `PAGE_SIZE` edges depending on what the query selects: edges with cursors, edges with
+only their nodes, or only `pageInfo`. Edges are only built when selected, and cursors only encoded when selected.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+from timeit import default_timer
+from graphql.core import graphql
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+
+COUNT = 10000
+PAGE_SIZE = 1000
+ROUNDS = 20
+
+QUERIES = [
+    ('edges with cursors', '{ items(first: %d) { edges { node { id } cursor } pageInfo { hasNextPage } } }'),
+    ('nodes only', '{ items(first: %d) { edges { node { id } } pageInfo { hasNextPage } } }'),
+    ('pageInfo only', '{ items(first: %d) { pageInfo { hasNextPage endCursor } } }'),
+]
+
+data_source = InMemoryDataSource()
+R = TypeRegistry()
+Relay = R.Mixin(RelayMixin, data_source)
+
+
+class Item(R.Implements[R.Node]):
+    pass
+
+
+class Query(R.ObjectType):
+    items = Relay.Connection('Item', R.Item)
+
+
+Schema = R.Schema(R.Query)
+
+
+def test_benchmark_connection_selection():
+    data_source.add_many([Item(id=i) for i in range(1, COUNT + 1)])
+
+    timings = []
+    for name, query in QUERIES:
+        query = query % PAGE_SIZE
+        start = default_timer()
+        for _ in range(ROUNDS):
+            result = graphql(Schema, query)
+
+        timings.append('%s %.4fs' % (name, (default_timer() - start) / ROUNDS))
+        assert not result.errors
+        assert result.data['items']['pageInfo']['hasNextPage']
+        if 'edges' in result.data['items']:
+            assert len(result.data['items']['edges']) == PAGE_SIZE
+
+    print('\nper page of %d: %s' % (PAGE_SIZE, ', '.join(timings)))
@@ -0,0 +1,76 @@
+"""
+Benchmark of `CursorFactory` against the implementation it replaced, encoding and decoding the cursors of 1000-edge
+pages, both for pages seen over and over (which hit its caches, when they are turned on) and for pages of fresh ids,
+with the default `IntCursorType` and with the `KeyCursorType` sorted collections use.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+from timeit import default_timer
+from epoxy.contrib.relay.connections.cursor import CursorFactory, KeyCursorType
+from epoxy.contrib.relay.utils import base64, unbase64
+
+PAGE_SIZE = 1000
+ROUNDS = 50
+
+
+class PreviousCursorFactory(object):
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.cursor_type = int
+        self.max_cursor_length = 10
+
+    def from_offset(self, offset):
+        return base64(self.prefix + str(offset))
+
+    def to_offset(self, cursor):
+        try:
+            return self.cursor_type(unbase64(cursor)[len(self.prefix):len(self.prefix) + self.max_cursor_length])
+        except Exception:
+            return None
+
+
+REPEATS = 5
+
+
+def run(make_cursor, pages):
+    """
+    Times the best of a few runs, each with a new factory, so that fresh pages never hit the caches of an earlier run.
+    """
+    encode_time = decode_time = float('inf')
+    for _ in range(REPEATS):
+        cursor = make_cursor()
+        start = default_timer()
+        encoded = [[cursor.from_offset(offset) for offset in page] for page in pages]
+        encode_time = min(encode_time, default_timer() - start)
+
+        start = default_timer()
+        decoded = [[cursor.to_offset(c) for c in page] for page in encoded]
+        decode_time = min(decode_time, default_timer() - start)
+
+    return encode_time, decode_time, encoded, decoded
+
+
+def test_benchmark_cursors():
+    repeated_pages = [range(PAGE_SIZE)] * ROUNDS
+    fresh_pages = [range(i * PAGE_SIZE, (i + 1) * PAGE_SIZE) for i in range(ROUNDS)]
+
+    print('')
+    for name, pages in (('repeated pages', repeated_pages), ('fresh pages', fresh_pages)):
+        previous_encode, previous_decode, previous_encoded, previous_decoded = run(
+            lambda: PreviousCursorFactory('sc:'), pages)
+        timings = ['previous encode %.2fms, decode %.2fms' % (previous_encode / ROUNDS * 1e3,
+                                                               previous_decode / ROUNDS * 1e3)]
+
+        factories = (
+            ('default', lambda: CursorFactory('sc:')),
+            ('cache_size=4096', lambda: CursorFactory('sc:', cache_size=4096)),
+            ('KeyCursorType', lambda: CursorFactory('sc:', KeyCursorType())),
+        )
+        for factory_name, make_cursor in factories:
+            encode, decode, encoded, decoded = run(make_cursor, pages)
+            assert encoded == previous_encoded
+            assert decoded == previous_decoded == [list(page) for page in pages]
+            timings.append('%s encode %.2fms, decode %.2fms' % (
+                factory_name, encode / ROUNDS * 1e3, decode / ROUNDS * 1e3))
+
+        print('%s, per %d cursors: %s' % (name, PAGE_SIZE, '; '.join(timings)))
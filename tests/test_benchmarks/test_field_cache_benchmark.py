@@ -0,0 +1,81 @@
+"""
+Benchmark of `REQUESTS` requests for a list of `SHIPS` ships whose `route` field takes `COST` seconds to compute, with
+and without caching it across requests with `TTL`, and with `THREADS` threads missing the cache at once.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import threading
+import time
+from timeit import default_timer
+from graphql.core import graphql
+from epoxy.field_cache import TTL
+from epoxy.registry import TypeRegistry
+
+SHIPS = 20
+REQUESTS = 10
+COST = 0.001
+THREADS = 8
+
+query = '{ ships { id route } }'
+
+
+def make_schema(cache):
+    R = TypeRegistry()
+    computed = []
+
+    class Ship(R.ObjectType):
+        id = R.Int
+        route = R.String(cache=cache)
+
+        def resolve_route(self, obj, args, info):
+            computed.append(obj.id)
+            time.sleep(COST)
+            return 'route %d' % obj.id
+
+    class Query(R.ObjectType):
+        ships = R.Ship.List
+
+        def resolve_ships(self, obj, args, info):
+            return ships
+
+    schema = R.Schema(R.Query)
+    ships = [Ship(id=i) for i in range(SHIPS)]
+    return schema, computed
+
+
+def test_benchmark_field_cache():
+    timings = []
+    for name, cache in [('uncached', None), ('cached', TTL(60))]:
+        schema, computed = make_schema(cache)
+        start = default_timer()
+        for _ in range(REQUESTS):
+            result = graphql(schema, query)
+
+        timings.append('%s %.4fs' % (name, (default_timer() - start) / REQUESTS))
+        assert not result.errors
+        assert result.data['ships'][-1] == {'id': SHIPS - 1, 'route': 'route %d' % (SHIPS - 1)}
+        assert len(computed) == SHIPS * (REQUESTS if cache is None else 1)
+
+    print('\nper request for %d ships: %s' % (SHIPS, ', '.join(timings)))
+
+
+def test_benchmark_field_cache_stampede():
+    schema, computed = make_schema(TTL(60))
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(graphql(schema, query))) for _ in range(THREADS)]
+    start = default_timer()
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = default_timer() - start
+    assert len(results) == THREADS
+    assert all(not result.errors for result in results)
+    # However the threads interleave, every route is only computed once.
+    assert sorted(computed) == list(range(SHIPS))
+    print('\n%d concurrent requests for %d uncached ships: %.4fs, %d routes computed' % (
+        THREADS, SHIPS, elapsed, len(computed)
+    ))
@@ -0,0 +1,81 @@
+"""
+Benchmark of encoding global IDs: the `base64` helpers from `epoxy.contrib.relay.utils` against the memoizing codecs,
+and of resolving the `id` field of a list of nodes.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import timeit
+from graphql.core import graphql
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.contrib.relay.id_codec import Base64IDCodec, CompactIDCodec
+from epoxy.contrib.relay.utils import base64, unbase64
+from epoxy.registry import TypeRegistry
+
+NODE_COUNT = 1000
+
+
+def best_of(fn, repeat=3, number=1):
+    return min(timeit.repeat(fn, repeat=repeat, number=number))
+
+
+def test_benchmark_id_codecs():
+    ids = list(range(NODE_COUNT))
+    base64_codec = Base64IDCodec()
+    compact_codec = CompactIDCodec()
+
+    def run_helpers():
+        return [unbase64(base64('%s:%s' % ('Pet', id))).split(':', 1) for id in ids]
+
+    def run_codec(codec):
+        return [codec.decode(codec.encode('Pet', id)) for id in ids]
+
+    assert [tuple(decoded) for decoded in run_helpers()] == run_codec(base64_codec) == run_codec(compact_codec)
+
+    def encode_helpers():
+        return [base64('%s:%s' % ('Pet', id)) for id in ids]
+
+    def encode_codec(codec):
+        return [codec.encode('Pet', id) for id in ids]
+
+    assert encode_helpers() == encode_codec(base64_codec)
+
+    helpers = best_of(encode_helpers, number=20)
+    memoized = best_of(lambda: encode_codec(base64_codec), number=20)
+    compact = best_of(lambda: encode_codec(compact_codec), number=20)
+    uncached = best_of(lambda: encode_codec(CompactIDCodec(cache_size=0)), number=20)
+    print('\nencode %d ids x 20: base64 helpers %.4fs, memoized base64 %.4fs, memoized compact %.4fs, '
+          'uncached compact %.4fs' % (NODE_COUNT, helpers, memoized, compact, uncached))
+
+
+def build_schema(id_codec):
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, InMemoryDataSource(), id_codec=id_codec)
+
+    class Pet(R.Implements[R.Node]):
+        name = R.String
+
+    class Toy(R.Implements[R.Node]):
+        name = R.String
+
+    class Query(R.ObjectType):
+        pets = R.Pet.List
+        node = Relay.NodeField
+
+    schema = R.Schema(R.Query)
+    return schema, Query(pets=[Pet(id=i, name='Pet %d' % i) for i in range(NODE_COUNT)])
+
+
+def test_benchmark_node_id_field():
+    base64_schema, base64_root = build_schema(Base64IDCodec())
+    uncached_schema, uncached_root = build_schema(Base64IDCodec(cache_size=0))
+
+    query = '{ pets { id } }'
+    result = graphql(base64_schema, query, base64_root)
+    assert not result.errors
+    assert result.data == graphql(uncached_schema, query, uncached_root).data
+    assert result.data['pets'][1] == {'id': base64('Pet:1')}
+
+    memoized = best_of(lambda: graphql(base64_schema, query, base64_root))
+    uncached = best_of(lambda: graphql(uncached_schema, query, uncached_root))
+    print('\nresolve %d node ids: memoized %.4fs, uncached %.4fs' % (NODE_COUNT, memoized, uncached))
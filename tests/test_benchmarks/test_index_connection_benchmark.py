@@ -0,0 +1,63 @@
+"""
+Benchmark of a filtered connection page: paging through a secondary index of an `InMemoryDataSource` versus filtering
+every object of the type and paging through the matches.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+from timeit import default_timer
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+
+COUNT = 200000
+OWNERS = 1000
+PAGES = 1000
+# Filtering is slow enough that it only pages through this many.
+FILTER_PAGES = 20
+
+R = TypeRegistry()
+data_source = InMemoryDataSource()
+data_source.add_index('Pet', 'owner', 'owner_id')
+Relay = R.Mixin(RelayMixin, data_source)
+
+
+class Pet(R.Implements[R.Node]):
+    owner_id = R.Int
+
+
+index_resolver = data_source.make_index_connection_resolver(Relay, R.Pet, 'owner', equal='owner_id')
+
+
+class Query(R.ObjectType):
+    pets_by_owner = Relay.Connection('Pet', R.Pet, args={'owner_id': R.Int}, resolver=index_resolver)
+
+
+Schema = R.Schema(R.Query)
+
+
+def filtering_resolver(obj, args, info):
+    matches = SortedCollection(key=lambda pet: pet.id)
+    matches.update(pet for pet in data_source.objects_by_type[Pet.T] if pet.owner_id == args['owner_id'])
+    return matches.get_connection(Relay, 'Pet', args)
+
+
+def page_ids(resolver, pages):
+    ids = []
+    start = default_timer()
+    for i in range(pages):
+        connection = resolver(None, {'owner_id': i % OWNERS, 'first': 10}, None)
+        ids.append([edge.node.id for edge in connection.edges])
+
+    return default_timer() - start, ids
+
+
+def test_benchmark_index_connection():
+    data_source.add_many([Pet(id=i, owner_id=i % OWNERS) for i in range(COUNT)])
+    index_time, index_ids = page_ids(index_resolver, PAGES)
+    filter_time, filter_ids = page_ids(filtering_resolver, FILTER_PAGES)
+
+    assert index_ids[:FILTER_PAGES] == filter_ids
+    assert index_ids[3] == list(range(3, 10 * OWNERS, OWNERS))
+    print('\n%d objects, per page of 10: index %.1fus, filtering %.1fus' % (
+        COUNT, index_time / PAGES * 1e6, filter_time / FILTER_PAGES * 1e6))
@@ -0,0 +1,80 @@
+"""
+Benchmark of converting the argument value of an input with a list of `POINTS` nested inputs, as a bulk mutation would
+get it: through the generic `InputTypeBase.__init__` (forced by giving the types an `__init__` of their own that calls
+it), through the generated `__init__`, and with `_slots = True` on top.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+from timeit import default_timer
+from epoxy.registry import TypeRegistry
+
+POINTS = 1000
+ROUNDS = 20
+
+R = TypeRegistry()
+
+
+class GenericPointInput(R.InputType):
+    x = R.Int
+    y = R.Int
+    label = R.String
+
+    def __init__(self, arg_value=None):
+        super(GenericPointInput, self).__init__(arg_value)
+
+
+class GenericPathInput(R.InputType):
+    name = R.String
+    points = R.GenericPointInput.NonNull.List
+
+    def __init__(self, arg_value=None):
+        super(GenericPathInput, self).__init__(arg_value)
+
+
+class PointInput(R.InputType):
+    x = R.Int
+    y = R.Int
+    label = R.String
+
+
+class PathInput(R.InputType):
+    name = R.String
+    points = R.PointInput.NonNull.List
+
+
+class SlottedPointInput(R.InputType):
+    _slots = True
+    x = R.Int
+    y = R.Int
+    label = R.String
+
+
+class SlottedPathInput(R.InputType):
+    _slots = True
+    name = R.String
+    points = R.SlottedPointInput.NonNull.List
+
+
+class Query(R.ObjectType):
+    generic = R.Int(args={'input': R.GenericPathInput})
+    generated = R.Int(args={'input': R.PathInput})
+    slotted = R.Int(args={'input': R.SlottedPathInput})
+
+
+Schema = R.Schema(R.Query)
+
+
+def test_benchmark_input_type_init():
+    arg_value = {'name': 'path', 'points': [{'x': i, 'y': -i} for i in range(POINTS)]}
+
+    timings = []
+    for name, input_class in [('generic', GenericPathInput), ('generated', PathInput), ('slots', SlottedPathInput)]:
+        start = default_timer()
+        for _ in range(ROUNDS):
+            path = input_class(arg_value)
+
+        timings.append('%s %.4fs' % (name, (default_timer() - start) / ROUNDS))
+        assert len(path.points) == POINTS
+        assert (path.points[-1].x, path.points[-1].y, path.points[-1].label) == (POINTS - 1, 1 - POINTS, None)
+
+    print('\nper input of %d nested inputs: %s' % (POINTS, ', '.join(timings)))
@@ -0,0 +1,64 @@
+"""
+Benchmark of a friends of friends of friends query over `HUMANS` humans with `FRIENDS` friends each, whose `friends`
+and `title` resolvers do some work, with and without marking them as pure. With pure resolvers, each human's friends
+and title are only computed once per request, however many times the human shows up.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+from timeit import default_timer
+from graphql.core.execution import Executor
+from graphql.core.execution.middlewares.sync import SynchronousExecutionMiddleware
+from epoxy.memoize import ResolverMemo
+from epoxy.registry import TypeRegistry
+
+HUMANS = 50
+FRIENDS = 5
+ROUNDS = 5
+
+query = '{ human { friends { title friends { title friends { title } } } } }'
+
+
+def make_schema(pure):
+    R = TypeRegistry()
+    humans = []
+
+    class Human(R.ObjectType):
+        id = R.Int
+        title = R.String(pure=pure)
+        friends = R.Human.List(pure=pure)
+
+        def resolve_title(self, obj, args, info):
+            return ' '.join(sorted(str(i * obj.id % 97) for i in range(50)))
+
+        def resolve_friends(self, obj, args, info):
+            return sorted((humans[(obj.id * 7 + i) % HUMANS] for i in range(FRIENDS)), key=lambda human: human.id)
+
+    class Query(R.ObjectType):
+        human = R.Human
+
+        def resolve_human(self, obj, args, info):
+            return humans[0]
+
+    schema = R.Schema(R.Query)
+    humans.extend(Human(id=i) for i in range(HUMANS))
+    return schema
+
+
+def test_benchmark_memoize():
+    timings = []
+    results = []
+    for pure in (False, True):
+        schema = make_schema(pure)
+        executor = Executor([SynchronousExecutionMiddleware()])
+        start = default_timer()
+        for _ in range(ROUNDS):
+            request_context = {'round': _}
+            result = executor.execute(schema, query, request_context=request_context)
+
+        timings.append('%s %.4fs' % ('pure' if pure else 'not pure', (default_timer() - start) / ROUNDS))
+        assert not result.errors
+        results.append(result.data)
+
+    assert results[0] == results[1]
+    hits, misses = [sum(counts) for counts in zip(*ResolverMemo.for_request(request_context).stats().values())]
+    print('\nfriends of friends of friends: %s (%d hits, %d misses)' % (', '.join(timings), hits, misses))
@@ -0,0 +1,77 @@
+"""
+Benchmark of constructing object type instances of six fields: through the generic `ObjectTypeBase.__init__`
+(which every type used before `__init__` methods were generated), through the generated `__init__` with keyword and
+positional arguments, and with `_slots = True`. Also compares the memory used per instance.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import sys
+from timeit import default_timer
+from epoxy.bases.object_type import ObjectTypeBase
+from epoxy.registry import TypeRegistry
+
+COUNT = 100000
+
+R = TypeRegistry()
+field_names = ['field_%d' % i for i in range(6)]
+
+
+class Plain(R.ObjectType):
+    field_0 = R.String
+    field_1 = R.String
+    field_2 = R.String
+    field_3 = R.String
+    field_4 = R.String
+    field_5 = R.String
+
+
+class Slotted(R.ObjectType):
+    _slots = True
+    field_0 = R.String
+    field_1 = R.String
+    field_2 = R.String
+    field_3 = R.String
+    field_4 = R.String
+    field_5 = R.String
+
+
+class Query(R.ObjectType):
+    plain = R.Plain
+    slotted = R.Slotted
+
+
+Schema = R.Schema(R.Query)
+
+
+def generic_init(**kwargs):
+    obj = Plain.__new__(Plain)
+    ObjectTypeBase.__init__(obj, **kwargs)
+    return obj
+
+
+def size_of(obj):
+    return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, '__dict__') else 0)
+
+
+def test_benchmark_object_type_init():
+    kwargs = dict((name, 'value') for name in field_names)
+    args = ['value'] * len(field_names)
+    runs = [
+        ('generic', lambda: generic_init(**kwargs)),
+        ('generated', lambda: Plain(**kwargs)),
+        ('generated positional', lambda: Plain(*args)),
+        ('slots', lambda: Slotted(**kwargs)),
+        ('slots positional', lambda: Slotted(*args)),
+    ]
+
+    timings = []
+    for name, construct in runs:
+        start = default_timer()
+        for _ in range(COUNT):
+            obj = construct()
+
+        timings.append('%s %.3fs' % (name, default_timer() - start))
+        assert [getattr(obj, field_name) for field_name in field_names] == args
+
+    print('\n%d instances of %d fields: %s' % (COUNT, len(field_names), ', '.join(timings)))
+    print('bytes per instance: dict %d, slots %d' % (size_of(Plain(**kwargs)), size_of(Slotted(**kwargs))))
@@ -0,0 +1,101 @@
+"""
+Micro-benchmark of the default field resolvers: the generic getattr + callable() resolver versus the
+specialized resolvers picked at schema build time through `_field_source`.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import timeit
+from graphql.core import graphql
+from epoxy.registry import TypeRegistry
+from epoxy.utils.make_default_resolver import make_attribute_resolver, make_default_resolver
+
+NODE_COUNT = 1000
+FRIEND_COUNT = 4
+
+
+def build_schema(field_source):
+    R = TypeRegistry()
+
+    class Character(R.Interface):
+        id = R.String.NonNull
+        name = R.String
+        friends = R.Character.List
+
+    class Human(R.Implements.Character):
+        _field_source = field_source
+        home_planet = R.String
+
+    class Droid(R.Implements.Character):
+        _field_source = field_source
+        primary_function = R.String
+
+    class Query(R.ObjectType):
+        characters = R.Character.List(args={
+            'first_n': R.Int
+        })
+
+    schema = R.Schema(R.Query)
+
+    characters = []
+    for i in range(NODE_COUNT):
+        if i % 2:
+            characters.append(Human(id=str(i), name='Human %d' % i, home_planet='Tatooine'))
+        else:
+            characters.append(Droid(id=str(i), name='Droid %d' % i, primary_function='Protocol'))
+
+    for i, character in enumerate(characters):
+        character.friends = [characters[(i + j) % NODE_COUNT] for j in range(1, FRIEND_COUNT + 1)]
+
+    return schema, Query(characters=characters)
+
+
+query = '''
+{
+    characters(firstN: 10) {
+        id
+        name
+        friends {
+            id
+            name
+            ... on Human { homePlanet }
+            ... on Droid { primaryFunction }
+        }
+    }
+}
+'''
+
+
+def best_of(fn, repeat=3, number=1):
+    return min(timeit.repeat(fn, repeat=repeat, number=number))
+
+
+def test_benchmark_resolver_functions():
+    schema, root = build_schema(None)
+    nodes = root.characters
+    default_resolver = make_default_resolver('name')
+    attribute_resolver = make_attribute_resolver('name')
+
+    def run(resolver):
+        return [resolver(node, None, None) for node in nodes]
+
+    assert run(default_resolver) == run(attribute_resolver)
+
+    generic = best_of(lambda: run(default_resolver), number=20)
+    specialized = best_of(lambda: run(attribute_resolver), number=20)
+    print('\nresolver functions x %d: generic %.4fs, attribute %.4fs' % (NODE_COUNT * 20, generic, specialized))
+
+
+def test_benchmark_star_wars_graph():
+    generic_schema, generic_root = build_schema(None)
+    attribute_schema, attribute_root = build_schema('attribute')
+
+    generic_result = graphql(generic_schema, query, generic_root)
+    attribute_result = graphql(attribute_schema, query, attribute_root)
+    assert not generic_result.errors
+    assert not attribute_result.errors
+    assert generic_result.data == attribute_result.data
+    assert len(attribute_result.data['characters']) == NODE_COUNT
+
+    generic = best_of(lambda: graphql(generic_schema, query, generic_root))
+    specialized = best_of(lambda: graphql(attribute_schema, query, attribute_root))
+    print('\nstar wars graph (%d nodes): generic %.4fs, attribute %.4fs' % (NODE_COUNT, generic, specialized))
@@ -0,0 +1,111 @@
+"""
+Benchmark of booting a Star Wars like schema scaled up to ~1000 types and running a first query: building it from
+its declaring module (cold) versus loading it from a `SchemaCache` (warm), which has to import that module for the
+resolver of the query.
+
+Run with `py.test tests/test_benchmarks -s` to see the timings.
+"""
+import sys
+from timeit import default_timer
+from graphql.core import graphql
+from epoxy.schema_cache import SchemaCache
+
+# Every planet adds a character interface, a human, a droid and an input type.
+PLANET_COUNT = 250
+
+
+def make_schema_module_source():
+    lines = [
+        'from epoxy import TypeRegistry',
+        '',
+        'R = TypeRegistry()',
+        '',
+    ]
+
+    for i in range(PLANET_COUNT):
+        lines += [
+            'class Character%d(R.Interface):' % i,
+            '    id = R.ID.NonNull',
+            '    name = R.String',
+            '    friends = R.Character%d.List' % i,
+            '',
+            'class Human%d(R.Implements.Character%d):' % (i, i),
+            '    home_planet = R.String',
+            '',
+            'class Droid%d(R.Implements.Character%d):' % (i, i),
+            '    primary_function = R.String',
+            '',
+            'class CharacterFilter%d(R.InputType):' % i,
+            '    name_prefix = R.String',
+            '    limit = R.Int(default_value=10)',
+            '',
+        ]
+
+    lines += ['class Query(R.ObjectType):']
+    for i in range(PLANET_COUNT):
+        lines += ['    hero%d = R.Character%d(args={"filter": R.CharacterFilter%d})' % (i, i, i)]
+
+    lines += [
+        '',
+        '    def resolve_hero0(self, obj, args, info):',
+        '        luke = Human0(id="1000", name="Luke", home_planet="Tatooine")',
+        '        luke.friends = [Droid0(id="2001", name="R2-D2", primary_function="Astromech", friends=[luke])]',
+        '        return luke',
+        '',
+        'Schema = R.Schema(R.Query)',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+query = '''
+{
+    hero0(filter: {namePrefix: "L"}) {
+        __typename
+        name
+        friends {
+            __typename
+            name
+            ... on Droid0 { primaryFunction }
+        }
+    }
+}
+'''
+
+
+def test_benchmark_schema_cache(tmpdir, monkeypatch):
+    tmpdir.join('star_wars_1000.py').write(make_schema_module_source())
+    monkeypatch.syspath_prepend(str(tmpdir))
+    cache = SchemaCache(str(tmpdir.join('schema.cache')), modules=['star_wars_1000'])
+
+    def build():
+        __import__('star_wars_1000')
+        return sys.modules['star_wars_1000'].Schema
+
+    try:
+        start = default_timer()
+        built = cache.get_or_build(build)
+        cold_boot = default_timer() - start
+        built_result = graphql(built, query)
+        cold = default_timer() - start
+        sys.modules.pop('star_wars_1000')
+
+        start = default_timer()
+        loaded = cache.get_or_build(build)
+        warm_boot = default_timer() - start
+        assert 'star_wars_1000' not in sys.modules
+        result = graphql(loaded, query)
+        warm = default_timer() - start
+        assert sys.modules['star_wars_1000'].Schema is loaded
+
+        assert len(loaded.get_type_map()) == len(built.get_type_map())
+        assert len([name for name in built.get_type_map() if not name.startswith('__')]) >= PLANET_COUNT * 4
+
+        assert not result.errors
+        assert result.data == built_result.data
+        assert result.data['hero0']['friends'][0]['primaryFunction'] == 'Astromech'
+
+    finally:
+        sys.modules.pop('star_wars_1000', None)
+
+    print('\nschema boot and first query (%d types): cold %.4fs (boot %.4fs), warm %.4fs (boot %.4fs)' % (
+        len(built.get_type_map()), cold, cold_boot, warm, warm_boot))
@@ -0,0 +1,97 @@
+"""
+Benchmark of the in-memory connection backing: loading nodes in random order and running random first/after and
+last/before connection slices, with the flat `SortedCollection` and the `BlockedSortedCollection`.
+
+The flat collection only runs at `FLAT_NODE_COUNT`, since its inserts are linear and 1M of them takes minutes.
+
+Run with `EPOXY_FULL_BENCHMARKS=1 py.test tests/test_benchmarks -s` to see the timings at full size.
+"""
+import random
+from operator import attrgetter
+from timeit import default_timer
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+from . import size
+
+NODE_COUNT = size(1000000, 50000)
+FLAT_NODE_COUNT = size(50000, 5000)
+SLICE_COUNT = 1000
+PAGE_SIZE = 20
+
+
+class Node(object):
+    __slots__ = 'id',
+
+    def __init__(self, id):
+        self.id = id
+
+
+def make_relay():
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, InMemoryDataSource())
+
+    class Item(R.Implements[Relay.Node]):
+        pass
+
+    class Query(R.ObjectType):
+        items = Relay.Connection('Item', R.Item)
+
+    R.Schema(R.Query)
+    return Relay
+
+
+def run(Relay, collection, node_count, rng):
+    ids = list(range(1, node_count + 1))
+    rng.shuffle(ids)
+
+    start = default_timer()
+    for id in ids:
+        collection.insert(Node(id))
+    load = default_timer() - start
+
+    cursors = [collection.get_edge(Relay, 'Item', collection[rng.randrange(node_count)]).cursor
+               for _ in range(SLICE_COUNT)]
+
+    start = default_timer()
+    pages = []
+    for i, cursor in enumerate(cursors):
+        if i % 2:
+            args = {'first': PAGE_SIZE, 'after': cursor}
+        else:
+            args = {'last': PAGE_SIZE, 'before': cursor}
+
+        pages.append([edge.node.id for edge in collection.get_connection(Relay, 'Item', args).edges])
+    slices = default_timer() - start
+
+    return load, slices, pages
+
+
+def test_benchmark_sorted_collections():
+    Relay = make_relay()
+
+    flat_load, flat_slices, flat_pages = run(
+        Relay, SortedCollection(key=attrgetter('id')), FLAT_NODE_COUNT, random.Random(1))
+    blocked_load, blocked_slices, blocked_pages = run(
+        Relay, BlockedSortedCollection(key=attrgetter('id')), FLAT_NODE_COUNT, random.Random(1))
+    assert flat_pages == blocked_pages
+
+    print('\n%d nodes: flat load %.4fs, %d slices %.4fs; blocked load %.4fs, %d slices %.4fs' % (
+        FLAT_NODE_COUNT, flat_load, SLICE_COUNT, flat_slices, blocked_load, SLICE_COUNT, blocked_slices))
+
+    collection = BlockedSortedCollection(key=attrgetter('id'))
+    load, slices, pages = run(Relay, collection, NODE_COUNT, random.Random(2))
+    assert len(collection) == NODE_COUNT
+    assert [node.id for node in collection.slice(0, 3)] == [1, 2, 3]
+    assert all(page == sorted(page) and len(page) <= PAGE_SIZE for page in pages)
+
+    start = default_timer()
+    for node in collection.slice(NODE_COUNT // 2, NODE_COUNT // 2 + SLICE_COUNT):
+        collection.remove(node)
+        collection.insert(node)
+    churn = default_timer() - start
+
+    print('%d nodes: blocked load %.4fs, %d slices %.4fs, %d remove + insert %.4fs' % (
+        NODE_COUNT, load, SLICE_COUNT, slices, SLICE_COUNT, churn))
@@ -0,0 +1,62 @@
+"""
+Benchmark of storing integer keys in a `SortedCollection` as a list of boxed ints versus an unboxed `array`: the memory
+held by the key column, and the time spent bisecting range slices out of it.
+
+The list only costs more when its keys are derived from the items (e.g. `key=lambda node: int(node.pk)`); when the key
+function returns an int the item already holds, the list just points at it and both columns are 8 bytes per key.
+
+Run with `EPOXY_FULL_BENCHMARKS=1 py.test tests/test_benchmarks -s` to see the timings at full size.
+"""
+import random
+import sys
+import timeit
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from . import size
+
+NODE_COUNT = size(1000000, 50000)
+SLICE_COUNT = size(10000, 1000)
+SLICE_SIZE = 100
+# Start past the range of ints that python caches, like real ids would be.
+FIRST_ID = 10 ** 9
+
+
+def build(key_type):
+    collection = SortedCollection(key=int, key_type=key_type)
+    # Ascending inserts only append, so this measures the storage rather than the cost of shifting it.
+    for id in range(FIRST_ID, FIRST_ID + NODE_COUNT):
+        collection.insert(str(id))
+
+    return collection
+
+
+def key_column_size(collection):
+    keys = collection._keys
+    if isinstance(keys, list):
+        return sys.getsizeof(keys), sys.getsizeof(keys) + sum(sys.getsizeof(k) for k in keys)
+
+    return sys.getsizeof(keys), sys.getsizeof(keys)
+
+
+def test_benchmark_key_storage():
+    boxed = build(None)
+    unboxed = build(int)
+
+    rng = random.Random(3)
+    bounds = []
+    for _ in range(SLICE_COUNT):
+        low = rng.randrange(FIRST_ID, FIRST_ID + NODE_COUNT)
+        bounds.append((low, low + rng.randrange(SLICE_SIZE)))
+
+    def run(collection):
+        return [len(collection.slice(collection.bisect_left(low), collection.bisect_right(high))) for low, high in bounds]
+
+    assert run(boxed) == run(unboxed)
+
+    boxed_time = min(timeit.repeat(lambda: run(boxed), repeat=3, number=1))
+    unboxed_time = min(timeit.repeat(lambda: run(unboxed), repeat=3, number=1))
+
+    boxed_shared, boxed_derived = key_column_size(boxed)
+    unboxed_size = key_column_size(unboxed)[0]
+    print('\n%d int keys: list %.1fMB (%.1fMB counting the derived ints), array %.1fMB' % (
+        NODE_COUNT, boxed_shared / 2.0 ** 20, boxed_derived / 2.0 ** 20, unboxed_size / 2.0 ** 20))
+    print('%d range slices: list %.4fs, array %.4fs' % (SLICE_COUNT, boxed_time, unboxed_time))
@@ -81,3 +81,72 @@ def test_can_be():
             {'__typename': 'Bird', 'tweet': '#yolo', 'name': 'OTTweetie'},
         ]
     }
+
+
+def test_can_be_resolves_subclasses():
+    R = TypeRegistry()
+
+    class Pet(R.Interface):
+        name = R.String
+
+    class Dog(R.Implements.Pet):
+        bark = R.String
+
+    class Cat(R.Implements.Pet):
+        meow = R.String
+
+    class Query(R.ObjectType):
+        pets = R.Pet.List
+
+    @R.Dog.CanBe
+    class MyDog(object):
+        def __init__(self, name, bark):
+            self.name = name
+            self.bark = bark
+
+    class MyPuppy(MyDog):
+        pass
+
+    schema = R.Schema(Query)
+    data = Query(pets=[MyPuppy(name='Clifford', bark='Yip!'), Cat(name='Garfield', meow='Lasagna')])
+
+    result = graphql(schema, '{ pets { __typename name } }', data)
+    assert not result.errors
+    assert result.data == {
+        'pets': [
+            {'__typename': 'Dog', 'name': 'Clifford'},
+            {'__typename': 'Cat', 'name': 'Garfield'},
+        ]
+    }
+    assert Pet.T.resolve_type(MyPuppy(name='Clifford', bark='Yip!'), None) is Dog.T
+    assert Pet.T.resolve_type(object(), None) is None
+
+
+def test_can_be_resolves_union_members():
+    R = TypeRegistry()
+
+    class Dog(R.ObjectType):
+        name = R.String
+
+    class Cat(R.ObjectType):
+        name = R.String
+
+    class Pet(R.Union[R.Dog, R.Cat]):
+        pass
+
+    @R.Cat.CanBe
+    class MyCat(object):
+        name = 'Garfield'
+
+    class Query(R.ObjectType):
+        pets = R.Pet.List
+
+    schema = R.Schema(Query)
+    data = Query(pets=[MyCat(), Dog(name='Clifford')])
+
+    result = graphql(schema, '{ pets { __typename ... on Cat { name } } }', data)
+    assert not result.errors
+    assert result.data == {'pets': [{'__typename': 'Cat', 'name': 'Garfield'}, {'__typename': 'Dog'}]}
+    assert Pet.T.resolve_type(object(), None) is None
+    assert Dog.T.is_type_of(object(), None) is False
+    assert set(R._registered_types_can_be) == {Dog.T, Cat.T, Query.T}
@@ -0,0 +1,44 @@
+from epoxy.utils.copy_on_write_dict import CopyOnWriteDict
+from pytest import raises
+
+
+def test_copy_on_write_dict_behaves_like_a_dict():
+    d = CopyOnWriteDict({'a': 1}, shard_count=4)
+    d['b'] = 2
+    d.update([('c', 3)])
+    d['a'] = 10
+    del d['c']
+
+    assert len(d) == 2
+    assert d == {'a': 10, 'b': 2}
+    assert sorted(d) == ['a', 'b']
+    assert sorted(d.values()) == [2, 10]
+    assert d.get('missing') is None
+    assert 'b' in d
+
+    with raises(KeyError):
+        d['missing']
+
+    with raises(KeyError):
+        del d['missing']
+
+
+def test_copy_on_write_dict_copies_only_changed_shards():
+    original = CopyOnWriteDict(((i, i) for i in range(100)), shard_count=8)
+    copied = original.copy()
+    copied[3] = 'changed'
+    del copied[4]
+
+    assert original[3] == 3
+    assert original[4] == 4
+    assert len(original) == 100
+    assert copied[3] == 'changed'
+    assert 4 not in copied
+    assert len(copied) == 99
+
+    changed_shards = set([hash(3) % 8, hash(4) % 8])
+    for i in range(8):
+        assert (copied._shards[i] is original._shards[i]) == (i not in changed_shards)
+
+    original[5] = 'also changed'
+    assert copied[5] == 5
@@ -0,0 +1,232 @@
+import threading
+import time
+from graphql.core import graphql
+from graphql.core.pyutils.defer import Deferred
+from epoxy.field_cache import TTL, MemoryCacheBackend, PickledCacheBackend, default_key
+from epoxy.registry import TypeRegistry
+from pytest import raises
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def make_schema(cache):
+    R = TypeRegistry()
+    calls = []
+
+    class Ship(R.ObjectType):
+        id = R.Int
+        name = R.String
+        route = R.String(
+            args={'to': R.String},
+            cache=cache,
+            key=lambda ship, args: (ship.name, args.get('to')),
+            resolver=lambda ship, args, info: calls.append((ship.name, args.get('to'))) or '{} to {}'.format(
+                ship.name, args.get('to')
+            ),
+        )
+        crew = R.Int(cache=cache)
+
+        def resolve_crew(self, obj, args, info):
+            calls.append((obj.id, 'crew'))
+            return obj.id * 10
+
+    class Query(R.ObjectType):
+        ship = R.Ship(args={'id': R.Int})
+
+        def resolve_ship(self, obj, args, info):
+            return Ship(id=args['id'], name='Ship %d' % args['id'])
+
+    return R.Schema(R.Query), calls
+
+
+def test_field_values_are_cached_across_requests():
+    clock = Clock()
+    cache = TTL(60, backend=MemoryCacheBackend(clock=clock))
+    Schema, calls = make_schema(cache)
+
+    query = '{ ship(id: 1) { route(to: "Hoth") crew other: route(to: "Endor") } }'
+    for _ in range(3):
+        result = graphql(Schema, query)
+        assert not result.errors
+        assert result.data == {'ship': {'route': 'Ship 1 to Hoth', 'crew': 10, 'other': 'Ship 1 to Endor'}}
+
+    assert calls == [('Ship 1', 'Hoth'), (1, 'crew'), ('Ship 1', 'Endor')]
+    assert (cache.hits, cache.misses) == (6, 3)
+
+    # Once they expire, they are computed again.
+    clock.now = 60
+    result = graphql(Schema, '{ ship(id: 1) { crew } }')
+    assert result.data == {'ship': {'crew': 10}}
+    assert calls[-1] == (1, 'crew')
+    assert len(calls) == 4
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set('a', 1)
+    backend.set('b', None, ttl=10)
+    assert backend.get('a') == 1
+    backend.set('c', 3)
+
+    assert backend.get('b', 'missing') == 'missing'
+    assert backend.get('a') == 1
+    assert len(backend) == 2
+    backend.delete('a')
+    assert backend.get('a') is None
+    backend.clear()
+    assert len(backend) == 0
+
+
+def test_pickled_backend_shares_copies_of_values():
+    clock = Clock()
+    store = {}
+    first = PickledCacheBackend(store, clock=clock)
+    second = PickledCacheBackend(store, clock=clock)
+
+    value = {'crew': [1, 2]}
+    first.set(('Ship.crew', 1), value, ttl=5)
+    copied = second.get(('Ship.crew', 1))
+    assert copied == value
+    assert copied is not value
+
+    clock.now = 5
+    assert second.get(('Ship.crew', 1), 'missing') == 'missing'
+    assert len(store) == 0
+
+
+def test_pickled_backend_rejects_keys_without_a_stable_repr():
+    backend = PickledCacheBackend()
+    backend.set(('Ship.crew', 1, (('to', u'Hoth'),)), 'crew')
+    assert backend.get(('Ship.crew', 1, (('to', u'Hoth'),))) == 'crew'
+
+    for key in (('Ship.crew', object()), ('Ship.crew', lambda: None)):
+        with raises(TypeError):
+            backend.set(key, 'crew')
+
+        with raises(TypeError):
+            backend.get(key)
+
+
+def test_hits_and_misses_are_counted_across_threads():
+    cache = TTL(60)
+    cache.get_or_compute('key', lambda: 'value')
+
+    def get_many():
+        for _ in range(1000):
+            cache.get_or_compute('key', lambda: 'other value')
+
+    threads = [threading.Thread(target=get_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert (cache.hits, cache.misses) == (8000, 1)
+
+
+def test_cached_none_and_failures():
+    cache = TTL(None)
+    calls = []
+
+    def compute():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise ValueError('Backend unavailable')
+
+        return None
+
+    with raises(ValueError):
+        cache.get_or_compute('key', compute)
+
+    assert cache.get_or_compute('key', compute) is None
+    assert cache.get_or_compute('key', compute) is None
+    assert calls == [0, 1]
+
+
+def test_pending_values_are_not_cached():
+    cache = TTL(60)
+    deferreds = []
+
+    def compute():
+        deferreds.append(Deferred())
+        return deferreds[-1]
+
+    assert cache.get_or_compute('key', compute) is not cache.get_or_compute('key', compute)
+    assert len(deferreds) == 2
+
+
+def test_concurrent_misses_compute_once():
+    cache = TTL(60)
+    calls = []
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return 'value'
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('key', compute)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == ['value'] * 8
+    assert calls == [1]
+    assert (cache.hits, cache.misses) == (7, 1)
+
+
+def test_waiting_for_a_hung_computation_times_out():
+    cache = TTL(60, wait_timeout=0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def hang():
+        started.set()
+        release.wait(5)
+        return 'late'
+
+    thread = threading.Thread(target=lambda: cache.get_or_compute('key', hang))
+    thread.start()
+    started.wait(5)
+    try:
+        assert cache.get_or_compute('key', lambda: 'value') == 'value'
+        assert cache.misses == 2
+
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_values_depending_on_themselves_do_not_deadlock():
+    cache = TTL(60)
+    depths = []
+
+    def compute():
+        depths.append(len(depths))
+        if len(depths) == 1:
+            return 'outer ' + cache.get_or_compute('key', compute)
+
+        return 'inner'
+
+    assert cache.get_or_compute('key', compute) == 'outer inner'
+    assert depths == [0, 1]
+    assert cache.get_or_compute('key', compute) == 'outer inner'
+
+
+def test_default_key():
+    class Ship(object):
+        id = 4
+
+    assert default_key(Ship(), {}) == (4, ())
+    assert default_key({'name': 'x-wing'}, {'to': ['Hoth']}) == ((('name', 'x-wing'),), (('to', ('Hoth',)),))
+    assert default_key(None, None) == (None, ())
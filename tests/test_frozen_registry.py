@@ -0,0 +1,97 @@
+from graphql.core import graphql
+from pytest import raises
+from epoxy.registry import TypeRegistry
+
+
+def make_registry():
+    R = TypeRegistry()
+
+    class Pet(R.Interface):
+        name = R.String
+
+    class Dog(R.Implements.Pet):
+        bark = R.String
+
+    class Cat(R.Implements.Pet):
+        meow = R.String
+
+    class Query(R.ObjectType):
+        pets = R.Pet.List
+        dog = R.Dog
+
+        def resolve_dog(self, obj, args, info):
+            return Dog(name='Clifford', bark='Woof')
+
+    # Types only hold weak references to their classes, so keep them alive alongside the registry.
+    return R, (Pet, Dog, Cat, Query)
+
+
+def test_freeze_resolves_thunks():
+    R, classes = make_registry()
+    schema = R.Schema(R.Query)
+    R.freeze()
+
+    assert R.frozen
+    dog = R.Dog()
+    assert dog is R['Dog']()
+    assert dog._fields is dog.get_fields()
+    assert dog._provided_interfaces == [R.Pet()]
+    assert R.Pet()._fields is R.Pet().get_fields()
+    assert R.Pet()._possible_type_names == {'Dog', 'Cat'}
+
+    # Lookups by name are served from the frozen table.
+    assert R.Dog is R['Dog']
+    assert R.Dog is R[u'Dog']
+    assert R.Dog.List().of_type is dog
+
+    result = graphql(schema, '{ dog { name bark } }')
+    assert not result.errors
+    assert result.data == {'dog': {'name': 'Clifford', 'bark': 'Woof'}}
+
+
+def test_freeze_is_idempotent():
+    R, classes = make_registry()
+    R.Schema(R.Query)
+
+    assert R.freeze() is R
+    dog_thunk = R.Dog
+    assert R.freeze() is R
+    assert R.Dog is dog_thunk
+
+
+def test_frozen_registry_rejects_registration():
+    R, classes = make_registry()
+    R.Schema(R.Query)
+    R.freeze()
+
+    with raises(RuntimeError) as excinfo:
+        class Bird(R.ObjectType):
+            tweet = R.String
+
+    assert str(excinfo.value) == 'Unable to register type "Bird", the registry has been frozen.'
+
+    with raises(RuntimeError):
+        @R.Dog.CanBe
+        class MyDog(object):
+            pass
+
+    with raises(RuntimeError):
+        class AddPet(R.Mutation):
+            class Input:
+                name = R.String
+
+            class Output:
+                name = R.String
+
+            def execute(self, obj, input, info):
+                pass
+
+
+def test_frozen_registry_can_still_build_schemas():
+    R, classes = make_registry()
+    R.freeze()
+
+    schema = R.Schema(R.Query)
+    result = graphql(schema, '{ dog { name } }')
+    assert not result.errors
+    assert result.data == {'dog': {'name': 'Clifford'}}
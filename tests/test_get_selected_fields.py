@@ -0,0 +1,40 @@
+from graphql.core import graphql
+from epoxy.registry import TypeRegistry
+from epoxy.utils.get_selected_fields import get_selected_fields
+
+R = TypeRegistry()
+selections = []
+
+
+class Pet(R.ObjectType):
+    name = R.String
+    owner = R.Pet
+
+
+class Query(R.ObjectType):
+    pet = R.Pet
+
+    def resolve_pet(self, obj, args, info):
+        selected = get_selected_fields(info)
+        selections.append((sorted(selected), sorted(get_selected_fields(info, selected.get('owner', ())))))
+        return Pet(name='Rex')
+
+
+Schema = R.Schema(R.Query)
+
+
+def test_get_selected_fields():
+    del selections[:]
+    result = graphql(Schema, '''
+        {
+            pet {
+                name
+                ... on Pet { owner { name } }
+                ...Owner
+                ... on Pet { ...Owner }
+            }
+        }
+        fragment Owner on Pet { owner { owner { name } } }
+    ''')
+    assert not result.errors
+    assert selections == [(['name', 'owner'], ['name', 'owner'])]
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from graphql.core import graphql
 from graphql.core.type import GraphQLArgument, GraphQLInputObjectType, GraphQLString
 from graphql.core.type.scalars import GraphQLInt
@@ -71,3 +73,103 @@ def test_input_type():
     assert result.data == {
         'f': "I was given 1 and 2"
     }
+
+
+def make_nested_input_types():
+    R = TypeRegistry()
+
+    class PointInput(R.InputType):
+        _slots = True
+        x = R.Int
+        y = R.Int
+
+    class ShapeInput(R.InputType):
+        name = R.String
+        origin = R.PointInput
+        points = R.PointInput.NonNull.List
+        groups = R.PointInput.List.List
+
+    class Query(R.ObjectType):
+        shape = R.String(args={
+            'input': R.ShapeInput
+        })
+
+        def resolve_shape(self, obj, args, info):
+            shape = ShapeInput(args['input'])
+            assert isinstance(shape.origin, PointInput)
+            return '{} at ({}, {}): {}; {}'.format(
+                shape.name, shape.origin.x, shape.origin.y,
+                ' '.join('({}, {})'.format(p.x, p.y) for p in shape.points),
+                [[p and p.x for p in group] for group in shape.groups],
+            )
+
+    return R.Schema(R.Query), PointInput, ShapeInput
+
+
+def test_nested_input_types_are_converted():
+    Schema, PointInput, ShapeInput = make_nested_input_types()
+
+    assert getattr(ShapeInput.__init__, '_generated', False)
+    result = graphql(Schema, '''
+    {
+        shape(input: {name: "Line", origin: {x: 1, y: 2}, points: [{x: 3, y: 4}, {x: 5}], groups: [[{x: 6}], [{x: 7}, {x: 8}]]})
+    }
+    ''')
+    assert not result.errors
+    assert result.data == {'shape': 'Line at (1, 2): (3, 4) (5, None); [[6], [7, 8]]'}
+
+    shape = ShapeInput({'name': 'Nothing', 'points': None})
+    assert shape.origin is None
+    assert shape.points is None
+    assert repr(shape) == '<ShapeInput name={!r} origin=None points=None groups=None>'.format(shape.name)
+
+
+def test_input_type_slots():
+    Schema, PointInput, ShapeInput = make_nested_input_types()
+
+    point = PointInput({'x': 1})
+    assert PointInput.__slots__ == ('x', 'y')
+    assert not hasattr(point, '__dict__')
+    assert (point.x, point.y) == (1, None)
+    assert hasattr(ShapeInput({}), '__dict__')
+
+
+def test_registry_only_holds_input_type_classes_weakly():
+    R = TypeRegistry()
+
+    class PointInput(R.InputType):
+        x = R.Int
+
+    input_type = PointInput.T
+    class_ref = weakref.ref(PointInput)
+    assert R._get_input_type_class(input_type) is PointInput
+
+    del PointInput
+    gc.collect()
+    assert class_ref() is None
+    assert R._get_input_type_class(input_type) is None
+
+
+def test_input_type_with_own_init_converts_nested_input_types():
+    R = TypeRegistry()
+
+    class PointInput(R.InputType):
+        x = R.Int
+
+    class PathInput(R.InputType):
+        points = R.PointInput.List
+
+        def __init__(self, arg_value=None):
+            super(PathInput, self).__init__(arg_value)
+            self.length = len(self.points or ())
+
+    class Query(R.ObjectType):
+        path = R.Int(args={'input': R.PathInput})
+
+    R.Schema(R.Query)
+
+    path = PathInput({'points': [{'x': 1}, None]})
+    assert path.length == 2
+    assert isinstance(path.points[0], PointInput)
+    assert path.points[0].x == 1
+    assert path.points[1] is None
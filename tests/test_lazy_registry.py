@@ -0,0 +1,118 @@
+from graphql.core import graphql
+from epoxy.registry import TypeRegistry
+
+R = TypeRegistry(lazy=True)
+
+
+class Pet(R.Interface):
+    name = R.String
+
+
+class Dog(R.Implements.Pet):
+    bark = R.String
+
+
+class Cat(R.Implements.Pet):
+    meow = R.String
+
+
+class Bird(R.Implements.Pet):
+    tweet = R.String
+
+
+class Toy(R.ObjectType):
+    squeaks = R.Boolean
+
+
+class Owner(R.ObjectType):
+    dog = R.Dog
+    pets = R.Pet.List
+
+
+class Query(R.ObjectType):
+    owner = R.Owner
+
+    def resolve_owner(self, obj, args, info):
+        return Owner(
+            dog=Dog(name='Clifford', bark='Woof'),
+            pets=[Dog(name='Odie', bark='Arf'), Cat(name='Garfield', meow='Lasagna')]
+        )
+
+
+R.pin(R.Cat)
+Schema = R.Schema(R.Query)
+
+
+def test_lazy_registry_only_builds_reachable_types():
+    type_map = Schema.get_type_map()
+    assert 'Owner' in type_map
+    assert 'Dog' in type_map
+    assert 'Cat' in type_map
+
+    assert 'Bird' not in type_map
+    assert 'Toy' not in type_map
+    assert Bird.T._field_map is None
+    assert Toy.T._field_map is None
+    assert Pet.T.get_possible_types() == [Dog.T, Cat.T]
+
+
+def test_lazy_registry_executes_queries():
+    result = graphql(Schema, '''
+    {
+        owner {
+            dog { name bark }
+            pets {
+                __typename
+                name
+                ... on Cat { meow }
+            }
+        }
+    }
+    ''')
+    assert not result.errors
+    assert result.data == {
+        'owner': {
+            'dog': {'name': 'Clifford', 'bark': 'Woof'},
+            'pets': [
+                {'__typename': 'Dog', 'name': 'Odie'},
+                {'__typename': 'Cat', 'name': 'Garfield', 'meow': 'Lasagna'},
+            ]
+        }
+    }
+
+
+def test_lazy_registry_defers_collecting_declared_fields():
+    R = TypeRegistry(lazy=True, profile=True)
+
+    class Dog(R.ObjectType):
+        name = R.String
+
+    class Toy(R.ObjectType):
+        squeaks = R.Boolean
+
+    class Query(R.ObjectType):
+        dog = R.Dog
+
+    R.Schema(R.Query)
+
+    collected = set(r['type'] for r in R.profiler.report() if r['phase'] == 'declared_fields')
+    assert collected == {'Query', 'Dog'}
+
+
+def test_freezing_lazy_registry_leaves_unreachable_types_alone():
+    R = TypeRegistry(lazy=True)
+
+    class Dog(R.ObjectType):
+        name = R.String
+
+    class Toy(R.ObjectType):
+        squeaks = R.Boolean
+
+    class Query(R.ObjectType):
+        dog = R.Dog
+
+    R.Schema(R.Query)
+    R.freeze()
+
+    assert Dog.T._fields is Dog.T.get_fields()
+    assert Toy.T._field_map is None
@@ -0,0 +1,37 @@
+from epoxy.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.get('b', 'missing') == 'missing'
+    assert len(cache) == 2
+
+    assert cache.pop('a') == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_get_or_create():
+    cache = LRUCache(2)
+    created = []
+
+    def create(key):
+        created.append(key)
+        return key * 2
+
+    assert cache.get_or_create('a', create) == 'aa'
+    assert cache.get_or_create('b', create) == 'bb'
+    assert cache.get_or_create('a', create) == 'aa'
+    assert cache.get_or_create('c', create) == 'cc'
+    assert created == ['a', 'b', 'c']
+    assert 'b' not in cache
+    assert cache.get_or_create(None, lambda key: None) is None
+    assert None in cache
@@ -0,0 +1,189 @@
+from graphql.core.execution import Executor
+from graphql.core.execution.middlewares.sync import SynchronousExecutionMiddleware
+from graphql.core.pyutils.defer import succeed
+from epoxy.contrib.relay.loader import BatchingExecutionMiddleware
+from epoxy.memoize import ResolverMemo, freeze_args, memoize_resolver, pure
+from epoxy.registry import TypeRegistry
+
+
+def make_schema():
+    R = TypeRegistry()
+    calls = []
+
+    class Human(R.ObjectType):
+        id = R.Int
+        name = R.String
+        friend_ids = R.Int.List
+        friends = R.Human.List(resolver=lambda obj, args, info: calls.append(('friends', obj.id)) or [
+            humans[friend_id] for friend_id in obj.friend_ids
+        ], pure=True)
+        greeting = R.String(args={'greeting_word': R.String, 'tags': R.String.List})
+
+        @pure
+        def resolve_greeting(self, obj, args, info):
+            calls.append(('greeting', obj.id))
+            return '{} {}{}'.format(args.get('greeting_word', 'Hi'), obj.name, ''.join(args.get('tags') or ()))
+
+    class Query(R.ObjectType):
+        human = R.Human
+
+        def resolve_human(self, obj, args, info):
+            return humans[1]
+
+    schema = R.Schema(R.Query)
+    humans = {
+        1: Human(id=1, name='Luke', friend_ids=[2, 3]),
+        2: Human(id=2, name='Han', friend_ids=[1, 3]),
+        3: Human(id=3, name='Leia', friend_ids=[1, 2]),
+    }
+
+    return schema, calls
+
+
+def execute(schema, query, request_context):
+    return Executor([SynchronousExecutionMiddleware()]).execute(schema, query, request_context=request_context)
+
+
+query = '''
+{
+    human {
+        friends {
+            greeting(greetingWord: "Hello")
+            friends { greeting(greetingWord: "Hello") other: greeting(greetingWord: "Yo") }
+        }
+    }
+}
+'''
+
+
+def test_pure_resolvers_are_memoized_within_a_request():
+    schema, calls = make_schema()
+    # graphql-core would replace an empty dict with one of its own.
+    request_context = {'user': None}
+
+    result = execute(schema, query, request_context)
+    assert not result.errors
+    assert result.data == {'human': {'friends': [
+        {'greeting': 'Hello Han', 'friends': [
+            {'greeting': 'Hello Luke', 'other': 'Yo Luke'},
+            {'greeting': 'Hello Leia', 'other': 'Yo Leia'},
+        ]},
+        {'greeting': 'Hello Leia', 'friends': [
+            {'greeting': 'Hello Luke', 'other': 'Yo Luke'},
+            {'greeting': 'Hello Han', 'other': 'Yo Han'},
+        ]},
+    ]}}
+    # Once for each human, and once for each of their greetings.
+    assert len(calls) == 3 + 6
+
+    memo = ResolverMemo.for_request(request_context)
+    assert memo.stats() == {'Human.friends': (0, 3), 'Human.greeting': (4, 6)}
+
+    # Another request starts over.
+    calls[:] = []
+    result = execute(schema, query, None)
+    assert not result.errors
+    assert len(calls) == 9
+
+
+def test_pure_resolvers_without_request_context():
+    calls = []
+
+    class Info(object):
+        request_context = None
+
+    resolver = memoize_resolver(lambda obj, args, info: calls.append(obj), 'Human', 'greeting')
+    resolver('source', {}, Info())
+    resolver('source', {}, Info())
+    assert calls == ['source', 'source']
+
+
+def test_unhashable_arguments_are_not_memoized():
+    schema, calls = make_schema()
+    # graphql-core would replace an empty dict with one of its own.
+    request_context = {'user': None}
+
+    result = execute(schema, '{ human { a: greeting(tags: ["!", "?"]) b: greeting(tags: ["!", "?"]) } }', request_context)
+    assert not result.errors
+    assert result.data == {'human': {'a': 'Hi Luke!?', 'b': 'Hi Luke!?'}}
+    assert calls == [('greeting', 1)]
+
+    memo = ResolverMemo.for_request(request_context)
+    assert len(memo) == 1
+    memo.clear()
+    assert len(memo) == 0
+
+    calls[:] = []
+    memo.resolve('Human.greeting', lambda obj, args, info: calls.append(obj), 'source', {'tags': {'a', 'b'}}, None)
+    assert calls == ['source']
+    assert len(memo) == 0
+
+
+def test_fields_without_resolver_can_be_pure():
+    R = TypeRegistry()
+    calls = []
+
+    class Person(object):
+        def title(self):
+            calls.append('title')
+            return 'Jedi'
+
+        def rank(self):
+            calls.append('rank')
+            return 'Master'
+
+    class Human(R.ObjectType):
+        title = R.String(pure=True)
+        rank = R.String
+
+    class Query(R.ObjectType):
+        people = R.Human.List
+
+        def resolve_people(self, obj, args, info):
+            return [person, person]
+
+    R.Human.CanBe(Person)
+    schema = R.Schema(R.Query)
+    person = Person()
+
+    result = execute(schema, '{ people { title rank } }', {'user': None})
+    assert not result.errors
+    assert result.data == {'people': [{'title': 'Jedi', 'rank': 'Master'}] * 2}
+    assert sorted(calls) == ['rank', 'rank', 'title']
+
+
+def test_freeze_args():
+    assert freeze_args({'b': [1, {'c': 2}], 'a': 'x'}) == (('a', 'x'), ('b', (1, (('c', 2),))))
+    assert hash(freeze_args({'b': [1, {'c': 2}], 'a': 'x'})) == hash(freeze_args({'a': 'x', 'b': [1, {'c': 2}]}))
+
+
+def test_deferred_values_are_remembered_once_resolved():
+    R = TypeRegistry()
+    calls = []
+
+    class Pet(R.ObjectType):
+        name = R.String
+
+    class Human(R.ObjectType):
+        pet = R.Pet
+
+        @pure
+        def resolve_pet(self, obj, args, info):
+            calls.append(obj)
+            return succeed(Pet(name='Rex'))
+
+    class Query(R.ObjectType):
+        humans = R.Human.List
+
+        def resolve_humans(self, obj, args, info):
+            return [human, human]
+
+    schema = R.Schema(R.Query)
+    human = Human()
+
+    result = Executor([BatchingExecutionMiddleware()]).execute(
+        schema, '{ humans { pet { name } } }', request_context={'user': None}
+    )
+    assert not result.errors
+    assert result.data == {'humans': [{'pet': {'name': 'Rex'}}] * 2}
+    assert calls == [human]
@@ -61,3 +61,93 @@ def test_simple_mutation():
             'input': [1, 2, 3, 4, 5]
         }
     }
+
+
+def make_bulk_schema(execute_outputs=None):
+    R = TypeRegistry()
+    calls = []
+
+    class CreateShip(R.Mutation):
+        bulk = True
+
+        class Input:
+            name = R.String.NonNull
+
+        class Output:
+            name = R.String
+
+        def execute(self, obj, input, info):
+            calls.append([input.name])
+            return self.Output(name=input.name.upper())
+
+        if execute_outputs:
+            def execute_many(self, obj, inputs, info):
+                calls.append([input.name for input in inputs])
+                return execute_outputs(self, inputs)
+
+    class Query(R.ObjectType):
+        foo = R.String
+
+    return R.Schema(R.Query, R.Mutations), calls
+
+
+bulk_query = '''
+mutation {
+    createShipBulk(inputs: [{name: "x-wing"}, {name: "y-wing"}]) {
+        name
+    }
+}
+'''
+
+
+def test_bulk_mutation_falls_back_to_execute():
+    Schema, calls = make_bulk_schema()
+
+    result = graphql(Schema, bulk_query)
+    assert not result.errors
+    assert result.data == {'createShipBulk': [{'name': 'X-WING'}, {'name': 'Y-WING'}]}
+    assert calls == [['x-wing'], ['y-wing']]
+
+    # The single variant is still there.
+    result = graphql(Schema, 'mutation { createShip(input: {name: "tie"}) { name } }')
+    assert not result.errors
+    assert result.data == {'createShip': {'name': 'TIE'}}
+
+
+def test_bulk_mutation_uses_execute_many():
+    Schema, calls = make_bulk_schema(lambda mutation, inputs: [
+        mutation.Output(name=input.name[::-1]) for input in inputs
+    ])
+
+    result = graphql(Schema, bulk_query)
+    assert not result.errors
+    assert result.data == {'createShipBulk': [{'name': 'gniw-x'}, {'name': 'gniw-y'}]}
+    assert calls == [['x-wing', 'y-wing']]
+
+
+def test_bulk_mutation_checks_output_count():
+    Schema, calls = make_bulk_schema(lambda mutation, inputs: [])
+
+    result = graphql(Schema, bulk_query)
+    assert result.data == {'createShipBulk': None}
+    assert [str(error) for error in result.errors] == ['execute_many returned 0 outputs for 2 inputs.']
+
+
+def test_mutations_are_not_bulk_by_default():
+    R = TypeRegistry()
+
+    class CreateShip(R.Mutation):
+        class Input:
+            name = R.String
+
+        class Output:
+            name = R.String
+
+        def execute(self, obj, input, info):
+            return self.Output(name=input.name)
+
+    class Query(R.ObjectType):
+        foo = R.String
+
+    Schema = R.Schema(R.Query, R.Mutations)
+    assert list(Schema.get_mutation_type().get_fields()) == ['createShip']
@@ -0,0 +1,117 @@
+from graphql.core import graphql
+from epoxy.bases.object_type import ObjectTypeBase
+from epoxy.registry import TypeRegistry
+from pytest import raises
+
+
+def make_types():
+    R = TypeRegistry()
+
+    class Named(R.Interface):
+        name = R.String
+
+    class Human(R.Implements[R.Named]):
+        favorite_color = R.String
+
+    class Robot(R.Implements[R.Named]):
+        _slots = True
+        model = R.String
+
+    class Android(Robot):
+        mood = R.String
+
+    class Alien(R.ObjectType):
+        planet = R.String
+
+        def __init__(self, planet=None, **kwargs):
+            super(Alien, self).__init__(planet=planet and planet.upper(), **kwargs)
+
+    class Query(R.ObjectType):
+        alien = R.Alien
+        robot = R.Robot
+        android = R.Android
+
+    # Epoxy only holds weak references to type classes, so the interface is returned to keep it alive as well.
+    return R, Named, Human, Robot, Android, Alien, Query
+
+
+def test_generated_init_takes_keyword_and_positional_arguments():
+    R, Named, Human, Robot, Android, Alien, Query = make_types()
+    R.Schema(R.Query)
+
+    assert getattr(Human.__init__, '_generated', False)
+    jake = Human(name='Jake')
+    assert jake.name == 'Jake'
+    assert jake.favorite_color is None
+
+    # Positional arguments follow the order of the fields, the interface's first.
+    finn = Human('Finn', 'Blue')
+    assert finn.name == 'Finn'
+    assert finn.favorite_color == 'Blue'
+    assert repr(finn) == "<Human name='Finn' favorite_color='Blue'>"
+
+    with raises(TypeError) as excinfo:
+        Human(after_all=True)
+
+    assert str(excinfo.value) == 'Type Human received unexpected keyword argument(s): after_all.'
+
+    with raises(TypeError):
+        Human('Jake', name='Jake')
+
+
+def test_types_cannot_be_constructed_before_their_schema():
+    R, Named, Human, Robot, Android, Alien, Query = make_types()
+
+    with raises(RuntimeError):
+        Robot(model='T-800')
+
+
+def test_own_init_is_kept():
+    R, Named, Human, Robot, Android, Alien, Query = make_types()
+    R.Schema(R.Query)
+
+    assert Alien.__dict__['__init__'] is not ObjectTypeBase.__init__
+    assert not getattr(Alien.__init__, '_generated', False)
+    assert Alien('mars').planet == 'MARS'
+
+
+def test_slots():
+    R, Named, Human, Robot, Android, Alien, Query = make_types()
+    Schema = R.Schema(R.Query)
+
+    assert Robot.__slots__ == ('model', 'name')
+    # Subclasses inherit `_slots`, and only add slots for the fields their bases don't have slots for.
+    assert Android.__slots__ == ('mood',)
+
+    robot = Robot(name='Bender', model='Bending Unit')
+    android = Android(name='Data', mood=None)
+    assert not hasattr(robot, '__dict__')
+    assert not hasattr(android, '__dict__')
+    assert hasattr(Human(), '__dict__')
+
+    with raises(AttributeError):
+        robot.age = 4
+
+    result = graphql(Schema, '{ robot { name model } android { name mood } }', Query(robot=robot, android=android))
+    assert not result.errors
+    assert result.data == {
+        'robot': {'name': 'Bender', 'model': 'Bending Unit'},
+        'android': {'name': 'Data', 'mood': None},
+    }
+
+
+def test_relay_types_do_not_use_slots():
+    from epoxy.contrib.relay import RelayMixin
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, None)
+
+    class Query(R.ObjectType):
+        things = Relay.Connection('Thing', R.Query, resolver=lambda obj, args, info: None)
+
+    R.Schema(R.Query)
+    Connection, Edge = Relay.get_connection_and_edge_types('Thing')
+    for relay_type in (Relay.PageInfo, Connection, Edge):
+        # Attributes that aren't fields can still be set on them, as they always could.
+        obj = relay_type()
+        obj.extra = True
+        assert obj.extra
@@ -0,0 +1,94 @@
+import json
+import sys
+from epoxy.build_report import main
+from epoxy.profiler import PROFILE_ENV_VAR, BuildProfiler
+from epoxy.registry import TypeRegistry
+
+
+def test_profiling_is_off_by_default(monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+    R = TypeRegistry()
+    assert R.profiler is None
+
+
+def test_profiler_records_phases_per_type():
+    R = TypeRegistry(profile=True)
+
+    class Pet(R.Interface):
+        name = R.String
+
+    class Dog(R.Implements.Pet):
+        bark = R.String
+
+    class PetInput(R.InputType):
+        name = R.String
+
+    class Query(R.ObjectType):
+        dog = R.Dog
+        pets = R.Pet.List(args={'filter': R.PetInput})
+
+    R.Schema(R.Query)
+
+    records = dict(((r['phase'], r['type']), r) for r in R.profiler.report())
+    for type_name in ('Pet', 'Dog', 'PetInput', 'Query'):
+        assert records[('declare', type_name)]['calls'] == 1
+        assert records[('declared_fields', type_name)]['calls'] == 1
+        assert records[('build_field_map', type_name)]['calls'] == 1
+
+    assert records[('resolve_thunk', 'Pet')]['calls'] >= 1
+    assert records[('add_impl_to_interfaces', None)]['calls'] == 1
+    assert records[('schema', None)]['calls'] == 1
+
+    phases = [total['phase'] for total in R.profiler.totals_by_phase()]
+    assert sorted(phases) == sorted([
+        'add_impl_to_interfaces', 'build_field_map', 'declare', 'declared_fields', 'resolve_thunk', 'schema'
+    ])
+
+    types = dict((total['type'], total) for total in R.profiler.totals_by_type())
+    assert types['Dog']['calls'] >= 3
+
+    assert 'build_field_map' in R.profiler.format_report()
+
+
+def test_profiler_uses_given_clock():
+    ticks = iter(range(100))
+    profiler = BuildProfiler(clock=lambda: next(ticks))
+
+    with profiler.measure('declare', 'Dog'):
+        pass
+
+    with profiler.measure('declare', 'Dog'):
+        pass
+
+    assert profiler.report() == [{'phase': 'declare', 'type': 'Dog', 'calls': 2, 'seconds': 2.0}]
+
+    profiler.reset()
+    assert profiler.report() == []
+
+
+def test_cli_dumps_report(tmpdir, monkeypatch, capsys):
+    tmpdir.join('profiled_schema_module.py').write('''
+from epoxy import TypeRegistry
+
+R = TypeRegistry()
+
+
+class Dog(R.ObjectType):
+    name = R.String
+
+
+class Query(R.ObjectType):
+    dog = R.Dog
+''')
+    monkeypatch.syspath_prepend(str(tmpdir))
+    monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+
+    try:
+        main(['profiled_schema_module:R', '--query', 'Query', '--json'])
+    finally:
+        sys.modules.pop('profiled_schema_module', None)
+
+    report = json.loads(capsys.readouterr()[0])
+    assert set(report.keys()) == {'records', 'phases', 'types'}
+    assert {'phase': 'schema', 'type': None} in [{'phase': r['phase'], 'type': r['type']} for r in report['records']]
+    assert 'Dog' in [t['type'] for t in report['types']]
@@ -0,0 +1,210 @@
+import asyncio
+from graphql.core.execution import Executor
+from graphql.core.execution.middlewares.asyncio import AsyncioExecutionMiddleware
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.async_loader import AsyncNodeLoader
+from epoxy.contrib.relay.data_source.async_base import AsyncBaseDataSource
+from epoxy.contrib.relay.data_source.async_memory import AsyncInMemoryDataSource
+from epoxy.contrib.relay.utils import base64
+from epoxy.registry import TypeRegistry
+from pytest import raises
+
+
+class CountingDataSource(AsyncInMemoryDataSource):
+    def __init__(self, latency=0):
+        super(CountingDataSource, self).__init__(latency=latency)
+        self.batches = []
+
+    async def fetch_nodes(self, object_type, ids, resolve_info):
+        self.batches.append((object_type.name, list(ids)))
+        return await super(CountingDataSource, self).fetch_nodes(object_type, ids, resolve_info)
+
+
+def make_schema(data_source, max_batch_size=None):
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, data_source, max_batch_size=max_batch_size)
+
+    class Pet(R.Implements[R.Node]):
+        name = R.String
+        friend_ids = R.ID.List
+        friends = R.Pet.List
+
+        def resolve_friends(self, obj, args, info):
+            return Relay.fetch_nodes(obj.friend_ids, info)
+
+    class Toy(R.Implements[R.Node]):
+        name = R.String
+
+    class Query(R.ObjectType):
+        node = Relay.NodeField
+        nodes = Relay.NodesField
+        pets = Relay.Connection('Pet', R.Pet)
+
+    schema = R.Schema(R.Query)
+
+    for i in range(1, 6):
+        data_source.add(Pet(id=i, name='Pet %d' % i, friend_ids=[pet_id(i % 5 + 1), pet_id(1)]))
+        data_source.add(Toy(id=i, name='Toy %d' % i))
+
+    return schema
+
+
+def pet_id(i):
+    return base64('Pet:%s' % i)
+
+
+def toy_id(i):
+    return base64('Toy:%s' % i)
+
+
+def execute(schema, query):
+    executor = Executor([AsyncioExecutionMiddleware()])
+    return asyncio.get_event_loop().run_until_complete(executor.execute(schema, query, request_context={}))
+
+
+def test_node_fields_are_fetched_in_one_batch_per_type():
+    data_source = CountingDataSource()
+    schema = make_schema(data_source)
+
+    result = execute(schema, '''
+    {
+        a: node(id: "%s") { ... on Pet { name friends { name } } }
+        b: node(id: "%s") { ... on Toy { name } }
+        c: node(id: "%s") { ... on Pet { name } }
+        d: node(id: "%s") { id }
+    }
+    ''' % (pet_id(1), toy_id(2), pet_id(3), pet_id(42)))
+
+    assert not result.errors
+    assert result.data == {
+        'a': {'name': 'Pet 1', 'friends': [{'name': 'Pet 2'}, {'name': 'Pet 1'}]},
+        'b': {'name': 'Toy 2'},
+        'c': {'name': 'Pet 3'},
+        'd': None,
+    }
+    # Pet 1 was already loaded by the first level, so only Pet 2 is left for the second.
+    assert data_source.batches == [('Pet', ['1', '3', '42']), ('Toy', ['2']), ('Pet', ['2'])]
+
+
+def test_nodes_field_and_max_batch_size():
+    data_source = CountingDataSource()
+    schema = make_schema(data_source, max_batch_size=2)
+
+    result = execute(schema, '{ nodes(ids: ["%s", "%s", "%s"]) { ... on Pet { name } } }' % (
+        pet_id(4), pet_id(5), pet_id(4)
+    ))
+
+    assert not result.errors
+    assert result.data == {'nodes': [{'name': 'Pet 4'}, {'name': 'Pet 5'}, {'name': 'Pet 4'}]}
+    assert data_source.batches == [('Pet', ['4', '5'])]
+
+
+def test_connection_is_resolved_by_coroutine():
+    schema = make_schema(AsyncInMemoryDataSource())
+
+    result = execute(schema, '''
+    {
+        pets(first: 2, after: "%s") {
+            totalCount
+            edges { node { name } }
+            pageInfo { hasNextPage }
+        }
+    }
+    ''' % base64('sc:1'))
+
+    assert not result.errors
+    assert result.data == {
+        'pets': {
+            'totalCount': 5,
+            'edges': [{'node': {'name': 'Pet 2'}}, {'node': {'name': 'Pet 3'}}],
+            'pageInfo': {'hasNextPage': True},
+        }
+    }
+
+
+def test_fetches_wait_concurrently():
+    data_source = AsyncInMemoryDataSource(latency=0.05)
+    schema = make_schema(data_source)
+    loop = asyncio.get_event_loop()
+
+    start = loop.time()
+    result = execute(schema, '''
+    {
+        a: node(id: "%s") { ... on Pet { name } }
+        b: node(id: "%s") { ... on Toy { name } }
+        pets(first: 1) { edges { node { name } } }
+    }
+    ''' % (pet_id(1), toy_id(1)))
+    elapsed = loop.time() - start
+
+    assert not result.errors
+    assert result.data == {'a': {'name': 'Pet 1'}, 'b': {'name': 'Toy 1'}, 'pets': {'edges': [{'node': {'name': 'Pet 1'}}]}}
+    # Three round-trips, but all at once.
+    assert elapsed < 0.15
+
+
+def test_default_fetch_nodes_uses_fetch_node():
+    class DataSource(AsyncBaseDataSource):
+        async def fetch_node(self, object_type, id, resolve_info):
+            return None if id == 'missing' else (object_type, id)
+
+    nodes = asyncio.get_event_loop().run_until_complete(DataSource().fetch_nodes('T', ['1', 'missing', '2'], None))
+    assert nodes == [('T', '1'), None, ('T', '2')]
+
+
+def test_loader_errors_are_not_cached():
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(list(keys))
+        if len(calls) == 1:
+            raise Exception('Backend unavailable')
+
+        return [key * 2 for key in keys]
+
+    async def load_twice():
+        loader = AsyncNodeLoader(batch_load)
+        with raises(Exception) as excinfo:
+            await loader.load(1)
+
+        assert str(excinfo.value) == 'Backend unavailable'
+        return await loader.load_many([1, 2, 1])
+
+    assert asyncio.get_event_loop().run_until_complete(load_twice()) == [2, 4, 2]
+    assert calls == [[1], [1, 2]]
+
+
+def test_loader_prime_and_mismatched_batch():
+    async def batch_load(keys):
+        return []
+
+    async def load():
+        loader = AsyncNodeLoader(batch_load)
+        loader.prime('a', 'primed')
+        assert await loader.load('a') == 'primed'
+        assert await loader.load_many([]) == []
+        with raises(ValueError):
+            await loader.load('b')
+
+    asyncio.get_event_loop().run_until_complete(load())
+
+
+def test_loader_keys_can_be_cleared_before_dispatch():
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(list(keys))
+        return [key * 2 for key in keys]
+
+    async def load():
+        loader = AsyncNodeLoader(batch_load)
+        cleared = loader.load(1)
+        loader.clear(1)
+        all_cleared = loader.load(2)
+        loader.clear()
+        assert await cleared == 2
+        assert await all_cleared == 4
+        assert await loader.load(1) == 2
+
+    asyncio.get_event_loop().run_until_complete(asyncio.wait_for(load(), 1))
+    assert calls == [[1, 2], [1]]
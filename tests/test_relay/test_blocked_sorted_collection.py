@@ -0,0 +1,128 @@
+import pickle
+import random
+from operator import itemgetter
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+from pytest import raises
+
+
+def test_blocked_collection_matches_sorted_collection():
+    rng = random.Random(42)
+    flat = SortedCollection()
+    blocked = BlockedSortedCollection(load=4)
+
+    keys = list(range(500))
+    rng.shuffle(keys)
+    for k in keys:
+        flat.insert(k)
+        blocked.insert(k)
+
+    rng.shuffle(keys)
+    for k in keys[:300]:
+        flat.remove(k)
+        blocked.remove(k)
+
+    for k in keys[:100]:
+        flat.insert(k)
+        blocked.insert(k)
+
+    assert len(blocked) == len(flat) == 300
+    assert list(blocked) == list(flat)
+    assert list(reversed(blocked)) == list(reversed(flat))
+    assert blocked[0] == flat[0]
+    assert blocked[-1] == flat[-1]
+    assert blocked[10:70] == flat[10:70]
+    assert blocked[::7] == flat[::7]
+
+    for k in range(-1, 501):
+        assert blocked.bisect_left(k) == flat.bisect_left(k)
+        assert blocked.bisect_right(k) == flat.bisect_right(k)
+        assert (k in blocked) == (k in flat)
+        assert blocked.count(k) == flat.count(k)
+        if k in flat:
+            assert blocked.index(k) == flat.index(k)
+
+    for i in range(len(flat)):
+        assert blocked.key_at(i) == flat.key_at(i)
+        for j in range(i, min(i + 10, len(flat)) + 1):
+            assert blocked.slice(i, j) == flat.slice(i, j)
+
+
+def test_blocked_collection_errors():
+    collection = BlockedSortedCollection(key=itemgetter(0), load=2)
+    collection.insert((1, 'a'))
+
+    with raises(ValueError):
+        collection.insert((1, 'b'))
+
+    with raises(ValueError):
+        collection.remove((1, 'b'))
+
+    with raises(ValueError):
+        collection.index((2, 'a'))
+
+    with raises(IndexError):
+        collection[1]
+
+
+def test_blocked_collection_copy_and_pickle():
+    collection = BlockedSortedCollection(load=2)
+    for k in [5, 3, 9, 1, 7]:
+        collection.insert(k)
+
+    copied = collection.copy()
+    copied.remove(5)
+    assert list(collection) == [1, 3, 5, 7, 9]
+    assert list(copied) == [1, 3, 7, 9]
+
+    restored = pickle.loads(pickle.dumps(collection))
+    assert list(restored) == [1, 3, 5, 7, 9]
+    assert restored._load == 2
+
+    collection.clear()
+    assert len(collection) == 0
+    assert collection.bisect_left(5) == 0
+
+
+def test_blocked_collection_connections_match():
+    flat = InMemoryDataSource()
+    blocked = InMemoryDataSource(collection_class=lambda key: BlockedSortedCollection(key=key, load=2))
+
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, flat)
+
+    class Letter(R.Implements[Relay.Node]):
+        letter = R.String
+
+    class Query(R.ObjectType):
+        letters = Relay.Connection('Letter', R.Letter)
+
+    R.Schema(R.Query)
+
+    for i in range(1, 27):
+        letter = Letter(id=i, letter=chr(ord('A') + i - 1))
+        flat.add(letter)
+        blocked.add(letter)
+
+    flat_letters = flat.objects_by_type[Letter.T]
+    blocked_letters = blocked.objects_by_type[Letter.T]
+    assert isinstance(blocked_letters, BlockedSortedCollection)
+
+    def connection(collection, args):
+        result = collection.get_connection(Relay, 'Letter', args)
+        page_info = result.page_info
+        return (
+            [(edge.node.letter, edge.cursor) for edge in result.edges],
+            (page_info.start_cursor, page_info.end_cursor, page_info.has_previous_page, page_info.has_next_page)
+        )
+
+    cursors = [None] + [flat_letters.get_edge(Relay, 'Letter', letter).cursor for letter in flat_letters]
+    for after in cursors[::5]:
+        for before in cursors[::7]:
+            for first in (None, 1, 3):
+                for last in (None, 2):
+                    args = {'after': after, 'before': before, 'first': first, 'last': last}
+                    assert connection(blocked_letters, args) == connection(flat_letters, args)
@@ -0,0 +1,74 @@
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+from pytest import fixture, mark, raises
+
+R = TypeRegistry()
+Relay = R.Mixin(RelayMixin, None)
+
+
+class Pet(R.Implements[R.Node]):
+    name = R.String
+
+
+class Toy(R.Implements[R.Node]):
+    name = R.String
+
+
+class Query(R.ObjectType):
+    pets = R.Pet.List
+    toys = R.Toy.List
+
+
+Schema = R.Schema(R.Query)
+
+
+@fixture(params=[SortedCollection, BlockedSortedCollection])
+def data_source(request):
+    return InMemoryDataSource(collection_class=request.param)
+
+
+def ids(data_source, type):
+    return [obj.id for obj in data_source.objects_by_type[type.T]]
+
+
+def test_add_many_groups_and_sorts_by_type(data_source):
+    data_source.add(Pet(id=4, name='Four'))
+    data_source.add_many([Pet(id=3, name='Three'), Toy(id=2, name='Ball'), Pet(id=9, name='Nine'),
+                          Pet(id=1, name='One')])
+
+    assert ids(data_source, Pet) == [1, 3, 4, 9]
+    assert ids(data_source, Toy) == [2]
+    assert data_source.fetch_node(Pet.T, '9', None).name == 'Nine'
+    assert data_source.fetch_node(Toy.T, 2, None).name == 'Ball'
+
+
+@mark.parametrize('objs', [
+    [Pet(id=5, name='Duplicate of existing')],
+    [Pet(id=6, name='Six'), Pet(id=6, name='Six again')],
+])
+def test_add_many_rejects_duplicates(data_source, objs):
+    data_source.add(Pet(id=5, name='Five'))
+
+    with raises(ValueError):
+        data_source.add_many([Toy(id=1, name='Ball')] + objs)
+
+    assert ids(data_source, Pet) == [5]
+    assert ids(data_source, Toy) == []
+
+
+def test_replace_all(data_source):
+    data_source.add_many([Pet(id=1, name='One'), Pet(id=2, name='Two')])
+    data_source.replace_all([Pet(id=2, name='New two'), Toy(id=3, name='Ball')])
+
+    assert ids(data_source, Pet) == [2]
+    assert ids(data_source, Toy) == [3]
+    assert data_source.fetch_node(Pet.T, 1, None) is None
+    assert data_source.fetch_node(Pet.T, 2, None).name == 'New two'
+
+    with raises(ValueError):
+        data_source.replace_all([Pet(id=7, name='Seven'), Pet(id=7, name='Seven')])
+
+    assert ids(data_source, Pet) == [2]
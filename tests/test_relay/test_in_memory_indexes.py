@@ -0,0 +1,193 @@
+from functools import partial
+from graphql.core import graphql
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection, cursor
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.contrib.relay.utils import base64
+from epoxy.registry import TypeRegistry
+from pytest import fixture, mark, raises
+
+data_source = InMemoryDataSource()
+data_source.add_index('Pet', 'owner', 'owner_id')
+data_source.add_index('Pet', 'age', lambda pet: pet.age)
+
+R = TypeRegistry()
+Relay = R.Mixin(RelayMixin, data_source)
+
+
+class Pet(R.Implements[R.Node]):
+    name = R.String
+    owner_id = R.Int
+    age = R.Int
+
+
+class Query(R.ObjectType):
+    pets = Relay.Connection('Pet', R.Pet)
+    pets_by_owner = Relay.Connection(
+        'Pet', R.Pet, args={'owner_id': R.Int},
+        resolver=data_source.make_index_connection_resolver(Relay, R.Pet, 'owner', equal='owner_id')
+    )
+    pets_by_age = Relay.Connection(
+        'Pet', R.Pet, args={'min_age': R.Int, 'max_age': R.Int},
+        resolver=data_source.make_index_connection_resolver(Relay, R.Pet, 'age', low='min_age', high='max_age')
+    )
+
+
+Schema = R.Schema(R.Query)
+
+pets = [
+    Pet(id=1, name='Rex', owner_id=2, age=5),
+    Pet(id=2, name='Tom', owner_id=1, age=3),
+    Pet(id=3, name='Fluffy', owner_id=2, age=1),
+    Pet(id=4, name='Spot', owner_id=2, age=3),
+    Pet(id=5, name='Nemo', owner_id=3, age=8),
+    Pet(id=6, name='Stray', owner_id=None, age=2),
+]
+data_source.add_many(pets)
+
+
+def cursor_for(id):
+    return base64('sc:%s' % id)
+
+
+def query(field, args):
+    result = graphql(Schema, '''
+    {
+        %s%s {
+            edges { node { name } cursor }
+            pageInfo { hasPreviousPage hasNextPage }
+        }
+    }
+    ''' % (field, '(%s)' % args if args else ''))
+    assert not result.errors
+    connection = result.data[field]
+    page_info = connection['pageInfo']
+    return [edge['node']['name'] for edge in connection['edges']], page_info['hasPreviousPage'], \
+        page_info['hasNextPage']
+
+
+@mark.parametrize('args,expected', [
+    ('ownerId: 2', (['Rex', 'Fluffy', 'Spot'], False, False)),
+    ('ownerId: 2, first: 2', (['Rex', 'Fluffy'], False, True)),
+    ('ownerId: 2, last: 1', (['Spot'], True, False)),
+    ('ownerId: 2, after: "%s"' % cursor_for(1), (['Fluffy', 'Spot'], False, False)),
+    ('ownerId: 2, before: "%s"' % cursor_for(4), (['Rex', 'Fluffy'], False, False)),
+    ('ownerId: 2, after: "%s", before: "%s"' % (cursor_for(4), cursor_for(1)), ([], False, False)),
+    ('ownerId: 2, after: "invalid"', (['Rex', 'Fluffy', 'Spot'], False, False)),
+    ('ownerId: 7', ([], False, False)),
+    ('', ([], False, False)),
+])
+def test_equality_connection(args, expected):
+    assert query('petsByOwner', args) == expected
+
+
+@mark.parametrize('args,expected', [
+    ('minAge: 2, maxAge: 5', (['Stray', 'Tom', 'Spot', 'Rex'], False, False)),
+    ('minAge: 3', (['Tom', 'Spot', 'Rex', 'Nemo'], False, False)),
+    ('maxAge: 2', (['Fluffy', 'Stray'], False, False)),
+    ('', (['Fluffy', 'Stray', 'Tom', 'Spot', 'Rex', 'Nemo'], False, False)),
+    ('minAge: 3, first: 2, after: "%s"' % cursor_for(2), (['Spot', 'Rex'], False, True)),
+])
+def test_range_connection(args, expected):
+    assert query('petsByAge', args) == expected
+
+
+def test_edge_cursors_hold_index_entries():
+    result = graphql(Schema, '{ petsByOwner(ownerId: 1) { edges { cursor } } }')
+    assert result.data['petsByOwner']['edges'] == [{'cursor': cursor.from_offset((1, 2))}]
+
+    result = graphql(Schema, '{ petsByOwner(ownerId: 2, after: "%s") { edges { node { name } } } }' % (
+        cursor.from_offset((2, 1))
+    ))
+    assert result.data['petsByOwner']['edges'] == [{'node': {'name': 'Fluffy'}}, {'node': {'name': 'Spot'}}]
+
+
+@fixture(params=[SortedCollection, partial(BlockedSortedCollection, load=2)])
+def indexed_data_source(request):
+    data_source = InMemoryDataSource(collection_class=request.param)
+    data_source.add_many(pets)
+    data_source.add_index('Pet', 'owner', 'owner_id')
+    data_source.add_index('Pet', 'name', 'name', unique=True)
+    return data_source
+
+
+def names(objs):
+    return [obj.name for obj in objs]
+
+
+def connection_names(connection):
+    return names(edge.node for edge in connection.edges)
+
+
+def test_index_cursors_survive_removing_their_object(indexed_data_source):
+    resolver = indexed_data_source.make_index_connection_resolver(Relay, R.Pet, 'owner', equal='owner_id')
+    page = resolver(None, {'owner_id': 2, 'first': 2}, None)
+    assert connection_names(page) == ['Rex', 'Fluffy']
+
+    indexed_data_source.remove(pets[2])
+    after = resolver(None, {'owner_id': 2, 'first': 2, 'after': page.page_info.end_cursor}, None)
+    assert connection_names(after) == ['Spot']
+    before = resolver(None, {'owner_id': 2, 'before': page.page_info.end_cursor}, None)
+    assert connection_names(before) == ['Rex']
+
+
+def test_indexes_follow_writes(indexed_data_source):
+    assert names(indexed_data_source.fetch_by_index(Pet.T, 'owner', 2)) == ['Rex', 'Fluffy', 'Spot']
+    assert names(indexed_data_source.fetch_by_index(Pet.T, 'name', 'Nemo')) == ['Nemo']
+
+    indexed_data_source.remove(pets[0])
+    indexed_data_source.add(Pet(id=10, name='Max', owner_id=2, age=4))
+    indexed_data_source.add_many([Pet(id=11, name='Bella', owner_id=2, age=4)])
+
+    assert names(indexed_data_source.fetch_by_index(Pet.T, 'owner', 2)) == ['Fluffy', 'Spot', 'Max', 'Bella']
+    assert indexed_data_source.fetch_by_index(Pet.T, 'name', 'Rex') == []
+
+
+@mark.parametrize('write', [
+    lambda data_source: data_source.add(Pet(id=10, name='Rex', owner_id=1, age=1)),
+    lambda data_source: data_source.add_many([Pet(id=10, name='Max'), Pet(id=11, name='Max')]),
+])
+def test_unique_indexes_reject_taken_keys(indexed_data_source, write):
+    with raises(ValueError):
+        write(indexed_data_source)
+
+    assert len(indexed_data_source.objects_by_type[Pet.T]) == len(pets)
+    assert indexed_data_source.fetch_node(Pet.T, 10, None) is None
+    assert names(indexed_data_source.fetch_by_index(Pet.T, 'name', 'Rex')) == ['Rex']
+
+
+def test_adding_indexes():
+    data_source = InMemoryDataSource()
+    data_source.add_many(pets)
+
+    with raises(ValueError):
+        data_source.add_index('Pet', 'age', 'age', unique=True)
+
+    with raises(ValueError):
+        data_source.fetch_by_index(Pet.T, 'age', 3)
+
+    data_source.add_index('Pet', 'age', 'age')
+    assert names(data_source.fetch_by_index(Pet.T, 'age', 3)) == ['Tom', 'Spot']
+
+    with raises(ValueError):
+        data_source.add_index('Pet', 'age', 'age')
+
+
+def test_indexes_are_part_of_snapshots():
+    data_source = InMemoryDataSource(snapshots=True)
+    data_source.add_index('Pet', 'owner', 'owner_id')
+    data_source.add_many(pets)
+    before = data_source.snapshot()
+
+    data_source.add(Pet(id=10, name='Max', owner_id=2, age=4))
+
+    assert names(before.get_index(Pet.T, 'owner').find(2)) == ['Rex', 'Fluffy', 'Spot']
+    assert names(data_source.fetch_by_index(Pet.T, 'owner', 2)) == ['Rex', 'Fluffy', 'Spot', 'Max']
+
+
+def test_index_connection_counts():
+    result = graphql(Schema, '{ petsByAge(minAge: 3, first: 1, after: "%s") { totalCount startOffset } }' % (
+        cursor_for(2)
+    ))
+    assert result.data == {'petsByAge': {'totalCount': 4, 'startOffset': 1}}
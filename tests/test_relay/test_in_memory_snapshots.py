@@ -0,0 +1,181 @@
+import random
+import threading
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.registry import TypeRegistry
+from pytest import raises
+
+data_source = InMemoryDataSource(snapshots=True)
+R = TypeRegistry()
+Relay = R.Mixin(RelayMixin, data_source)
+
+
+class Pet(R.Implements[R.Node]):
+    name = R.String
+
+
+class Toy(R.Implements[R.Node]):
+    name = R.String
+
+
+class Query(R.ObjectType):
+    pets = Relay.Connection('Pet', R.Pet)
+
+
+Schema = R.Schema(R.Query)
+
+
+class Info(object):
+    field_asts = ()
+    fragments = {}
+
+    def __init__(self):
+        self.request_context = {}
+
+
+def make_data_source(count=0):
+    data_source = InMemoryDataSource(snapshots=True, collection_class=lambda key: BlockedSortedCollection(key, load=4))
+    data_source.add_many([Pet(id=i, name='Pet %d' % i) for i in range(count)])
+    return data_source
+
+
+def pet_ids(snapshot):
+    return [pet.id for pet in snapshot.get_collection(Pet.T)]
+
+
+def test_sorted_collection_copy_returns_copy():
+    collection = SortedCollection()
+    collection.insert(2)
+    copied = collection.copy()
+    copied.insert(1)
+    assert list(collection) == [2]
+    assert list(copied) == [1, 2]
+
+
+def test_snapshots_are_isolated_from_writes():
+    data_source = make_data_source(3)
+    before = data_source.snapshot()
+
+    data_source.add(Pet(id=10, name='Ten'))
+    data_source.remove(data_source.fetch_node(Pet.T, 0, None))
+
+    assert pet_ids(before) == [0, 1, 2]
+    assert before.get_ids(Pet.T).get('10') is None
+    assert pet_ids(data_source.snapshot()) == [1, 2, 10]
+    assert data_source.fetch_node(Pet.T, 10, None).name == 'Ten'
+    assert data_source.fetch_node(Pet.T, 0, None) is None
+
+
+def test_snapshots_share_unchanged_data():
+    data_source = make_data_source(40)
+    data_source.add(Toy(id=1, name='Ball'))
+    before = data_source.snapshot()
+
+    data_source.add(Pet(id=100, name='Hundred'))
+    after = data_source.snapshot()
+
+    assert after.get_collection(Toy.T) is before.get_collection(Toy.T)
+    assert after.get_ids(Toy.T) is before.get_ids(Toy.T)
+
+    before_blocks = before.get_collection(Pet.T)._item_blocks
+    after_blocks = after.get_collection(Pet.T)._item_blocks
+    shared = [a is b for a, b in zip(before_blocks, after_blocks)]
+    assert shared[:-1] == [True] * (len(shared) - 1)
+    assert not shared[-1]
+
+
+def test_reading_types_without_objects_leaves_snapshots_alone():
+    data_source = make_data_source(2)
+    snapshot = data_source.snapshot()
+
+    assert len(data_source.objects_by_type[Toy.T]) == 0
+    assert data_source.objects_by_type_and_id[Toy.T] == {}
+    assert Toy.T not in snapshot.objects_by_type
+    assert Toy.T not in snapshot.objects_by_type_and_id
+    assert list(data_source.objects_by_type) == [Pet.T]
+
+    with raises(TypeError):
+        data_source.objects_by_type[Toy.T] = None
+
+
+def test_batch_publishes_all_writes_at_once_or_none():
+    data_source = make_data_source(2)
+
+    with data_source.batch():
+        data_source.add(Pet(id=5, name='Five'))
+        data_source.add(Pet(id=6, name='Six'))
+        assert pet_ids(data_source.snapshot()) == [0, 1]
+
+    assert pet_ids(data_source.snapshot()) == [0, 1, 5, 6]
+
+    with raises(ValueError):
+        with data_source.batch():
+            data_source.add(Pet(id=7, name='Seven'))
+            data_source.add(Pet(id=7, name='Seven again'))
+
+    assert pet_ids(data_source.snapshot()) == [0, 1, 5, 6]
+
+    with data_source.batch():
+        data_source.replace_all([Pet(id=8, name='Eight')])
+        data_source.add(Pet(id=9, name='Nine'))
+
+    assert pet_ids(data_source.snapshot()) == [8, 9]
+
+
+def test_requests_read_from_one_snapshot():
+    data_source = make_data_source(2)
+    info = Info()
+
+    assert data_source.fetch_node(Pet.T, 1, info).name == 'Pet 1'
+    data_source.add(Pet(id=2, name='Pet 2'))
+    data_source.remove(data_source.fetch_node(Pet.T, 1, None))
+
+    assert data_source.fetch_node(Pet.T, 2, info) is None
+    assert data_source.fetch_node(Pet.T, 1, info).name == 'Pet 1'
+    assert data_source.fetch_node(Pet.T, 2, Info()).name == 'Pet 2'
+
+
+def test_reads_stay_consistent_under_concurrent_writes():
+    data_source = make_data_source(200)
+    resolve_pets = data_source.make_connection_resolver(Relay, R.Pet)
+    stop = threading.Event()
+    errors = []
+
+    def write():
+        rng = random.Random(5)
+        next_id = 200
+        while not stop.is_set():
+            with data_source.batch():
+                # Every batch keeps the number of pets the same, so readers can check that they see whole batches.
+                snapshot = data_source.snapshot()
+                data_source.remove(rng.choice(list(snapshot.get_collection(Pet.T))))
+                data_source.add(Pet(id=next_id, name='Pet %d' % next_id))
+                next_id += 1
+
+    def read():
+        try:
+            for _ in range(200):
+                info = Info()
+                pets = [edge.node for edge in resolve_pets(None, {'first': 1000}, info).edges]
+                ids = [pet.id for pet in pets]
+                assert len(ids) == 200
+                assert ids == sorted(ids)
+                assert all(data_source.fetch_node(Pet.T, id, info) is pet for id, pet in zip(ids, pets))
+
+        except Exception as e:
+            errors.append(e)
+
+    writer = threading.Thread(target=write)
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    writer.start()
+    for reader in readers:
+        reader.start()
+
+    for reader in readers:
+        reader.join()
+
+    stop.set()
+    writer.join()
+    assert not errors
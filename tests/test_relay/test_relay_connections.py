@@ -1,3 +1,4 @@
+from uuid import UUID
 from graphql.core import graphql
 from epoxy.contrib.relay import RelayMixin
 from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
@@ -166,3 +167,130 @@ def test_returns_all_elements_if_cursors_are_on_the_outside():
 
 def test_returns_no_elements_if_cursors_cross():
     check('before: "{}" after: "{}"'.format(base64('sc:%s' % 2), base64('sc:%s' % 4)), '')
+
+
+def counts(args=''):
+    result = graphql(Schema, '{ letters%s { totalCount startOffset edges { node { letter } } } }' % (
+        '(' + args + ')' if args else ''
+    ))
+    assert not result.errors
+    letters = result.data['letters']
+    return letters['totalCount'], letters['startOffset'], ''.join(edge['node']['letter'] for edge in letters['edges'])
+
+
+def test_total_count_and_start_offset():
+    assert counts() == (5, 0, 'ABCDE')
+    assert counts('first: 2, after: "{}"'.format(cursor_for('B'))) == (5, 2, 'CD')
+    assert counts('last: 2, before: "{}"'.format(cursor_for('E'))) == (5, 2, 'CD')
+    assert counts('first: 0') == (5, 0, '')
+
+
+def test_connection_counts_are_worked_out_by_resolvers():
+    connection = data_source.objects_by_type[Letter.T].get_connection(Relay, 'Letter', {'first': 2})
+    assert connection.total_count is None
+    assert connection.start_offset is None
+    assert (connection._total_count(), connection._start_offset()) == (5, 0)
+
+
+def test_total_count_is_only_worked_out_when_selected():
+    calls = []
+
+    def total_count():
+        calls.append(True)
+        return 5
+
+    def resolver(obj, args, info):
+        Connection, Edge = Relay.get_connection_and_edge_types('Letter')
+        return Connection(edges=[], page_info=Relay.PageInfo(has_previous_page=False, has_next_page=False),
+                          total_count=total_count)
+
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, None)
+
+    class Letter(R.Implements[Relay.Node]):
+        letter = R.String
+
+    class Query(R.ObjectType):
+        letters = Relay.Connection('Letter', R.Letter, resolver=resolver)
+
+    schema = R.Schema(R.Query)
+    assert graphql(schema, '{ letters { pageInfo { hasNextPage } } }').data
+    assert not calls
+    assert graphql(schema, '{ letters { totalCount } }').data == {'letters': {'totalCount': 5}}
+    assert calls == [True]
+
+
+def count_cursor_encodings(monkeypatch, query):
+    from epoxy.contrib.relay.connections import sorted_collection
+    calls = []
+    from_offset = sorted_collection.cursor.from_offset
+
+    def counting_from_offset(offset):
+        calls.append(offset)
+        return from_offset(offset)
+
+    monkeypatch.setattr(sorted_collection.cursor, 'from_offset', counting_from_offset)
+    result = graphql(Schema, query)
+    assert not result.errors
+    return result.data, len(calls)
+
+
+def test_cursors_are_only_encoded_when_selected(monkeypatch):
+    data, encoded = count_cursor_encodings(monkeypatch, '{ letters(first: 2) { edges { node { letter } } } }')
+    assert data == {'letters': {'edges': [{'node': {'letter': 'A'}}, {'node': {'letter': 'B'}}]}}
+    assert encoded == 0
+
+    data, encoded = count_cursor_encodings(monkeypatch, '{ letters(first: 2) { pageInfo { endCursor } } }')
+    assert data == {'letters': {'pageInfo': {'endCursor': cursor_for('B')}}}
+    assert encoded == 1
+
+    data, encoded = count_cursor_encodings(monkeypatch, '''
+        { letters(first: 2) { ...Edges } }
+        fragment Edges on LetterConnection { edges { ... on LetterEdge { cursor } } }
+    ''')
+    assert data == {'letters': {'edges': [{'cursor': cursor_for('A')}, {'cursor': cursor_for('B')}]}}
+    assert encoded == 2
+
+
+def test_edges_are_only_built_when_selected(monkeypatch):
+    Connection, Edge = Relay.get_connection_and_edge_types('Letter')
+    built = []
+    init = Edge.__init__
+
+    def counting_init(self, **kwargs):
+        built.append(kwargs['node'])
+        init(self, **kwargs)
+
+    monkeypatch.setattr(Edge, '__init__', counting_init)
+    result = graphql(Schema, '{ letters(first: 2) { pageInfo { hasNextPage } } }')
+    assert result.data == {'letters': {'pageInfo': {'hasNextPage': True}}}
+    assert built == []
+
+    graphql(Schema, '{ letters(first: 2) { edges { cursor } } }')
+    assert [letter.letter for letter in built] == ['A', 'B']
+
+
+def test_connections_of_uuid_keyed_objects():
+    data_source = InMemoryDataSource()
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, data_source)
+
+    class Letter(R.Implements[Relay.Node]):
+        letter = R.String
+
+    class Query(R.ObjectType):
+        letters = Relay.Connection('Letter', R.Letter)
+
+    schema = R.Schema(R.Query)
+    for i, letter in enumerate(letter_chars):
+        data_source.add(Letter(id=UUID(int=i), letter=letter))
+
+    result = graphql(schema, '{ letters(first: 1) { edges { node { letter } cursor } } }')
+    assert not result.errors
+    [edge] = result.data['letters']['edges']
+    assert edge['node'] == {'letter': 'A'}
+
+    # The cursor can't hold the key, so paging from it starts over.
+    result = graphql(schema, '{ letters(first: 2, after: "%s") { edges { node { letter } } } }' % edge['cursor'])
+    assert not result.errors
+    assert result.data['letters']['edges'] == [{'node': {'letter': 'A'}}, {'node': {'letter': 'B'}}]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from datetime import date, datetime, timedelta, tzinfo
+from decimal import Decimal
+from uuid import uuid4
+from epoxy.contrib.relay.connections.cursor import (CursorFactory, IntCursorType, KeyCursorType, StringCursorType,
+                                                    TupleCursorType)
+from epoxy.contrib.relay.utils import base64
+from pytest import mark, raises
+
+
+@mark.parametrize('cache_size', [0, 2])
+def test_int_cursors(cache_size):
+    cursor = CursorFactory('sc:', cache_size=cache_size)
+    for offset in (0, 5, -3, 2 ** 62, 5):
+        assert cursor.from_offset(offset) == base64('sc:%s' % offset)
+        assert cursor.to_offset(cursor.from_offset(offset)) == offset
+
+    assert cursor.get_offset(None, 7) == 7
+    assert cursor.get_offset('invalid', 7) == 7
+    assert cursor.get_offset(base64('sc:12'), 7) == 12
+
+
+@mark.parametrize('value', [
+    'invalid',
+    'abc',
+    'YWJj=',
+    base64('sc:12') + '\n',
+    base64('xx:12'),
+    base64('sc:12a'),
+    base64('sc:'),
+    base64('sc:1' * 30),
+    base64('sc:+12'),
+    base64('sc: 12'),
+    base64('sc:1_2'),
+    base64('sc:-'),
+    base64(u'sc:\xb2'),  # A superscript two, a digit int() doesn't read.
+    'c2M6MTI=\n',
+    'c2M6 MTI',
+    'c2M6/w==',  # 'sc:' followed by a byte that isn't valid UTF-8.
+    12,
+    None,
+])
+def test_invalid_cursors(value):
+    assert CursorFactory('sc:').to_offset(value) is None
+
+
+def test_string_cursors():
+    cursor = CursorFactory('s:', StringCursorType())
+    for value in (u'', u'abc', u'ünï:cødé'):
+        assert cursor.to_offset(cursor.from_offset(value)) == value
+
+
+def test_tuple_cursors():
+    cursor = CursorFactory('t:', TupleCursorType(StringCursorType(), IntCursorType()))
+    for value in ((u'', 1), (u'a:b', -2), (u'12:x', 30), (u'ü', 0)):
+        encoded = cursor.from_offset(value)
+        assert cursor.to_offset(encoded) == value
+
+    for text in (u'', u'1:a', u'1:a1:', u'1:a1:1x', u'1:a1:1:', u'9:a1:1', u'x:a1:1', u'1:a2:1'):
+        assert cursor.to_offset(base64(u't:' + text)) is None
+
+
+@mark.parametrize('value', [
+    0, -12, 10 ** 30, 2.5, -0.0, 1e-300, float('inf'), u'', u'a:b', u'ünï', b'\x00\xff', True, False,
+    date(2016, 2, 29), datetime(1999, 12, 31, 23, 59, 58, 123456), (), (1, u'a'), ((2.5, (u'x', True)), 3),
+])
+def test_key_cursors_round_trip(value):
+    cursor = CursorFactory('sc:', KeyCursorType())
+    loaded = cursor.to_offset(cursor.from_offset(value))
+    assert loaded == value
+    assert type(loaded) is type(value)
+
+
+def test_key_cursors_of_equal_keys_of_different_types():
+    cursor = CursorFactory('sc:', KeyCursorType())
+    values = [1, 1.0, True, (1, u'a'), (1.0, u'a'), (True, u'a'), ((1,), 0), ((1.0,), 0)]
+    for _ in range(2):
+        for value in values:
+            loaded = cursor.to_offset(cursor.from_offset(value))
+            assert loaded == value
+            assert repr(loaded) == repr(value)
+
+
+def test_key_cursors_keep_integer_cursors():
+    assert CursorFactory('sc:', KeyCursorType()).from_offset(5) == base64('sc:5')
+
+
+@mark.parametrize('text', [u'', u'x1', u'f1.', u'fnan1', u'yabc', u'b2', u't1:', u't2:s', u'd2016', u'D20161301',
+                           u'D2016013', u't1:x'])
+def test_invalid_key_cursors(text):
+    assert CursorFactory('sc:', KeyCursorType()).to_offset(base64(u'sc:' + text)) is None
+
+
+class UTC(tzinfo):
+    def utcoffset(self, dt):
+        return timedelta(0)
+
+
+@mark.parametrize('value', [None, object(), datetime(2016, 1, 1, tzinfo=UTC()), uuid4(), Decimal('1.5'), (1, uuid4())])
+def test_key_cursors_of_other_types_are_opaque(value):
+    cursor = CursorFactory('sc:', KeyCursorType())
+    assert cursor.to_offset(cursor.from_offset(value)) is None
@@ -0,0 +1,74 @@
+from graphql.core import graphql
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.contrib.relay.id_codec import Base64IDCodec, CompactIDCodec
+from epoxy.contrib.relay.utils import base64
+from epoxy.registry import TypeRegistry
+from pytest import mark, raises
+
+
+def test_base64_codec_matches_base64_helpers():
+    codec = Base64IDCodec()
+    assert codec.encode('Pet', 5) == base64('Pet:5')
+    assert codec.decode(base64('Pet:5:6')) == ('Pet', '5:6')
+
+
+@mark.parametrize('id', [0, 5, 255, 256, 2 ** 70, 'abc', 'with:colons', u'☃', -1])
+def test_compact_codec_round_trips(id):
+    codec = CompactIDCodec()
+    assert codec.decode(codec.encode('Pet', id)) == ('Pet', '%s' % id)
+
+
+def test_compact_codec_is_shorter_for_large_integer_ids():
+    id = 123456789012345
+    assert len(CompactIDCodec().encode('Pet', id)) < len(Base64IDCodec().encode('Pet', id))
+
+
+@mark.parametrize('codec', [Base64IDCodec(), CompactIDCodec()])
+def test_codec_rejects_invalid_ids(codec):
+    with raises(ValueError):
+        codec.decode('not a valid global id!')
+
+
+def test_codec_memoizes_encoded_ids():
+    codec = Base64IDCodec(cache_size=2)
+    first = codec.encode('Pet', 1)
+    assert codec.encode('Pet', 1) is first
+
+    codec.encode('Pet', 2)
+    codec.encode('Pet', 3)
+    assert len(codec._encoded) == 2
+    assert ('Pet', int, 1) not in codec._encoded
+
+
+@mark.parametrize('codec', [Base64IDCodec(), CompactIDCodec()])
+def test_codec_does_not_mix_up_equal_ids_of_different_types(codec):
+    encoded = [codec.encode('Pet', id) for id in (1, 1.0, True)]
+    assert [codec.decode(global_id) for global_id in encoded] == [('Pet', '1'), ('Pet', '1.0'), ('Pet', 'True')]
+    assert encoded == [codec.encode('Pet', id) for id in (1, 1.0, True)]
+
+
+def test_relay_mixin_uses_id_codec():
+    data_source = InMemoryDataSource()
+    codec = CompactIDCodec()
+
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, data_source, id_codec=codec)
+
+    class Pet(R.Implements[R.Node]):
+        name = R.String
+
+    class Query(R.ObjectType):
+        node = Relay.NodeField
+
+    schema = R.Schema(R.Query)
+    garfield = Pet(id=5, name='Garfield')
+    data_source.add(garfield)
+
+    global_id = codec.encode('Pet', 5)
+    assert Relay.node_id_for(garfield) == global_id
+    assert Relay._node_type_names_by_class == {Pet: 'Pet'}
+
+    result = graphql(schema, '{ node(id: "%s") { id ... on Pet { name } } }' % global_id)
+    assert not result.errors
+    assert result.data == {'node': {'id': global_id, 'name': 'Garfield'}}
@@ -67,3 +67,45 @@ def test_simple_mutation():
             'input': [1, 2, 3, 4, 5]
         }
     }
+
+
+def test_bulk_mutation_keeps_client_mutation_ids():
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, None)
+
+    class SimpleAddition(Relay.Mutation):
+        bulk = True
+
+        class Input:
+            a = R.Int
+            b = R.Int
+
+        class Output:
+            sum = R.Int
+
+        def execute_many(self, obj, inputs, info):
+            return [self.Output(sum=input.a + input.b) for input in inputs]
+
+        def execute(self, obj, input, info):
+            raise Exception('execute_many should have been used.')
+
+    class Query(R.ObjectType):
+        foo = R.String
+
+    Schema = R.Schema(R.Query, R.Mutations)
+
+    result = graphql(Schema, '''
+    mutation {
+        simpleAdditionBulk(inputs: [{a: 1, b: 2, clientMutationId: "first"}, {a: 3, b: 4}]) {
+            clientMutationId
+            sum
+        }
+    }
+    ''')
+    assert not result.errors
+    assert result.data == {
+        'simpleAdditionBulk': [
+            {'clientMutationId': 'first', 'sum': 3},
+            {'clientMutationId': None, 'sum': 7},
+        ]
+    }
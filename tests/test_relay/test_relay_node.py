@@ -89,3 +89,51 @@ def test_relay_node_field_resolver():
 
     assert not result.errors
     assert result.data == {'node': {'id': 'UGV0OjU=', 'name': 'Garfield'}}
+
+
+def test_relay_nodes_field_resolver():
+    data_source = InMemoryDataSource()
+    fetched = []
+
+    class RecordingDataSource(InMemoryDataSource):
+        def fetch_nodes(self, object_type, ids, resolve_info):
+            fetched.append((object_type.name, list(ids)))
+            return data_source.fetch_nodes(object_type, ids, resolve_info)
+
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, RecordingDataSource())
+
+    class Pet(R.Implements[R.Node]):
+        name = R.String
+
+    class Toy(R.Implements[R.Node]):
+        name = R.String
+
+    class Query(R.ObjectType):
+        nodes = Relay.NodesField
+
+    schema = R.Schema(R.Query)
+
+    data_source.add(Pet(id=5, name='Garfield'))
+    data_source.add(Pet(id=6, name='Odis'))
+    data_source.add(Toy(id=5, name='Ball'))
+
+    result = graphql(schema, '''
+    {
+        nodes(ids: ["UGV0OjY=", "VG95OjU=", "UGV0Ojc=", "UGV0OjU=", "UGV0OjY="]) {
+            id
+            ... on Pet { name }
+            ... on Toy { name }
+        }
+    }
+    ''')
+
+    assert not result.errors
+    assert result.data == {'nodes': [
+        {'id': 'UGV0OjY=', 'name': 'Odis'},
+        {'id': 'VG95OjU=', 'name': 'Ball'},
+        None,
+        {'id': 'UGV0OjU=', 'name': 'Garfield'},
+        {'id': 'UGV0OjY=', 'name': 'Odis'},
+    ]}
+    assert fetched == [('Pet', ['6', '7', '5']), ('Toy', ['5'])]
@@ -0,0 +1,124 @@
+from graphql.core import graphql
+from graphql.core.execution import Executor
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.data_source.memory import InMemoryDataSource
+from epoxy.contrib.relay.loader import BatchingExecutionMiddleware, NodeLoader
+from epoxy.contrib.relay.utils import base64
+from epoxy.registry import TypeRegistry
+from pytest import raises
+
+
+class CountingDataSource(InMemoryDataSource):
+    def __init__(self):
+        super(CountingDataSource, self).__init__()
+        self.batches = []
+
+    def fetch_nodes(self, object_type, ids, resolve_info):
+        self.batches.append((object_type.name, list(ids)))
+        return super(CountingDataSource, self).fetch_nodes(object_type, ids, resolve_info)
+
+
+def make_schema(max_batch_size=None):
+    data_source = CountingDataSource()
+    R = TypeRegistry()
+    Relay = R.Mixin(RelayMixin, data_source, max_batch_size=max_batch_size)
+
+    class Pet(R.Implements[R.Node]):
+        name = R.String
+        friend_ids = R.ID.List
+        friends = R.Pet.List
+
+        def resolve_friends(self, obj, args, info):
+            return Relay.fetch_nodes(obj.friend_ids, info)
+
+    class Toy(R.Implements[R.Node]):
+        name = R.String
+
+    class Query(R.ObjectType):
+        node = Relay.NodeField
+
+    schema = R.Schema(R.Query)
+
+    for i in range(1, 6):
+        data_source.add(Pet(id=i, name='Pet %d' % i, friend_ids=[pet_id(i % 5 + 1), pet_id(1)]))
+        data_source.add(Toy(id=i, name='Toy %d' % i))
+
+    return schema, data_source, (Pet, Toy, Query)
+
+
+def pet_id(i):
+    return base64('Pet:%s' % i)
+
+
+def toy_id(i):
+    return base64('Toy:%s' % i)
+
+
+query = '''
+{
+    a: node(id: "%s") { ... on Pet { name friends { name } } }
+    b: node(id: "%s") { ... on Pet { name } }
+    c: node(id: "%s") { ... on Toy { name } }
+    d: node(id: "%s") { ... on Pet { name } }
+    e: node(id: "%s") { id }
+}
+''' % (pet_id(1), pet_id(2), toy_id(3), pet_id(1), pet_id(9))
+
+expected = {
+    'a': {'name': 'Pet 1', 'friends': [{'name': 'Pet 2'}, {'name': 'Pet 1'}]},
+    'b': {'name': 'Pet 2'},
+    'c': {'name': 'Toy 3'},
+    'd': {'name': 'Pet 1'},
+    'e': None,
+}
+
+
+def test_node_fields_are_batched_per_type():
+    schema, data_source, types = make_schema()
+    result = Executor([BatchingExecutionMiddleware()]).execute(schema, query)
+    assert not result.errors
+    assert result.data == expected
+    assert data_source.batches == [('Pet', ['1', '2', '9']), ('Toy', ['3'])]
+
+
+def test_node_fields_respect_max_batch_size():
+    schema, data_source, types = make_schema(max_batch_size=2)
+    result = Executor([BatchingExecutionMiddleware()]).execute(schema, query)
+    assert not result.errors
+    assert result.data == expected
+    assert data_source.batches == [('Pet', ['1', '2']), ('Toy', ['3']), ('Pet', ['9'])]
+
+
+def test_node_fields_are_fetched_with_synchronous_executor():
+    schema, data_source, types = make_schema()
+    result = graphql(schema, query)
+    assert not result.errors
+    assert result.data == expected
+    # Nodes are still only fetched once per request.
+    assert data_source.batches == [('Pet', ['1']), ('Pet', ['2']), ('Toy', ['3']), ('Pet', ['9'])]
+
+
+def test_loader_dedupes_and_batches_keys():
+    calls = []
+
+    def batch_load(keys):
+        calls.append(keys)
+        return [k * 2 for k in keys]
+
+    loader = NodeLoader(batch_load, max_batch_size=2)
+    assert loader.load_many([1, 2, 1, 3]) == [2, 4, 2, 6]
+    assert loader.load(2) == 4
+    assert calls == [[1, 2], [3]]
+
+    loader.prime(4, 'primed')
+    assert loader.load(4) == 'primed'
+
+    loader.clear(1)
+    assert loader.load(1) == 2
+    assert calls == [[1, 2], [3], [1]]
+
+
+def test_loader_rejects_mismatched_batch():
+    loader = NodeLoader(lambda keys: [])
+    with raises(ValueError):
+        loader.load(1)
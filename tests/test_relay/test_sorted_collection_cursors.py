@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import pickle
+from datetime import datetime, timedelta
+from functools import partial
+from operator import attrgetter
+from epoxy.contrib.relay import RelayMixin
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.cursor import CursorFactory, StringCursorType
+from epoxy.contrib.relay.connections.sorted_collection import SortedCollection
+from epoxy.contrib.relay.utils import base64
+from epoxy.registry import TypeRegistry
+from pytest import fixture, mark
+
+R = TypeRegistry()
+Relay = R.Mixin(RelayMixin, None)
+
+
+class Item(R.Implements[R.Node]):
+    name = R.String
+    score = R.Float
+
+
+class Query(R.ObjectType):
+    items = Relay.Connection('Item', R.Item, resolver=lambda obj, args, info: None)
+
+
+Schema = R.Schema(R.Query)
+
+start = datetime(2016, 1, 1)
+items = [
+    Item(id=i, name=name, score=score)
+    for i, (name, score) in enumerate([(u'kiwi', 2.5), (u'apple', 0.5), (u'ñame', 2.5), (u'fig', -1.0), (u'date', 0.5),
+                                       (u'banana', 10.0), (u'cherry', 2.5)])
+]
+for item in items:
+    item.created = start + timedelta(hours=item.id * 7)
+    item.tag = item.name.encode('utf-8')
+
+keys = [
+    attrgetter('name'),
+    lambda item: (item.score, item.id),
+    lambda item: (item.name[0], (item.score, item.created)),
+    attrgetter('created'),
+    attrgetter('tag'),
+]
+
+
+def score_and_id(item):
+    return item.score, item.id
+
+
+@fixture(params=[SortedCollection, partial(BlockedSortedCollection, load=2)])
+def collection_class(request):
+    return request.param
+
+
+def page(collection, **args):
+    connection = collection.get_connection(Relay, 'Item', args)
+    return [edge.node for edge in connection.edges], connection.page_info
+
+
+@mark.parametrize('key', keys)
+def test_paging_through_any_key(collection_class, key):
+    collection = collection_class(key=key)
+    collection.update(items)
+    expected = sorted(items, key=key)
+
+    forwards = []
+    after = None
+    while True:
+        nodes, page_info = page(collection, first=2, after=after)
+        forwards.extend(nodes)
+        after = page_info.end_cursor
+        if not page_info.has_next_page:
+            break
+
+    backwards = []
+    before = None
+    while True:
+        nodes, page_info = page(collection, last=3, before=before)
+        backwards[:0] = nodes
+        before = page_info.start_cursor
+        if not page_info.has_previous_page:
+            break
+
+    assert forwards == backwards == expected
+
+
+def test_cursors_seek_past_removed_items(collection_class):
+    collection = collection_class(key=score_and_id)
+    collection.update(items)
+    edge = collection.get_edge(Relay, 'Item', items[2])
+    collection.remove(items[2])
+
+    nodes, page_info = page(collection, after=edge.cursor)
+    assert [item.name for item in nodes] == [u'cherry', u'banana']
+
+    nodes, page_info = page(collection, before=edge.cursor)
+    assert [item.name for item in nodes] == [u'fig', u'apple', u'date', u'kiwi']
+
+
+@mark.parametrize('cursor', [
+    base64(u'sc:sapple'),
+    base64(u'sc:f2.5'),
+    base64(u'sc:t4:f2.51:2'),
+    base64(u'sc:t4:f2.5'),
+    base64(u'sc:t4:f2.52:s2'),
+    'garbage',
+])
+def test_cursors_of_other_key_types_are_ignored(collection_class, cursor):
+    collection = collection_class(key=score_and_id)
+    collection.update(items)
+    valid = cursor in (base64(u'sc:t4:f2.51:2'), base64(u'sc:t4:f2.5'))
+    nodes, page_info = page(collection, after=cursor)
+    assert (len(nodes) < len(items)) == valid
+
+
+def test_custom_cursor_factory_and_pickling(collection_class):
+    cursor_factory = CursorFactory('name:', StringCursorType())
+    collection = collection_class(key=attrgetter('name'), cursor_factory=cursor_factory)
+    collection.update(items[:3])
+
+    edge = collection.get_edge(Relay, 'Item', items[1])
+    assert edge.cursor == base64(u'name:apple')
+    assert [item.name for item in page(collection, after=edge.cursor)[0]] == [u'kiwi', u'ñame']
+
+    restored = pickle.loads(pickle.dumps(collection))
+    assert [item.id for item in restored] == [1, 0, 2]
+    assert restored._cursor_factory.prefix == 'name:'
+    copied = collection.copy()
+    assert copied._cursor is cursor_factory
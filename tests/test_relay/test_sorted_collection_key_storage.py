@@ -0,0 +1,76 @@
+from array import array
+from functools import partial
+from epoxy.contrib.relay.connections.blocked_sorted_collection import BlockedSortedCollection
+from epoxy.contrib.relay.connections.sorted_collection import AUTO_KEY_TYPE, SortedCollection
+from pytest import mark, raises
+
+collection_classes = [SortedCollection, partial(BlockedSortedCollection, load=2)]
+
+
+def key_storage(collection):
+    if isinstance(collection, BlockedSortedCollection):
+        return collection._key_blocks[0]
+
+    return collection._keys
+
+
+@mark.parametrize('collection_class', collection_classes)
+@mark.parametrize('key_type,keys', [(int, [5, 3, 2 ** 40, -7]), (float, [0.5, -1.25, 3.0])])
+def test_typed_keys_are_stored_in_arrays(collection_class, key_type, keys):
+    collection = collection_class(key_type=key_type)
+    assert isinstance(collection._make_keys(), array)
+
+    for k in keys:
+        collection.insert(k)
+
+    assert isinstance(key_storage(collection), array)
+    assert list(collection) == sorted(keys)
+    assert [collection.key_at(i) for i in range(len(keys))] == sorted(keys)
+    assert collection.bisect_left(keys[0]) == sorted(keys).index(keys[0])
+    assert collection.bisect_right(keys[0]) == sorted(keys).index(keys[0]) + 1
+
+    with raises(ValueError):
+        collection.insert(keys[0])
+
+    collection.remove(keys[0])
+    assert keys[0] not in collection
+
+
+@mark.parametrize('collection_class', collection_classes)
+def test_auto_key_type_picks_array_and_falls_back_to_list(collection_class):
+    collection = collection_class(key_type=AUTO_KEY_TYPE)
+    collection.insert(3)
+    collection.insert(1)
+    assert isinstance(key_storage(collection), array)
+
+    collection.insert(2 ** 70)
+    assert isinstance(key_storage(collection), list)
+    assert list(collection) == [1, 3, 2 ** 70]
+
+    strings = collection_class(key_type=AUTO_KEY_TYPE)
+    strings.insert('b')
+    strings.insert('a')
+    assert isinstance(key_storage(strings), list)
+    assert list(strings) == ['a', 'b']
+
+
+def test_unsupported_key_type():
+    with raises(ValueError):
+        SortedCollection(key_type=str)
+
+
+@mark.parametrize('collection_class', collection_classes)
+def test_update_picks_key_storage(collection_class):
+    collection = collection_class(key_type=AUTO_KEY_TYPE)
+    collection.update([3, 1, 2])
+    assert isinstance(key_storage(collection), array)
+    assert list(collection) == [1, 2, 3]
+
+    collection.update([2 ** 70, 0])
+    assert isinstance(key_storage(collection), list)
+    assert list(collection) == [0, 1, 2, 3, 2 ** 70]
+
+    with raises(ValueError):
+        collection.update([4, 3])
+
+    assert list(collection) == [0, 1, 2, 3, 2 ** 70]
@@ -1,4 +1,5 @@
 from graphql.core import graphql
+from pytest import raises
 
 from epoxy.registry import TypeRegistry
 
@@ -107,3 +108,89 @@ def test_object_type_can_override_interface_resolver():
     result = graphql(schema, '{ dog { makeNoise } }')
     assert not result.errors
     assert result.data == {'dog': {'makeNoise': 'Woof woof! Bark bark!'}}
+
+
+def test_resolves_fields_from_dict_sources():
+    R = TypeRegistry()
+
+    class Dog(R.ObjectType):
+        _field_source = 'key'
+
+        name = R.String
+        favorite_toy = R.String
+
+    class Query(R.ObjectType):
+        dog = R.Dog
+
+        def resolve_dog(self, *args):
+            return {'name': 'Clifford', 'favorite_toy': 'Bone'}
+
+    R.Dog.CanBe(dict)
+    schema = R.Schema(R.Query)
+    result = graphql(schema, '{ dog { name favoriteToy } }')
+    assert not result.errors
+    assert result.data == {'dog': {'name': 'Clifford', 'favoriteToy': 'Bone'}}
+
+
+def test_resolves_fields_from_plain_attributes():
+    R = TypeRegistry()
+
+    class Dog(R.ObjectType):
+        _field_source = 'attribute'
+
+        name = R.String
+        bark = R.String(args={
+            'loud_bark': R.Boolean
+        })
+
+    class Query(R.ObjectType):
+        dog = R.Dog
+
+        def resolve_dog(self, *args):
+            return Dog(name='Clifford', bark='Woof')
+
+    schema = R.Schema(R.Query)
+    result = graphql(schema, '{ dog { name bark(loudBark: true) } }')
+    assert not result.errors
+    assert result.data == {'dog': {'name': 'Clifford', 'bark': 'Woof'}}
+    assert Dog.T.get_fields()['name'].resolver.__name__ == 'resolve_name'
+
+
+def test_resolves_fields_by_calling_methods():
+    R = TypeRegistry()
+
+    class Dog(object):
+        def name(self):
+            return 'Clifford'
+
+    class DogType(R.ObjectType):
+        _name = 'Dog'
+        _field_source = 'method'
+
+        name = R.String
+
+    class Query(R.ObjectType):
+        dog = R.Dog
+
+        def resolve_dog(self, *args):
+            return Dog()
+
+    R.Dog.CanBe(Dog)
+    schema = R.Schema(R.Query)
+    result = graphql(schema, '{ dog { name } }')
+    assert not result.errors
+    assert result.data == {'dog': {'name': 'Clifford'}}
+
+
+def test_unknown_field_source_raises():
+    R = TypeRegistry()
+
+    class Dog(R.ObjectType):
+        _field_source = 'telepathy'
+
+        name = R.String
+
+    with raises(ValueError) as excinfo:
+        Dog.T.get_fields()
+
+    assert str(excinfo.value) == "Unknown field source 'telepathy', expected one of: 'attribute', 'key', 'method'."
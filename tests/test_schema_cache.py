@@ -0,0 +1,214 @@
+import sys
+from graphql.core import graphql
+from epoxy.registry import TypeRegistry
+from epoxy.schema_cache import SchemaCache, UnsupportedSchemaError, deserialize_schema, serialize_schema
+from pytest import raises
+
+schema_module_source = '''
+from enum import Enum
+from epoxy import TypeRegistry
+from epoxy.memoize import pure
+
+R = TypeRegistry()
+
+
+@R
+class Episode(Enum):
+    NEWHOPE = 4
+    EMPIRE = 5
+
+
+class Character(R.Interface):
+    id = R.ID.NonNull
+    name = R.String
+    appears_in = R.Episode.List
+
+
+class Human(R.Implements.Character):
+    home_planet = R.String
+
+
+class Droid(R.Implements.Character):
+    primary_function = R.String
+
+
+class Query(R.ObjectType):
+    hero = R.Character(args={
+        'episode': R.Episode,
+        'name_prefix': R.String(default_value='')
+    })
+
+    def resolve_hero(self, obj, args, info):
+        if args.get('episode') == 5:
+            return Human(id='1000', name=args['name_prefix'] + 'Luke', appears_in=[4, 5], home_planet='Tatooine')
+
+        return Droid(id='2001', name=args['name_prefix'] + 'R2-D2', appears_in=[4], primary_function='Astromech')
+
+    greeting = R.String(args={'name': R.String})
+
+    @pure
+    def resolve_greeting(self, obj, args, info):
+        return 'Hello ' + args['name']
+
+
+Schema = R.Schema(R.Query)
+'''
+
+query = '''
+{
+    empire: hero(episode: EMPIRE, namePrefix: "Commander ") {
+        __typename
+        id
+        name
+        appearsIn
+        ... on Human { homePlanet }
+    }
+    hero {
+        __typename
+        name
+        ... on Droid { primaryFunction }
+    }
+    greeting(name: "Luke")
+}
+'''
+
+expected = {
+    'empire': {
+        '__typename': 'Human',
+        'id': '1000',
+        'name': 'Commander Luke',
+        'appearsIn': ['NEWHOPE', 'EMPIRE'],
+        'homePlanet': 'Tatooine'
+    },
+    'hero': {'__typename': 'Droid', 'name': 'R2-D2', 'primaryFunction': 'Astromech'},
+    'greeting': 'Hello Luke',
+}
+
+
+PetR = TypeRegistry()
+
+
+class Pet(PetR.Interface):
+    name = PetR.String
+
+
+class Dog(PetR.Implements.Pet):
+    bark = PetR.String
+
+
+class PetInput(PetR.InputType):
+    name = PetR.String.NonNull
+    legs = PetR.Int(default_value=4)
+
+
+class PetQuery(PetR.ObjectType):
+    pets = PetR.Pet.List(args={'filter': PetR.PetInput})
+
+
+PetSchema = PetR.Schema(PetR.PetQuery)
+
+
+def make_cache(tmpdir, monkeypatch, module_name='cached_schema_module'):
+    tmpdir.join(module_name + '.py').write(schema_module_source)
+    monkeypatch.syspath_prepend(str(tmpdir))
+    return SchemaCache(str(tmpdir.join('schema.cache')), modules=[module_name])
+
+
+def build(module_name='cached_schema_module'):
+    __import__(module_name)
+    return sys.modules[module_name].Schema
+
+
+def test_schema_cache_round_trips_schema(tmpdir, monkeypatch):
+    cache = make_cache(tmpdir, monkeypatch)
+    try:
+        assert cache.load() is None
+        built = cache.get_or_build(build)
+        assert graphql(built, query).data == expected
+
+        sys.modules.pop('cached_schema_module')
+        loaded = cache.get_or_build(lambda: None)
+        assert loaded is not built
+        # Loading the cache doesn't import the module that declared the schema, only resolving does.
+        assert 'cached_schema_module' not in sys.modules
+
+        result = graphql(loaded, query)
+        assert not result.errors
+        assert result.data == expected
+        # Importing the module for its resolvers hands its registry the loaded schema, rather than building it again.
+        module = sys.modules['cached_schema_module']
+        assert module.Schema is loaded
+        assert module.Droid._field_attr_map is not None
+        assert module.Query._field_attr_map is None
+
+        assert graphql(loaded, query).data == expected
+        assert set(loaded.get_type_map()) == set(built.get_type_map())
+
+    finally:
+        sys.modules.pop('cached_schema_module', None)
+
+
+def test_schema_cache_is_invalidated_when_source_changes(tmpdir, monkeypatch):
+    cache = make_cache(tmpdir, monkeypatch)
+    try:
+        key = cache.key()
+        cache.dump(build(), key)
+        assert cache.load(key) is not None
+
+        tmpdir.join('cached_schema_module.py').write(schema_module_source + '\n# Changed.\n')
+        assert cache.key() != key
+        assert cache.load() is None
+
+    finally:
+        sys.modules.pop('cached_schema_module', None)
+
+
+def test_schema_cache_ignores_corrupt_cache(tmpdir, monkeypatch):
+    cache = make_cache(tmpdir, monkeypatch)
+    tmpdir.join('schema.cache').write('not a cache')
+    assert cache.load() is None
+
+
+def test_serializing_unsupported_resolver_fails():
+    R = TypeRegistry()
+
+    class Query(R.ObjectType):
+        a = R.Int(resolver=lambda obj, args, info: 1)
+
+    with raises(UnsupportedSchemaError):
+        serialize_schema(R.Schema(R.Query))
+
+
+def test_serializing_resolver_found_elsewhere_by_its_path_fails():
+    def resolver(obj, args, info):
+        return 1
+
+    # As `wraps` would leave it when wrapping `build`.
+    resolver.__module__, resolver.__qualname__ = build.__module__, 'build'
+    R = TypeRegistry()
+
+    class Query(R.ObjectType):
+        a = R.Int(resolver=resolver)
+
+    with raises(UnsupportedSchemaError):
+        serialize_schema(R.Schema(R.Query))
+
+
+def test_schema_cache_does_not_cache_unsupported_schema(tmpdir, monkeypatch):
+    R = TypeRegistry()
+
+    class Query(R.ObjectType):
+        a = R.Int
+
+        def resolve_a(self, obj, args, info):
+            return 1
+
+    schema = R.Schema(R.Query)
+    cache = make_cache(tmpdir, monkeypatch)
+    assert cache.get_or_build(lambda: schema) is schema
+    assert not tmpdir.join('schema.cache').check()
+
+
+def test_deserialized_schema_serializes_the_same():
+    data = serialize_schema(PetSchema)
+    assert serialize_schema(deserialize_schema(data)) == data